@@ -4,6 +4,10 @@ import numpy as np
 import sys
 
 
+# Below this amount of query point/triangle pairs, testing all pairs is faster than a point-location grid
+GRID_MIN_PAIRS = 20_000
+
+
 def compute_barycentric(query_vertex, triangle):
     """Computes barycentric coordinates
 
@@ -42,6 +46,161 @@ def compute_barycentric(query_vertex, triangle):
     return (point_0_weight, point_1_weight, point_2_weight), is_inside_triangle
 
 
+def compute_barycentric_batch(query_vertices, triangles):
+    """Computes the barycentric coordinates of multiple query-vertices w.r.t. multiple triangles at once
+
+    Vectorized variant of `compute_barycentric`, which yields the same results for every pair of query-vertex and
+    triangle. The leading dimensions of both arrays are broadcast against each other, e.g. query-vertices of shape
+    (n_queries, 1, 2) and triangles of shape (n_triangles, 3, 2) yield the coordinates of all pairs.
+
+    Parameters
+    ----------
+    query_vertices: np.ndarray
+        Array of shape (..., 2) that contains query-vertices in cartesian coordinates
+    triangles: np.ndarray
+        Array of shape (..., 3, 2) that depicts triangles in cartesian coordinates
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        An array of shape (..., 3) that contains the barycentric coordinates for the vertices of the triangles and an
+        array of shape (...) that tells whether the query-vertices are within the triangles.
+    """
+    v0 = triangles[..., 2, :] - triangles[..., 0, :]
+    v1 = triangles[..., 1, :] - triangles[..., 0, :]
+    v2 = query_vertices - triangles[..., 0, :]
+
+    dot00 = v0[..., 0] * v0[..., 0] + v0[..., 1] * v0[..., 1]
+    dot01 = v0[..., 0] * v1[..., 0] + v0[..., 1] * v1[..., 1]
+    dot02 = v0[..., 0] * v2[..., 0] + v0[..., 1] * v2[..., 1]
+    dot11 = v1[..., 0] * v1[..., 0] + v1[..., 1] * v1[..., 1]
+    dot12 = v1[..., 0] * v2[..., 0] + v1[..., 1] * v2[..., 1]
+
+    denominator = dot00 * dot11 - dot01 * dot01
+    denominator = np.where(denominator == 0, denominator + sys.float_info.min, denominator)
+    point_2_weight = (dot11 * dot02 - dot01 * dot12) / denominator
+    point_1_weight = (dot00 * dot12 - dot01 * dot02) / denominator
+    point_0_weight = 1 - point_2_weight - point_1_weight
+
+    is_inside_triangle = (point_2_weight > 0) & (point_1_weight > 0) & (point_2_weight + point_1_weight <= 1)
+
+    return np.stack([point_0_weight, point_1_weight, point_2_weight], axis=-1), is_inside_triangle
+
+
+class TriangleGrid:
+    def __init__(self, triangles, cell_size=None):
+        """Uniform grid over the cartesian coordinates of the triangles captured by a GPC-system.
+
+        Each triangle is registered in all grid cells that overlap its (slightly enlarged) bounding box. A query point
+        can only lie within triangles whose bounding boxes contain it, such that only the triangles within the cell of
+        the query point need to be tested. The cells are stored in CSR-style: the triangles of cell `c` are given by
+        `cell_triangles[cell_indptr[c]:cell_indptr[c + 1]]` in ascending order.
+
+        (Nearly) degenerate triangles yield arbitrary barycentric coordinates (see `compute_barycentric`) and may thus
+        "contain" points far off their bounding boxes. They are tested for every query point.
+
+        Parameters
+        ----------
+        triangles: np.ndarray
+            3D-array of shape (n_triangles, 3, 2) that contains the triangles in cartesian coordinates.
+        cell_size: float
+            The side length of a grid cell. Defaults to the mean bounding box size of the triangles.
+        """
+        self.triangles = triangles
+        v0, v1 = triangles[:, 2] - triangles[:, 0], triangles[:, 1] - triangles[:, 0]
+        dot00, dot11 = (v0 * v0).sum(axis=-1), (v1 * v1).sum(axis=-1)
+        denominator = dot00 * dot11 - (v0 * v1).sum(axis=-1) ** 2
+        regular = np.isfinite(triangles).all(axis=(1, 2)) & (denominator > 1e-6 * dot00 * dot11)
+        self.degenerate_triangles = np.where(~regular)[0]
+        regular_ids = np.where(regular)[0]
+
+        # Enlarge bounding boxes to account for rounding errors in the barycentric coordinates
+        bbox_min, bbox_max = triangles[regular].min(axis=1), triangles[regular].max(axis=1)
+        padding = 1e-6 * ((bbox_max - bbox_min).max(axis=-1) + np.abs(triangles[regular]).max(axis=(1, 2)))
+        bbox_min, bbox_max = bbox_min - padding[:, None], bbox_max + padding[:, None]
+        if cell_size is None:
+            cell_size = (bbox_max - bbox_min).max(axis=-1).mean() if regular_ids.shape[0] else 1.
+        self.cell_size = cell_size if np.isfinite(cell_size) and cell_size > 0 else 1.
+        self.origin = bbox_min.min(axis=0) if regular_ids.shape[0] else np.zeros((2,))
+
+        # Covered cells of each triangle
+        cells_min, cells_max = self._cell_coordinates(bbox_min), self._cell_coordinates(bbox_max)
+        self.shape = cells_max.max(axis=0, initial=0) + 1
+        extents = cells_max - cells_min + 1
+        n_cells = extents[:, 0] * extents[:, 1]
+        local_ids = np.repeat(np.arange(regular_ids.shape[0]), n_cells)
+        local_cells = np.arange(local_ids.shape[0]) - np.repeat(np.cumsum(n_cells) - n_cells, n_cells)
+        cell_x = cells_min[local_ids, 0] + local_cells // extents[local_ids, 1]
+        cell_y = cells_min[local_ids, 1] + local_cells % extents[local_ids, 1]
+        cell_ids = cell_x * self.shape[1] + cell_y
+        triangle_ids = regular_ids[local_ids]
+
+        # Triangles are ordered by their cell and, within a cell, by their index
+        order = np.lexsort((triangle_ids, cell_ids))
+        self.cell_triangles = triangle_ids[order]
+        self.cell_indptr = np.zeros((self.shape[0] * self.shape[1] + 1,), dtype=np.int64)
+        np.cumsum(np.bincount(cell_ids, minlength=self.shape[0] * self.shape[1]), out=self.cell_indptr[1:])
+
+    def _cell_coordinates(self, points):
+        return np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+
+    def get_candidates(self, query_points):
+        """Returns the triangles which may contain the query points
+
+        Parameters
+        ----------
+        query_points: np.ndarray
+            2D-array of shape (n_queries, 2) containing query points in cartesian coordinates
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            Pairs of query point indices and triangle indices, sorted by the query point and then by the triangle.
+        """
+        cells = self._cell_coordinates(query_points)
+        inside = (cells >= 0).all(axis=-1) & (cells < self.shape).all(axis=-1)
+        cell_ids = np.where(inside, cells[:, 0] * self.shape[1] + cells[:, 1], 0)
+        starts = self.cell_indptr[cell_ids]
+        counts = np.where(inside, self.cell_indptr[cell_ids + 1] - starts, 0)
+        point_ids = np.repeat(np.arange(query_points.shape[0]), counts)
+        positions = np.arange(point_ids.shape[0]) - np.repeat(np.cumsum(counts) - counts, counts) + starts[point_ids]
+        triangle_ids = self.cell_triangles[positions]
+        if self.degenerate_triangles.shape[0]:
+            point_ids = np.concatenate(
+                [point_ids, np.repeat(np.arange(query_points.shape[0]), self.degenerate_triangles.shape[0])]
+            )
+            triangle_ids = np.concatenate([triangle_ids, np.tile(self.degenerate_triangles, query_points.shape[0])])
+            order = np.lexsort((triangle_ids, point_ids))
+            point_ids, triangle_ids = point_ids[order], triangle_ids[order]
+        return point_ids, triangle_ids
+
+    def locate(self, query_points):
+        """Determines the first triangle that contains each query point
+
+        Parameters
+        ----------
+        query_points: np.ndarray
+            2D-array of shape (n_queries, 2) containing query points in cartesian coordinates
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            The index of the first triangle that contains each query point (-1 if there is none) and the barycentric
+            coordinates of the query points w.r.t. these triangles (zero if there is none).
+        """
+        point_ids, triangle_ids = self.get_candidates(query_points)
+        b_coordinates, lies_within = compute_barycentric_batch(query_points[point_ids], self.triangles[triangle_ids])
+        point_ids, triangle_ids = point_ids[lies_within], triangle_ids[lies_within]
+        b_coordinates = b_coordinates[lies_within]
+        # Candidates are sorted by the triangle index, hence the first occurrence of a point is its first triangle
+        found, first_candidates = np.unique(point_ids, return_index=True)
+        triangles = np.full((query_points.shape[0],), -1, dtype=np.int64)
+        barycentric_coordinates = np.zeros((query_points.shape[0], 3))
+        triangles[found] = triangle_ids[first_candidates]
+        barycentric_coordinates[found] = b_coordinates[first_candidates]
+        return triangles, barycentric_coordinates
+
+
 def interpolation(query_point, gpc_triangles, gpc_triangles_node_indices):
     """Interpolates a query point within a GPC-system
 
@@ -69,6 +228,43 @@ def interpolation(query_point, gpc_triangles, gpc_triangles_node_indices):
     return np.array([0., 0., 0.]), np.array([0, 0, 0])
 
 
+def interpolation_batch(query_points, gpc_triangles, gpc_triangles_node_indices):
+    """Interpolates multiple query points within a GPC-system at once
+
+    Vectorized variant of `interpolation`. For large GPC-systems, the triangles which may contain a query point are
+    looked up in a `TriangleGrid`. Small GPC-systems test every query point against all triangles. In both cases, the
+    first triangle that contains the query point is selected, just as in `interpolation`.
+
+    Parameters
+    ----------
+    query_points: np.ndarray
+        2D-array of shape (n_queries, 2) containing query points in cartesian coordinates
+    gpc_triangles: np.ndarray
+        The triangles contained in the GPC-system
+    gpc_triangles_node_indices: np.ndarray
+        The indices of the triangles contained in the GPC-system
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray):
+        2D-arrays of shape (n_queries, 3) containing the barycentric coordinates and the indices of the vertices to
+        which they belong. Both are zero for query points that do not fall into any triangle.
+    """
+    node_indices = np.zeros((query_points.shape[0], 3), dtype=np.int64)
+    if gpc_triangles.shape[0] == 0:
+        return np.zeros((query_points.shape[0], 3)), node_indices
+    if query_points.shape[0] * gpc_triangles.shape[0] < GRID_MIN_PAIRS:
+        b_coordinates, lies_within = compute_barycentric_batch(query_points[:, None], gpc_triangles[None])
+        found = lies_within.any(axis=-1)
+        triangles = np.argmax(lies_within, axis=-1)
+        barycentric_coordinates = np.where(found[:, None], b_coordinates[np.arange(triangles.shape[0]), triangles], 0.)
+    else:
+        triangles, barycentric_coordinates = TriangleGrid(gpc_triangles).locate(query_points)
+        found = triangles != -1
+    node_indices[found] = gpc_triangles_node_indices[triangles[found]]
+    return barycentric_coordinates, node_indices
+
+
 def polar_to_cart(angles, scales=1.):
     """Returns x and y for a given angle.
 
@@ -124,21 +320,33 @@ def create_template_matrix(n_radial, n_angular, radius, in_cart=False):
     return coordinates
 
 
-def compute_barycentric_coordinates(gpc_systems, n_radial=2, n_angular=4, radius=0.05):
+def compute_barycentric_coordinates(gpc_systems,
+                                    n_radial=2,
+                                    n_angular=4,
+                                    radius=0.05,
+                                    gpc_system_indices=None,
+                                    dtype=np.float64):
     """Compute the barycentric coordinates for the given GPC-systems
 
     Parameters
     ----------
     gpc_systems: GPCSystemGroup
-        The GPC-system-group for the underlying mesh
+        The GPC-system-group for the underlying mesh. Its GPC-systems may be stored as `GPCSystem`-objects or as
+        `PackedGPCSystems`.
     n_radial: int
         The amount of radial coordinates of the template you wish to use
     n_angular: int
         The amount of angular coordinates of the template you wish to use
     radius: float
         The radius of the template of the template you wish to use
-    verbose: bool
-        Whether to print progress on terminal
+    gpc_system_indices: np.ndarray
+        If given, the barycentric coordinates are only computed for the GPC-systems with these indices (e.g. the
+        GPC-systems returned by `GPCSystemGroup.update`). The a-th entry of the result then belongs to the GPC-system
+        `gpc_system_indices[a]`.
+    dtype: np.dtype
+        The floating point type of the returned array. With `np.float32`, the array takes half the memory and vertex
+        indices are stored exactly for meshes with up to 2^24 vertices. The layers cast barycentric coordinates into
+        `np.float32` anyway.
 
     Returns
     -------
@@ -156,20 +364,65 @@ def compute_barycentric_coordinates(gpc_systems, n_radial=2, n_angular=4, radius
 
     # Define template vertices at which interpolation values will be needed
     template_matrix = create_template_matrix(n_radial=n_radial, n_angular=n_angular, radius=radius, in_cart=True)
-    n_gpc_systems = gpc_systems.object_mesh_gpc_systems.shape[0]
-    barycentric_coordinates = np.zeros((n_gpc_systems, n_radial, n_angular, 3, 2))
+    if gpc_system_indices is None:
+        gpc_system_indices = np.arange(len(gpc_systems.object_mesh_gpc_systems))
+    n_gpc_systems = len(gpc_system_indices)
+    check_index_precision(len(gpc_systems.object_mesh_gpc_systems), dtype)
+    barycentric_coordinates = np.zeros((n_gpc_systems, n_radial, n_angular, 3, 2), dtype=dtype)
 
     for gpc_system_idx in tqdm(range(n_gpc_systems), postfix=f"Computing barycentric coordinates"):
-        gpc_system = gpc_systems.object_mesh_gpc_systems[gpc_system_idx]
-        gpc_triangles = gpc_system.get_gpc_triangles(in_cart=True)
-        for radial_coordinate in range(n_radial):
-            for angular_coordinate in range(n_angular):
-                bc, indices = interpolation(
-                    template_matrix[radial_coordinate, angular_coordinate],
-                    gpc_triangles,
-                    gpc_system.faces[(-1, -1)]
-                )
-                barycentric_coordinates[gpc_system_idx, radial_coordinate, angular_coordinate, :, 0] = indices
-                barycentric_coordinates[gpc_system_idx, radial_coordinate, angular_coordinate, :, 1] = bc
+        gpc_system = gpc_systems.object_mesh_gpc_systems[gpc_system_indices[gpc_system_idx]]
+        barycentric_coordinates[gpc_system_idx] = compute_gpc_system_barycentric_coordinates(
+            gpc_system, template_matrix, dtype=dtype
+        )
+
+    return barycentric_coordinates
 
+
+def check_index_precision(n_vertices, dtype):
+    """Checks whether all vertex indices of a mesh can be stored exactly in a floating point type
+
+    Parameters
+    ----------
+    n_vertices: int
+        The amount of vertices in the mesh.
+    dtype: np.dtype
+        The floating point type of the barycentric coordinates.
+    """
+    max_exact_integer = 2 ** (np.finfo(dtype).nmant + 1)
+    if n_vertices > max_exact_integer:
+        raise RuntimeError(
+            f"The indices of a mesh with {n_vertices} vertices cannot be stored exactly in '{np.dtype(dtype).name}'. "
+            f"Use a floating point type with higher precision."
+        )
+
+
+def compute_gpc_system_barycentric_coordinates(gpc_system, template_matrix, dtype=np.float64):
+    """Compute the barycentric coordinates of the template vertices within one GPC-system
+
+    Parameters
+    ----------
+    gpc_system: [GPCSystem, PackedGPCSystem]
+        The GPC-system.
+    template_matrix: np.ndarray
+        The template matrix in cartesian coordinates (see `create_template_matrix`).
+    dtype: np.dtype
+        The floating point type of the returned array.
+
+    Returns
+    -------
+    np.ndarray:
+        A 4D-array B with B[b, c, :, 0] containing the indices and B[b, c, :, 1] containing the barycentric coordinates
+        of the nodes that construct the triangle containing the template vertex (b, c).
+    """
+    n_radial, n_angular = template_matrix.shape[:2]
+    barycentric_coordinates = np.zeros((n_radial, n_angular, 3, 2), dtype=dtype)
+    # Barycentric coordinates are always computed in double precision
+    gpc_triangles = gpc_system.get_gpc_triangles(in_cart=True).astype(np.float64, copy=False)
+    # All template vertices are interpolated at once
+    bc, indices = interpolation_batch(
+        template_matrix.reshape((-1, 2)), gpc_triangles, np.asarray(gpc_system.faces[(-1, -1)])
+    )
+    barycentric_coordinates[..., 0] = indices.reshape((n_radial, n_angular, 3))
+    barycentric_coordinates[..., 1] = bc.reshape((n_radial, n_angular, 3))
     return barycentric_coordinates
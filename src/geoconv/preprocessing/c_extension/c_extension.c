@@ -2,7 +2,10 @@
 #define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
 
 #include <Python.h>
+#include <float.h>
 #include <math.h>
+#include <stdlib.h>
+#include <string.h>
 #include "numpy/arrayobject.h"
 #include "cblas.h"
 
@@ -43,40 +46,37 @@ double compute_angle_360(double vector_1[], double vector_2[], double rotation_a
 }
 
 
-void compute_dist_and_dir(double vertex_i[],
-                          double vertex_j[],
-                          double vertex_k[],
-                          double u_j,
-                          double u_k,
-                          double theta_j,
-                          double theta_k,
-                          double rotation_axis[],
-                          double *result)
+/*
+ * Euclidean update of vertex i given the edge vectors of the triangle (i, j, k) and their lengths.
+ *
+ * The edge vectors, their lengths and the sine of the angle of the triangle at i can be taken from the half-edge
+ * slots of 'MeshGeometry'. The arguments are not altered.
+ */
+void compute_corner_dist_and_dir(const double vertex_i[],
+                                 const double vertex_j[],
+                                 const double vertex_k[],
+                                 const double edge_j[],
+                                 double e_j_norm,
+                                 const double edge_k[],
+                                 double e_k_norm,
+                                 const double e_kj[],
+                                 double e_kj_sqnrm,
+                                 double corner_sine,
+                                 double u_j,
+                                 double u_k,
+                                 double theta_j,
+                                 double theta_k,
+                                 double *result)
 {
-    double e_j[3];
-    cblas_dcopy(3, vertex_j, 1, e_j, 1);
-    cblas_daxpy(3, -1.0, vertex_i, 1, e_j, 1);
-    double e_j_norm = cblas_dnrm2(3, e_j, 1);
-
-    double e_k[3];
-    cblas_dcopy(3, vertex_k, 1, e_k, 1);
-    cblas_daxpy(3, -1.0, vertex_i, 1, e_k, 1);
-    double e_k_norm = cblas_dnrm2(3, e_k, 1);
-
-    double e_kj[3];
-    cblas_dcopy(3, vertex_k, 1, e_kj, 1);
-    cblas_daxpy(3, -1.0, vertex_j, 1, e_kj, 1);
-    double e_kj_sqnrm = cblas_ddot(3, e_kj, 1, e_kj, 1);
-
-    double A = e_j_norm * e_k_norm * sin(compute_angle(e_j, e_k));
+    double A = e_j_norm * e_k_norm * corner_sine;
     double radicand = (e_kj_sqnrm - pow(u_j - u_k, 2)) * (pow(u_j + u_k, 2) - e_kj_sqnrm);
 
     double u_ijk;
     double theta_i;
     if(radicand <= 0)
     {
-        double j = u_j + cblas_dnrm2(3, e_j, 1);
-        double k = u_k + cblas_dnrm2(3, e_k, 1);
+        double j = u_j + e_j_norm;
+        double k = u_k + e_k_norm;
         if(j <= k)
         {
             u_ijk = j;
@@ -89,11 +89,11 @@ void compute_dist_and_dir(double vertex_i[],
         double H = sqrt(radicand);
         double u_j_sq = pow(u_j, 2);
         double u_k_sq = pow(u_k, 2);
-        double x_j = A * (e_kj_sqnrm + u_k_sq - u_j_sq) + cblas_ddot(3, e_k, 1, e_kj, 1) * H;
-        double x_k = A * (e_kj_sqnrm + u_j_sq - u_k_sq) - cblas_ddot(3, e_j, 1, e_kj, 1) * H;
+        double x_j = A * (e_kj_sqnrm + u_k_sq - u_j_sq) + cblas_ddot(3, edge_k, 1, e_kj, 1) * H;
+        double x_k = A * (e_kj_sqnrm + u_j_sq - u_k_sq) - cblas_ddot(3, edge_j, 1, e_kj, 1) * H;
         if (x_j < 0 || x_k < 0) {
-            double j = u_j + cblas_dnrm2(3, e_j, 1);
-            double k = u_k + cblas_dnrm2(3, e_k, 1);
+            double j = u_j + e_j_norm;
+            double k = u_k + e_k_norm;
             if(j <= k)
             {
                 u_ijk = j;
@@ -107,6 +107,9 @@ void compute_dist_and_dir(double vertex_i[],
             double denominator = 2 * A * e_kj_sqnrm;
             x_j /= denominator;
             x_k /= denominator;
+            double e_j[3], e_k[3];
+            cblas_dcopy(3, edge_j, 1, e_j, 1);
+            cblas_dcopy(3, edge_k, 1, e_k, 1);
             cblas_dscal(3, x_j, e_j, 1);
             cblas_dscal(3, x_k, e_k, 1);
 
@@ -120,12 +123,16 @@ void compute_dist_and_dir(double vertex_i[],
             cblas_dcopy(3, result_vector, 1, s, 1);
             cblas_daxpy(3, 1.0, vertex_i, 1, s, 1);
 
-            cblas_daxpy(3, -1.0, s, 1, vertex_k, 1);
-            cblas_daxpy(3, -1.0, s, 1, vertex_j, 1);
-            cblas_daxpy(3, -1.0, s, 1, vertex_i, 1);
+            double s_k[3], s_j[3], s_i[3];
+            cblas_dcopy(3, vertex_k, 1, s_k, 1);
+            cblas_dcopy(3, vertex_j, 1, s_j, 1);
+            cblas_dcopy(3, vertex_i, 1, s_i, 1);
+            cblas_daxpy(3, -1.0, s, 1, s_k, 1);
+            cblas_daxpy(3, -1.0, s, 1, s_j, 1);
+            cblas_daxpy(3, -1.0, s, 1, s_i, 1);
 
-            double phi_kj = compute_angle(vertex_k, vertex_j);
-            double phi_ij = compute_angle(vertex_i, vertex_j);
+            double phi_kj = compute_angle(s_k, s_j);
+            double phi_ij = compute_angle(s_i, s_j);
             double alpha = phi_ij / phi_kj;
 
             if (theta_k <= theta_j) {
@@ -144,6 +151,129 @@ void compute_dist_and_dir(double vertex_i[],
     result[1] = theta_i;
 }
 
+
+void compute_dist_and_dir(double vertex_i[],
+                          double vertex_j[],
+                          double vertex_k[],
+                          double u_j,
+                          double u_k,
+                          double theta_j,
+                          double theta_k,
+                          double rotation_axis[],
+                          double *result)
+{
+    double e_j[3];
+    cblas_dcopy(3, vertex_j, 1, e_j, 1);
+    cblas_daxpy(3, -1.0, vertex_i, 1, e_j, 1);
+    double e_j_norm = cblas_dnrm2(3, e_j, 1);
+
+    double e_k[3];
+    cblas_dcopy(3, vertex_k, 1, e_k, 1);
+    cblas_daxpy(3, -1.0, vertex_i, 1, e_k, 1);
+    double e_k_norm = cblas_dnrm2(3, e_k, 1);
+
+    double e_kj[3];
+    cblas_dcopy(3, vertex_k, 1, e_kj, 1);
+    cblas_daxpy(3, -1.0, vertex_j, 1, e_kj, 1);
+    double e_kj_sqnrm = cblas_ddot(3, e_kj, 1, e_kj, 1);
+
+    compute_corner_dist_and_dir(
+        vertex_i,
+        vertex_j,
+        vertex_k,
+        e_j,
+        e_j_norm,
+        e_k,
+        e_k_norm,
+        e_kj,
+        e_kj_sqnrm,
+        sin(compute_angle(e_j, e_k)),
+        u_j,
+        u_k,
+        theta_j,
+        theta_k,
+        result
+    );
+}
+
+
+/*
+ * Per-slot geometry of the half-edges and triangle corners of a mesh (see 'MeshTopology' and 'MeshGeometry').
+ */
+typedef struct {
+    long n_vertices;
+    long max_edge_faces;
+    const double *vertices;
+    const npy_int64 *adjacency_indptr;
+    const npy_int64 *adjacency_indices;
+    const npy_int64 *opposite_vertices;
+    const npy_int64 *adjacent_slots;
+    const npy_int64 *opposite_slots;
+    const double *half_edge_vectors;
+    const double *half_edge_lengths;
+    const double *half_edge_squared_lengths;
+    const double *corner_sines;
+} HalfEdgeGeometry;
+
+
+static long find_slot(const HalfEdgeGeometry *geometry, long vertex_a, long vertex_b)
+{
+    for (npy_int64 idx = geometry->adjacency_indptr[vertex_a]; idx < geometry->adjacency_indptr[vertex_a + 1]; idx++) {
+        if (geometry->adjacency_indices[idx] == vertex_b) {
+            return (long)idx;
+        }
+    }
+    return -1;
+}
+
+
+static long find_corner(const HalfEdgeGeometry *geometry, long slot, long vertex_k)
+{
+    for (long corner = slot * geometry->max_edge_faces; corner < (slot + 1) * geometry->max_edge_faces; corner++) {
+        if (geometry->opposite_vertices[corner] == vertex_k) {
+            return corner;
+        }
+    }
+    return -1;
+}
+
+
+/*
+ * 'compute_dist_and_dir' for the triangle whose corner at vertex i is given by a half-edge slot and a corner index.
+ */
+static void compute_cached_dist_and_dir(const HalfEdgeGeometry *geometry,
+                                        long vertex_i,
+                                        long vertex_j,
+                                        long vertex_k,
+                                        long slot,
+                                        long corner,
+                                        double u_j,
+                                        double u_k,
+                                        double theta_j,
+                                        double theta_k,
+                                        double *result)
+{
+    long slot_k = (long)geometry->adjacent_slots[corner];
+    long slot_kj = (long)geometry->opposite_slots[corner];
+    compute_corner_dist_and_dir(
+        geometry->vertices + 3 * vertex_i,
+        geometry->vertices + 3 * vertex_j,
+        geometry->vertices + 3 * vertex_k,
+        geometry->half_edge_vectors + 3 * slot,
+        geometry->half_edge_lengths[slot],
+        geometry->half_edge_vectors + 3 * slot_k,
+        geometry->half_edge_lengths[slot_k],
+        geometry->half_edge_vectors + 3 * slot_kj,
+        geometry->half_edge_squared_lengths[slot_kj],
+        geometry->corner_sines[corner],
+        u_j,
+        u_k,
+        theta_j,
+        theta_k,
+        result
+    );
+}
+
 static PyObject *compute_dist_and_dir_wrapper(PyObject *self, PyObject *args) {
 
     // Parse numpy array
@@ -262,10 +392,1508 @@ static PyObject *compute_angle_360_wrapper(PyObject *self, PyObject *args) {
     return PyFloat_FromDouble(angle);
 }
 
+static PyArrayObject *as_typed_array(PyObject *object, int type, int n_dims, npy_intp n_rows, npy_intp n_columns)
+{
+    // Returns a contiguous array of shape (n_rows,) or (n_rows, n_columns) or NULL with a set exception. Negative
+    // sizes are not checked.
+    PyArrayObject *array = (PyArrayObject *)PyArray_FROM_OTF(object, type, NPY_ARRAY_IN_ARRAY);
+    if (array == NULL) {
+        return NULL;
+    }
+    if (PyArray_NDIM(array) != n_dims
+        || (n_rows >= 0 && PyArray_DIM(array, 0) != n_rows)
+        || (n_dims == 2 && n_columns >= 0 && PyArray_DIM(array, 1) != n_columns)) {
+        PyErr_SetString(PyExc_ValueError, "Arrays have inconsistent shapes!");
+        Py_DECREF(array);
+        return NULL;
+    }
+    return array;
+}
+
+
+static PyArrayObject *as_double_array(PyObject *object, int n_dims, npy_intp n_rows, npy_intp n_columns)
+{
+    return as_typed_array(object, NPY_DOUBLE, n_dims, n_rows, n_columns);
+}
+
+
+static int check_result_array(PyArrayObject *result, int n_dims, npy_intp n_columns)
+{
+    if (PyArray_NDIM(result) != n_dims
+        || PyArray_TYPE(result) != NPY_DOUBLE
+        || !PyArray_IS_C_CONTIGUOUS(result)
+        || !PyArray_ISWRITEABLE(result)
+        || (n_dims == 2 && PyArray_DIM(result, 1) != n_columns)) {
+        PyErr_SetString(PyExc_ValueError, "Result array must be a writeable, contiguous array of type numpy.float64!");
+        return -1;
+    }
+    return 0;
+}
+
+
+static PyObject *compute_angle_360_batch_wrapper(PyObject *self, PyObject *args) {
+    PyArrayObject *result_numpy;
+    PyObject *objects[3];
+
+    if(!PyArg_ParseTuple(args, "O!OOO", &PyArray_Type, &result_numpy, &objects[0], &objects[1], &objects[2])) {
+        return NULL;
+    }
+    if (check_result_array(result_numpy, 1, 0) < 0) {
+        return NULL;
+    }
+    npy_intp n = PyArray_DIM(result_numpy, 0);
+
+    // vectors_1, vectors_2 and rotation_axis
+    PyArrayObject *arrays[3] = {NULL};
+    arrays[0] = as_double_array(objects[0], 2, n, 3);
+    arrays[1] = arrays[0] == NULL ? NULL : as_double_array(objects[1], 2, n, 3);
+    arrays[2] = arrays[1] == NULL ? NULL : as_double_array(objects[2], 1, 3, 0);
+    if (arrays[2] == NULL) {
+        Py_XDECREF(arrays[0]);
+        Py_XDECREF(arrays[1]);
+        return NULL;
+    }
+
+    const double *vectors_1 = (const double *)PyArray_DATA(arrays[0]);
+    const double *vectors_2 = (const double *)PyArray_DATA(arrays[1]);
+    double *result = (double *)PyArray_DATA(result_numpy);
+    double rotation_axis[3], vector_1[3], vector_2[3];
+    memcpy(rotation_axis, PyArray_DATA(arrays[2]), 3 * sizeof(double));
+    Py_BEGIN_ALLOW_THREADS
+    for (npy_intp row = 0; row < n; row++) {
+        memcpy(vector_1, vectors_1 + 3 * row, 3 * sizeof(double));
+        memcpy(vector_2, vectors_2 + 3 * row, 3 * sizeof(double));
+        result[row] = compute_angle_360(vector_1, vector_2, rotation_axis);
+    }
+    Py_END_ALLOW_THREADS
+
+    for (int i = 0; i < 3; i++) {
+        Py_DECREF(arrays[i]);
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+
+static PyObject *compute_dist_and_dir_batch_wrapper(PyObject *self, PyObject *args) {
+    PyArrayObject *result_numpy;
+    PyObject *objects[8];
+
+    if(!PyArg_ParseTuple(args,
+                         "O!OOOOOOOO",
+                         &PyArray_Type,
+                         &result_numpy,
+                         &objects[0],
+                         &objects[1],
+                         &objects[2],
+                         &objects[3],
+                         &objects[4],
+                         &objects[5],
+                         &objects[6],
+                         &objects[7])) {
+        return NULL;
+    }
+    if (check_result_array(result_numpy, 2, 2) < 0) {
+        return NULL;
+    }
+    npy_intp n = PyArray_DIM(result_numpy, 0);
+
+    // vertices_i, vertices_j, vertices_k, u_j, u_k, theta_j, theta_k and rotation_axis
+    int n_dims[] = {2, 2, 2, 1, 1, 1, 1, 1};
+    PyArrayObject *arrays[8] = {NULL};
+    for (int i = 0; i < 8; i++) {
+        arrays[i] = as_double_array(objects[i], n_dims[i], i < 7 ? n : 3, 3);
+        if (arrays[i] == NULL) {
+            for (int j = 0; j < i; j++) {
+                Py_DECREF(arrays[j]);
+            }
+            return NULL;
+        }
+    }
+
+    const double *vertices_i = (const double *)PyArray_DATA(arrays[0]);
+    const double *vertices_j = (const double *)PyArray_DATA(arrays[1]);
+    const double *vertices_k = (const double *)PyArray_DATA(arrays[2]);
+    const double *u_j = (const double *)PyArray_DATA(arrays[3]);
+    const double *u_k = (const double *)PyArray_DATA(arrays[4]);
+    const double *theta_j = (const double *)PyArray_DATA(arrays[5]);
+    const double *theta_k = (const double *)PyArray_DATA(arrays[6]);
+    double *result = (double *)PyArray_DATA(result_numpy);
+    double rotation_axis[3], vertex_i[3], vertex_j[3], vertex_k[3];
+    memcpy(rotation_axis, PyArray_DATA(arrays[7]), 3 * sizeof(double));
+    Py_BEGIN_ALLOW_THREADS
+    for (npy_intp row = 0; row < n; row++) {
+        // `compute_dist_and_dir` alters its vertex arguments, hence copy them
+        memcpy(vertex_i, vertices_i + 3 * row, 3 * sizeof(double));
+        memcpy(vertex_j, vertices_j + 3 * row, 3 * sizeof(double));
+        memcpy(vertex_k, vertices_k + 3 * row, 3 * sizeof(double));
+        compute_dist_and_dir(
+            vertex_i, vertex_j, vertex_k, u_j[row], u_k[row], theta_j[row], theta_k[row], rotation_axis, result + 2 * row
+        );
+    }
+    Py_END_ALLOW_THREADS
+
+    for (int i = 0; i < 8; i++) {
+        Py_DECREF(arrays[i]);
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+
+static PyObject *compute_half_edge_geometry_wrapper(PyObject *self, PyObject *args) {
+    PyArrayObject *results_numpy[4];
+    PyObject *objects[2];
+
+    if(!PyArg_ParseTuple(args,
+                         "O!O!O!O!OO",
+                         &PyArray_Type,
+                         &results_numpy[0],
+                         &PyArray_Type,
+                         &results_numpy[1],
+                         &PyArray_Type,
+                         &results_numpy[2],
+                         &PyArray_Type,
+                         &results_numpy[3],
+                         &objects[0],
+                         &objects[1])) {
+        return NULL;
+    }
+
+    // half_edge_vectors and adjacent_slots
+    PyArrayObject *half_edge_vectors_numpy = as_double_array(objects[0], 2, -1, 3);
+    if (half_edge_vectors_numpy == NULL) {
+        return NULL;
+    }
+    npy_intp n_slots = PyArray_DIM(half_edge_vectors_numpy, 0);
+    PyArrayObject *adjacent_slots_numpy = as_typed_array(objects[1], NPY_INT64, 2, n_slots, -1);
+    if (adjacent_slots_numpy == NULL) {
+        Py_DECREF(half_edge_vectors_numpy);
+        return NULL;
+    }
+    npy_intp max_edge_faces = PyArray_DIM(adjacent_slots_numpy, 1);
+
+    // half_edge_lengths, half_edge_squared_lengths, corner_angles and corner_sines
+    for (int i = 0; i < 4; i++) {
+        if (check_result_array(results_numpy[i], i < 2 ? 1 : 2, max_edge_faces) < 0
+            || PyArray_DIM(results_numpy[i], 0) != n_slots) {
+            if (!PyErr_Occurred()) {
+                PyErr_SetString(PyExc_ValueError, "Arrays have inconsistent shapes!");
+            }
+            Py_DECREF(half_edge_vectors_numpy);
+            Py_DECREF(adjacent_slots_numpy);
+            return NULL;
+        }
+    }
+
+    const double *half_edge_vectors = (const double *)PyArray_DATA(half_edge_vectors_numpy);
+    const npy_int64 *adjacent_slots = (const npy_int64 *)PyArray_DATA(adjacent_slots_numpy);
+    double *half_edge_lengths = (double *)PyArray_DATA(results_numpy[0]);
+    double *half_edge_squared_lengths = (double *)PyArray_DATA(results_numpy[1]);
+    double *corner_angles = (double *)PyArray_DATA(results_numpy[2]);
+    double *corner_sines = (double *)PyArray_DATA(results_numpy[3]);
+    int valid = 1;
+    Py_BEGIN_ALLOW_THREADS
+    // Computed like the edges in 'compute_dist_and_dir'. Cached and non-cached updates coincide up to rounding
+    // errors, since BLAS-kernels may round differently depending on the memory alignment of their inputs.
+    for (npy_intp slot = 0; slot < n_slots; slot++) {
+        const double *e_j = half_edge_vectors + 3 * slot;
+        half_edge_lengths[slot] = cblas_dnrm2(3, e_j, 1);
+        half_edge_squared_lengths[slot] = cblas_ddot(3, e_j, 1, e_j, 1);
+    }
+    for (npy_intp corner = 0; corner < n_slots * max_edge_faces; corner++) {
+        npy_int64 slot_k = adjacent_slots[corner];
+        if (slot_k < 0) {
+            corner_angles[corner] = NAN;
+            corner_sines[corner] = NAN;
+        } else if (slot_k >= n_slots) {
+            valid = 0;
+            break;
+        } else {
+            double e_j[3], e_k[3];
+            memcpy(e_j, half_edge_vectors + 3 * (corner / max_edge_faces), 3 * sizeof(double));
+            memcpy(e_k, half_edge_vectors + 3 * slot_k, 3 * sizeof(double));
+            corner_angles[corner] = compute_angle(e_j, e_k);
+            corner_sines[corner] = sin(corner_angles[corner]);
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(half_edge_vectors_numpy);
+    Py_DECREF(adjacent_slots_numpy);
+    if (!valid) {
+        PyErr_SetString(PyExc_ValueError, "Adjacent slots are out of bounds!");
+        return NULL;
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+
+static int init_half_edge_geometry(HalfEdgeGeometry *geometry, PyArrayObject **arrays, PyObject **objects)
+{
+    // Translates vertices, adjacency_indptr, adjacency_indices, opposite_vertices, adjacent_slots, opposite_slots,
+    // half_edge_vectors, half_edge_lengths, half_edge_squared_lengths and corner_sines into contiguous numpy arrays.
+    // Returns -1 with a set exception if they do not describe the same mesh.
+    arrays[0] = as_double_array(objects[0], 2, -1, 3);
+    if (arrays[0] == NULL) {
+        return -1;
+    }
+    npy_intp n_vertices = PyArray_DIM(arrays[0], 0);
+    arrays[1] = as_typed_array(objects[1], NPY_INT64, 1, n_vertices + 1, 0);
+    arrays[2] = arrays[1] == NULL ? NULL : as_typed_array(objects[2], NPY_INT64, 1, -1, 0);
+    npy_intp n_slots = arrays[2] == NULL ? 0 : PyArray_DIM(arrays[2], 0);
+    arrays[3] = arrays[2] == NULL ? NULL : as_typed_array(objects[3], NPY_INT64, 2, n_slots, -1);
+    npy_intp max_edge_faces = arrays[3] == NULL ? 0 : PyArray_DIM(arrays[3], 1);
+    int types[] = {NPY_INT64, NPY_INT64, NPY_DOUBLE, NPY_DOUBLE, NPY_DOUBLE, NPY_DOUBLE};
+    int n_dims[] = {2, 2, 2, 1, 1, 2};
+    npy_intp n_columns[] = {max_edge_faces, max_edge_faces, 3, 0, 0, max_edge_faces};
+    for (int i = 4; i < 10; i++) {
+        arrays[i] = arrays[i - 1] == NULL
+            ? NULL : as_typed_array(objects[i], types[i - 4], n_dims[i - 4], n_slots, n_columns[i - 4]);
+    }
+    if (arrays[9] == NULL) {
+        for (int i = 0; i < 10; i++) {
+            Py_XDECREF(arrays[i]);
+        }
+        return -1;
+    }
+
+    geometry->n_vertices = (long)n_vertices;
+    geometry->max_edge_faces = (long)max_edge_faces;
+    geometry->vertices = (const double *)PyArray_DATA(arrays[0]);
+    geometry->adjacency_indptr = (const npy_int64 *)PyArray_DATA(arrays[1]);
+    geometry->adjacency_indices = (const npy_int64 *)PyArray_DATA(arrays[2]);
+    geometry->opposite_vertices = (const npy_int64 *)PyArray_DATA(arrays[3]);
+    geometry->adjacent_slots = (const npy_int64 *)PyArray_DATA(arrays[4]);
+    geometry->opposite_slots = (const npy_int64 *)PyArray_DATA(arrays[5]);
+    geometry->half_edge_vectors = (const double *)PyArray_DATA(arrays[6]);
+    geometry->half_edge_lengths = (const double *)PyArray_DATA(arrays[7]);
+    geometry->half_edge_squared_lengths = (const double *)PyArray_DATA(arrays[8]);
+    geometry->corner_sines = (const double *)PyArray_DATA(arrays[9]);
+    return 0;
+}
+
+
+static PyObject *compute_cached_dist_and_dir_batch_wrapper(PyObject *self, PyObject *args) {
+    PyArrayObject *result_numpy;
+    PyObject *objects[15];
+
+    if(!PyArg_ParseTuple(args,
+                         "O!OOOOOOOOOOOOOOO",
+                         &PyArray_Type,
+                         &result_numpy,
+                         &objects[0],
+                         &objects[1],
+                         &objects[2],
+                         &objects[3],
+                         &objects[4],
+                         &objects[5],
+                         &objects[6],
+                         &objects[7],
+                         &objects[8],
+                         &objects[9],
+                         &objects[10],
+                         &objects[11],
+                         &objects[12],
+                         &objects[13],
+                         &objects[14])) {
+        return NULL;
+    }
+    if (check_result_array(result_numpy, 2, 2) < 0) {
+        return NULL;
+    }
+    npy_intp n = PyArray_DIM(result_numpy, 0);
+
+    // Mesh arrays (see 'init_half_edge_geometry')
+    HalfEdgeGeometry geometry;
+    PyArrayObject *geometry_arrays[10] = {NULL};
+    if (init_half_edge_geometry(&geometry, geometry_arrays, objects + 5) < 0) {
+        return NULL;
+    }
+
+    // vertices_i, vertices_j, vertices_k, u and theta
+    PyArrayObject *arrays[5] = {NULL};
+    for (int i = 0; i < 5; i++) {
+        arrays[i] = as_typed_array(objects[i], i < 3 ? NPY_INT64 : NPY_DOUBLE, 1, i < 3 ? n : geometry.n_vertices, 0);
+        if (arrays[i] == NULL) {
+            for (int j = 0; j < i; j++) {
+                Py_DECREF(arrays[j]);
+            }
+            for (int j = 0; j < 10; j++) {
+                Py_DECREF(geometry_arrays[j]);
+            }
+            return NULL;
+        }
+    }
+
+    const npy_int64 *vertices_i = (const npy_int64 *)PyArray_DATA(arrays[0]);
+    const npy_int64 *vertices_j = (const npy_int64 *)PyArray_DATA(arrays[1]);
+    const npy_int64 *vertices_k = (const npy_int64 *)PyArray_DATA(arrays[2]);
+    const double *u = (const double *)PyArray_DATA(arrays[3]);
+    const double *theta = (const double *)PyArray_DATA(arrays[4]);
+    double *result = (double *)PyArray_DATA(result_numpy);
+    int valid = 1;
+    Py_BEGIN_ALLOW_THREADS
+    for (npy_intp row = 0; row < n; row++) {
+        long vertex_i = (long)vertices_i[row], vertex_j = (long)vertices_j[row], vertex_k = (long)vertices_k[row];
+        if (vertex_i < 0 || vertex_i >= geometry.n_vertices
+            || vertex_j < 0 || vertex_j >= geometry.n_vertices
+            || vertex_k < 0 || vertex_k >= geometry.n_vertices) {
+            valid = 0;
+            break;
+        }
+        long slot = find_slot(&geometry, vertex_i, vertex_j);
+        long corner = slot < 0 ? -1 : find_corner(&geometry, slot, vertex_k);
+        if (corner < 0) {
+            valid = 0;
+            break;
+        }
+        compute_cached_dist_and_dir(
+            &geometry,
+            vertex_i,
+            vertex_j,
+            vertex_k,
+            slot,
+            corner,
+            u[vertex_j],
+            u[vertex_k],
+            theta[vertex_j],
+            theta[vertex_k],
+            result + 2 * row
+        );
+    }
+    Py_END_ALLOW_THREADS
+
+    for (int i = 0; i < 5; i++) {
+        Py_DECREF(arrays[i]);
+    }
+    for (int i = 0; i < 10; i++) {
+        Py_DECREF(geometry_arrays[i]);
+    }
+    if (!valid) {
+        PyErr_SetString(PyExc_ValueError, "Vertices do not form triangles of the mesh!");
+        return NULL;
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+
+/*
+ * Whole-system GPC engine
+ *
+ * Implements the algorithm of:
+ * > [Geodesic polar coordinates on polygonal meshes]
+ *   (https://onlinelibrary.wiley.com/doi/full/10.1111/j.1467-8659.2012.03187.x)
+ * > Melvær, Eivind Lyche, and Martin Reimers.
+ *
+ * The engine mirrors 'GPCSystemGroup.compute_gpc_system', 'GPCSystem' and 'compute_distance_and_angle', which
+ * remain the reference implementation. Mesh connectivity is given by the arrays of 'MeshTopology' and the geometry
+ * of the triangle corners by the arrays of 'MeshGeometry'.
+ */
+
+#define MAX_GRID_SIZE 128
+
+typedef struct {
+    double dist;
+    long vertex;
+} HeapEntry;
+
+typedef struct {
+    // Mesh
+    long n_vertices;
+    long n_edges;
+    long n_faces;
+    const double *vertices;
+    double rotation_axis[3];
+    const npy_int64 *adjacency_indptr;
+    const npy_int64 *adjacency_indices;
+    const npy_int64 *adjacency_edges;
+    const npy_int64 *edge_faces_indptr;
+    const npy_int64 *edge_faces_indices;
+    const npy_int64 *faces;
+
+    // Corner geometry per half-edge slot (see 'MeshGeometry')
+    long max_edge_faces;
+    const double *half_edge_lengths;
+    const double *half_edge_squared_lengths;
+    const npy_int64 *opposite_vertices;
+    const npy_int64 *adjacent_slots;
+    const npy_int64 *opposite_slots;
+    const double *half_edge_vectors;
+    const double *corner_sines;
+
+    // GPC-system
+    double *radial_coordinates;
+    double *angular_coordinates;
+    double *x_coordinates;
+    double *y_coordinates;
+
+    // Edge-cache: captured edges and per-vertex linked lists of edge-rows
+    char *edge_captured;
+    npy_int64 *gpc_edges;
+    long n_gpc_edges;
+    long gpc_edges_capacity;
+    long *vertex_edge_head;
+    long *vertex_link_next;
+    long *vertex_link_row;
+    long n_vertex_links;
+
+    // Face-cache: captured faces and per-edge linked lists of face-rows
+    long *face_row;
+    npy_int64 *gpc_faces;
+    long n_gpc_faces;
+    long gpc_faces_capacity;
+    long *edge_face_head;
+    long *edge_face_tail;
+    long *edge_link_next;
+    long *edge_link_row;
+    long n_edge_links;
+
+    // Uniform grid over the cartesian edge coordinates (cells contain linked lists of edge-rows)
+    long grid_size;
+    double grid_origin;
+    double cell_size;
+    long *cell_head;
+    long *grid_link_next;
+    long *grid_link_row;
+    long n_grid_links;
+    long grid_links_capacity;
+    long *query_stamp;
+    long n_queries;
+
+    // Min-heap over radial distances
+    HeapEntry *heap;
+    long heap_size;
+    long heap_capacity;
+
+    // Vertices with finite radial coordinates and the third vertices of the faces of an edge
+    long *reached_vertices;
+    long n_reached_vertices;
+    long *k_vertices;
+    long k_vertices_capacity;
+
+    // Errors are recorded here, as the engine runs without holding the GIL
+    int out_of_memory;
+    char error[128];
+
+    // Set while a thread computes a GPC-system with the buffers of the engine
+    int in_use;
+} GPCEngine;
+
+
+static int grow(void **buffer, long *capacity, long required, size_t item_size)
+{
+    if (required <= *capacity) {
+        return 0;
+    }
+    long new_capacity = *capacity > 0 ? *capacity : 64;
+    while (new_capacity < required) {
+        new_capacity *= 2;
+    }
+    void *new_buffer = realloc(*buffer, new_capacity * item_size);
+    if (new_buffer == NULL) {
+        return -1;
+    }
+    *buffer = new_buffer;
+    *capacity = new_capacity;
+    return 0;
+}
+
+
+static int heap_less(HeapEntry a, HeapEntry b)
+{
+    // Equals the tuple-comparison of '(distance, vertex)' in 'heapq'
+    return a.dist < b.dist || (a.dist == b.dist && a.vertex < b.vertex);
+}
+
+
+static int heap_push(GPCEngine *engine, double dist, long vertex)
+{
+    if (grow((void **)&engine->heap, &engine->heap_capacity, engine->heap_size + 1, sizeof(HeapEntry)) < 0) {
+        return -1;
+    }
+    long pos = engine->heap_size++;
+    HeapEntry entry = {dist, vertex};
+    while (pos > 0) {
+        long parent = (pos - 1) / 2;
+        if (!heap_less(entry, engine->heap[parent])) {
+            break;
+        }
+        engine->heap[pos] = engine->heap[parent];
+        pos = parent;
+    }
+    engine->heap[pos] = entry;
+    return 0;
+}
+
+
+static HeapEntry heap_pop(GPCEngine *engine)
+{
+    HeapEntry top = engine->heap[0];
+    HeapEntry last = engine->heap[--engine->heap_size];
+    long pos = 0;
+    while (1) {
+        long child = 2 * pos + 1;
+        if (child >= engine->heap_size) {
+            break;
+        }
+        if (child + 1 < engine->heap_size && heap_less(engine->heap[child + 1], engine->heap[child])) {
+            child++;
+        }
+        if (!heap_less(engine->heap[child], last)) {
+            break;
+        }
+        engine->heap[pos] = engine->heap[child];
+        pos = child;
+    }
+    if (engine->heap_size > 0) {
+        engine->heap[pos] = last;
+    }
+    return top;
+}
+
+
+static long slot_index(GPCEngine *engine, long vertex_a, long vertex_b)
+{
+    for (npy_int64 idx = engine->adjacency_indptr[vertex_a]; idx < engine->adjacency_indptr[vertex_a + 1]; idx++) {
+        if (engine->adjacency_indices[idx] == vertex_b) {
+            return (long)idx;
+        }
+    }
+    return -1;
+}
+
+
+static long edge_index(GPCEngine *engine, long vertex_a, long vertex_b)
+{
+    long slot = slot_index(engine, vertex_a, vertex_b);
+    return slot < 0 ? -1 : (long)engine->adjacency_edges[slot];
+}
+
+
+static long face_index(GPCEngine *engine, const long face[3])
+{
+    long edge = edge_index(engine, face[0], face[1]);
+    if (edge < 0) {
+        return -1;
+    }
+    for (npy_int64 idx = engine->edge_faces_indptr[edge]; idx < engine->edge_faces_indptr[edge + 1]; idx++) {
+        const npy_int64 *mesh_face = engine->faces + 3 * engine->edge_faces_indices[idx];
+        if (mesh_face[0] == face[2] || mesh_face[1] == face[2] || mesh_face[2] == face[2]) {
+            return (long)engine->edge_faces_indices[idx];
+        }
+    }
+    return -1;
+}
+
+
+static void sort_face(long face[3])
+{
+    long tmp;
+    if (face[0] > face[1]) { tmp = face[0]; face[0] = face[1]; face[1] = tmp; }
+    if (face[1] > face[2]) { tmp = face[1]; face[1] = face[2]; face[2] = tmp; }
+    if (face[0] > face[1]) { tmp = face[0]; face[0] = face[1]; face[1] = tmp; }
+}
+
+
+static long cell_coordinate(GPCEngine *engine, double coordinate)
+{
+    long cell = (long)floor((coordinate - engine->grid_origin) / engine->cell_size);
+    if (cell < 0) {
+        return 0;
+    }
+    return cell < engine->grid_size ? cell : engine->grid_size - 1;
+}
+
+
+static int register_edge(GPCEngine *engine, long row)
+{
+    // Insert the edge into all cells covered by its bounding box. Outdated entries of moved edges remain in their
+    // previous cells. They only cause superfluous (but still exact) intersection tests.
+    long vertex_a = (long)engine->gpc_edges[2 * row];
+    long vertex_b = (long)engine->gpc_edges[2 * row + 1];
+    double x_a = engine->x_coordinates[vertex_a], y_a = engine->y_coordinates[vertex_a];
+    double x_b = engine->x_coordinates[vertex_b], y_b = engine->y_coordinates[vertex_b];
+    if (!(isfinite(x_a) && isfinite(y_a) && isfinite(x_b) && isfinite(y_b))) {
+        return 0;
+    }
+    long cx_min = cell_coordinate(engine, fmin(x_a, x_b)), cx_max = cell_coordinate(engine, fmax(x_a, x_b));
+    long cy_min = cell_coordinate(engine, fmin(y_a, y_b)), cy_max = cell_coordinate(engine, fmax(y_a, y_b));
+    long n_links = engine->n_grid_links + (cx_max - cx_min + 1) * (cy_max - cy_min + 1);
+    if (n_links > engine->grid_links_capacity) {
+        long capacity = engine->grid_links_capacity > 0 ? engine->grid_links_capacity : 64;
+        while (capacity < n_links) {
+            capacity *= 2;
+        }
+        long *grid_link_next = realloc(engine->grid_link_next, capacity * sizeof(long));
+        if (grid_link_next == NULL) {
+            return -1;
+        }
+        engine->grid_link_next = grid_link_next;
+        long *grid_link_row = realloc(engine->grid_link_row, capacity * sizeof(long));
+        if (grid_link_row == NULL) {
+            return -1;
+        }
+        engine->grid_link_row = grid_link_row;
+        engine->grid_links_capacity = capacity;
+    }
+    for (long cx = cx_min; cx <= cx_max; cx++) {
+        for (long cy = cy_min; cy <= cy_max; cy++) {
+            long cell = cx * engine->grid_size + cy;
+            long link = engine->n_grid_links++;
+            engine->grid_link_row[link] = row;
+            engine->grid_link_next[link] = engine->cell_head[cell];
+            engine->cell_head[cell] = link;
+        }
+    }
+    return 0;
+}
+
+
+static int add_edge(GPCEngine *engine, long vertex_a, long vertex_b)
+{
+    if (isinf(engine->x_coordinates[vertex_a]) || isinf(engine->x_coordinates[vertex_b])) {
+        snprintf(engine->error, sizeof(engine->error), "Edge [%ld, %ld] lacks GPC.", vertex_a, vertex_b);
+        return -1;
+    }
+    long edge = edge_index(engine, vertex_a, vertex_b);
+    if (edge < 0) {
+        snprintf(engine->error, sizeof(engine->error), "Edge [%ld, %ld] is not contained in the mesh.", vertex_a, vertex_b);
+        return -1;
+    }
+    if (engine->edge_captured[edge]) {
+        return 0;
+    }
+
+    long row = engine->n_gpc_edges;
+    if (grow((void **)&engine->gpc_edges, &engine->gpc_edges_capacity, 2 * (row + 1), sizeof(npy_int64)) < 0) {
+        engine->out_of_memory = 1;
+        return -1;
+    }
+    engine->edge_captured[edge] = 1;
+    engine->gpc_edges[2 * row] = vertex_a < vertex_b ? vertex_a : vertex_b;
+    engine->gpc_edges[2 * row + 1] = vertex_a < vertex_b ? vertex_b : vertex_a;
+    engine->n_gpc_edges++;
+
+    // Remember edge for both of its vertices
+    long vertices[2] = {vertex_a, vertex_b};
+    for (int v = 0; v < 2; v++) {
+        long link = engine->n_vertex_links++;
+        engine->vertex_link_row[link] = row;
+        engine->vertex_link_next[link] = engine->vertex_edge_head[vertices[v]];
+        engine->vertex_edge_head[vertices[v]] = link;
+    }
+    if (register_edge(engine, row) < 0) {
+        engine->out_of_memory = 1;
+        return -1;
+    }
+    return 0;
+}
+
+
+static int segment_intersects_row(GPCEngine *engine, long row, double x1, double y1, double x2, double y2)
+{
+    const double eps = 1e-5;
+    long vertex_3 = (long)engine->gpc_edges[2 * row];
+        long vertex_4 = (long)engine->gpc_edges[2 * row + 1];
+    double x3 = engine->x_coordinates[vertex_3], y3 = engine->y_coordinates[vertex_3];
+    double x4 = engine->x_coordinates[vertex_4], y4 = engine->y_coordinates[vertex_4];
+
+    double denominator = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4);
+    if (denominator == 0.) {
+        denominator = DBL_MIN;
+    }
+    double t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denominator;
+    double u = ((x1 - x3) * (y1 - y2) - (y1 - y3) * (x1 - x2)) / denominator;
+    return eps < t && t < 1. - eps && eps < u && u < 1. - eps;
+}
+
+
+static int segment_intersects(GPCEngine *engine, double x1, double y1, double x2, double y2)
+{
+    long cx_min = cell_coordinate(engine, fmin(x1, x2)), cx_max = cell_coordinate(engine, fmax(x1, x2));
+    long cy_min = cell_coordinate(engine, fmin(y1, y2)), cy_max = cell_coordinate(engine, fmax(y1, y2));
+    int finite = isfinite(x1) && isfinite(y1) && isfinite(x2) && isfinite(y2);
+
+    // Test all edges if the line segment covers more cells than there are edges
+    if (!finite || (cx_max - cx_min + 1) * (cy_max - cy_min + 1) > engine->n_gpc_edges) {
+        for (long row = 0; row < engine->n_gpc_edges; row++) {
+            if (segment_intersects_row(engine, row, x1, y1, x2, y2)) {
+                return 1;
+            }
+        }
+        return 0;
+    }
+
+    // Only test edges within the covered cells, each one at most once
+    long query = ++engine->n_queries;
+    for (long cx = cx_min; cx <= cx_max; cx++) {
+        for (long cy = cy_min; cy <= cy_max; cy++) {
+            for (long link = engine->cell_head[cx * engine->grid_size + cy]; link >= 0;
+                 link = engine->grid_link_next[link]) {
+                long row = engine->grid_link_row[link];
+                if (engine->query_stamp[row] == query) {
+                    continue;
+                }
+                engine->query_stamp[row] = query;
+                if (segment_intersects_row(engine, row, x1, y1, x2, y2)) {
+                    return 1;
+                }
+            }
+        }
+    }
+    return 0;
+}
+
+
+static int edge_intersects(GPCEngine *engine, long vertex_a, long vertex_b, long vertex_i, double x, double y)
+{
+    double x1 = vertex_a == vertex_i ? x : engine->x_coordinates[vertex_a];
+    double y1 = vertex_a == vertex_i ? y : engine->y_coordinates[vertex_a];
+    double x2 = vertex_b == vertex_i ? x : engine->x_coordinates[vertex_b];
+    double y2 = vertex_b == vertex_i ? y : engine->y_coordinates[vertex_b];
+    return segment_intersects(engine, x1, y1, x2, y2);
+}
+
+
+static int update(GPCEngine *engine,
+                  long vertex_i,
+                  double rho_i,
+                  double theta_i,
+                  long vertex_j,
+                  const long *k_vertices,
+                  long n_k_vertices,
+                  int update_coordinates);
+
+
+static int add_face(GPCEngine *engine, long face[3])
+{
+    sort_face(face);
+    long mesh_face = face_index(engine, face);
+    if (mesh_face < 0) {
+        snprintf(engine->error, sizeof(engine->error), "Face [%ld, %ld, %ld] is not contained in the mesh.", face[0], face[1], face[2]);
+        return -1;
+    }
+    long face_edges[3][2] = {{face[0], face[1]}, {face[1], face[2]}, {face[0], face[2]}};
+
+    if (engine->face_row[mesh_face] < 0) {
+        long row = engine->n_gpc_faces;
+        if (grow((void **)&engine->gpc_faces, &engine->gpc_faces_capacity, 3 * (row + 1), sizeof(npy_int64)) < 0) {
+            engine->out_of_memory = 1;
+            return -1;
+        }
+        for (int v = 0; v < 3; v++) {
+            engine->gpc_faces[3 * row + v] = face[v];
+        }
+        engine->face_row[mesh_face] = row;
+        engine->n_gpc_faces++;
+
+        // Remember face for all of its edges
+        for (int e = 0; e < 3; e++) {
+            long edge = edge_index(engine, face_edges[e][0], face_edges[e][1]);
+            long link = engine->n_edge_links++;
+            engine->edge_link_row[link] = row;
+            engine->edge_link_next[link] = -1;
+            if (engine->edge_face_tail[edge] < 0) {
+                engine->edge_face_head[edge] = link;
+            } else {
+                engine->edge_link_next[engine->edge_face_tail[edge]] = link;
+            }
+            engine->edge_face_tail[edge] = link;
+        }
+    }
+
+    // Recursively check all edges on whether their 2nd face is entirely describable with GPCs
+    for (int e = 0; e < 3; e++) {
+        long edge = edge_index(engine, face_edges[e][0], face_edges[e][1]);
+        for (npy_int64 idx = engine->edge_faces_indptr[edge]; idx < engine->edge_faces_indptr[edge + 1]; idx++) {
+            const npy_int64 *mesh_face_vertices = engine->faces + 3 * engine->edge_faces_indices[idx];
+            long new_face[3] = {(long)mesh_face_vertices[0], (long)mesh_face_vertices[1], (long)mesh_face_vertices[2]};
+            sort_face(new_face);
+            if (new_face[0] == face[0] && new_face[1] == face[1] && new_face[2] == face[2]) {
+                continue;
+            }
+            if (isinf(engine->radial_coordinates[new_face[0]])
+                || isinf(engine->radial_coordinates[new_face[1]])
+                || isinf(engine->radial_coordinates[new_face[2]])
+                || engine->face_row[engine->edge_faces_indices[idx]] >= 0) {
+                continue;
+            }
+            if (update(engine,
+                       new_face[0],
+                       engine->radial_coordinates[new_face[0]],
+                       engine->angular_coordinates[new_face[0]],
+                       new_face[1],
+                       &new_face[2],
+                       1,
+                       0) < 0) {
+                return -1;
+            }
+        }
+    }
+    return 0;
+}
+
+
+static int update(GPCEngine *engine,
+                  long vertex_i,
+                  double rho_i,
+                  double theta_i,
+                  long vertex_j,
+                  const long *k_vertices,
+                  long n_k_vertices,
+                  int update_coordinates)
+{
+    double x = rho_i * cos(theta_i);
+    double y = rho_i * sin(theta_i);
+    for (long k_idx = 0; k_idx < n_k_vertices; k_idx++) {
+        long vertex_k = k_vertices[k_idx];
+        if (vertex_k < 0 || isinf(engine->radial_coordinates[vertex_k])) {
+            continue;
+        }
+        long sorted_face[3] = {vertex_i, vertex_j, vertex_k};
+        sort_face(sorted_face);
+        long face_edges[3][2] = {
+            {sorted_face[0], sorted_face[1]}, {sorted_face[1], sorted_face[2]}, {sorted_face[0], sorted_face[2]}
+        };
+
+        // Check all edges of `vertex_i` and of the new face for intersections
+        for (long link = engine->vertex_edge_head[vertex_i]; link >= 0; link = engine->vertex_link_next[link]) {
+            long row = engine->vertex_link_row[link];
+            if (edge_intersects(
+                engine, (long)engine->gpc_edges[2 * row], (long)engine->gpc_edges[2 * row + 1], vertex_i, x, y
+            )) {
+                return 0;
+            }
+        }
+        for (int e = 0; e < 3; e++) {
+            if (edge_intersects(engine, face_edges[e][0], face_edges[e][1], vertex_i, x, y)) {
+                return 0;
+            }
+        }
+
+        // Update GPC of `vertex_i`
+        if (update_coordinates) {
+            if (isinf(engine->radial_coordinates[vertex_i])) {
+                engine->reached_vertices[engine->n_reached_vertices++] = vertex_i;
+            }
+            engine->radial_coordinates[vertex_i] = rho_i;
+            engine->angular_coordinates[vertex_i] = theta_i;
+            engine->x_coordinates[vertex_i] = x;
+            engine->y_coordinates[vertex_i] = y;
+            for (long link = engine->vertex_edge_head[vertex_i]; link >= 0; link = engine->vertex_link_next[link]) {
+                if (register_edge(engine, engine->vertex_link_row[link]) < 0) {
+                    engine->out_of_memory = 1;
+                    return -1;
+                }
+            }
+        }
+
+        // Add new edges and the new face
+        for (int e = 0; e < 3; e++) {
+            if (add_edge(engine, face_edges[e][0], face_edges[e][1]) < 0) {
+                return -1;
+            }
+        }
+        if (add_face(engine, sorted_face) < 0) {
+            return -1;
+        }
+    }
+    return 1;
+}
+
+
+static void compute_distance_and_angle(GPCEngine *engine,
+                                       long vertex_i,
+                                       long vertex_j,
+                                       long *k_vertices,
+                                       long *n_k_vertices,
+                                       double *result)
+{
+    long slot = slot_index(engine, vertex_i, vertex_j);
+    long edge = (long)engine->adjacency_edges[slot];
+    int found = 0;
+    double best[2] = {INFINITY, -1.0};
+    long best_k = -1;
+    *n_k_vertices = 0;
+
+    // Use face-cache to get the faces of the edge if it contains them. Otherwise use the mesh faces.
+    long link = engine->edge_face_head[edge];
+    npy_int64 idx = engine->edge_faces_indptr[edge];
+    while (link >= 0 || (engine->edge_face_head[edge] < 0 && idx < engine->edge_faces_indptr[edge + 1])) {
+        const npy_int64 *face;
+        if (engine->edge_face_head[edge] >= 0) {
+            face = engine->gpc_faces + 3 * engine->edge_link_row[link];
+            link = engine->edge_link_next[link];
+        } else {
+            face = engine->faces + 3 * engine->edge_faces_indices[idx];
+            idx++;
+        }
+
+        long vertex_k = -1;
+        for (int v = 0; v < 3; v++) {
+            if (face[v] != vertex_i && face[v] != vertex_j) {
+                vertex_k = (long)face[v];
+                break;
+            }
+        }
+        k_vertices[(*n_k_vertices)++] = vertex_k;
+        if (vertex_k < 0) {
+            continue;
+        }
+
+        // We need to know the distance to `vertex_k`
+        if (engine->radial_coordinates[vertex_k] < INFINITY && engine->angular_coordinates[vertex_k] >= 0.) {
+            // Look up the corner of the triangle (i, j, k) at i
+            long corner = slot * engine->max_edge_faces;
+            while (engine->opposite_vertices[corner] != vertex_k) {
+                corner++;
+            }
+            long slot_k = (long)engine->adjacent_slots[corner];
+            long slot_kj = (long)engine->opposite_slots[corner];
+            double update_result[2];
+            compute_corner_dist_and_dir(
+                engine->vertices + 3 * vertex_i,
+                engine->vertices + 3 * vertex_j,
+                engine->vertices + 3 * vertex_k,
+                engine->half_edge_vectors + 3 * slot,
+                engine->half_edge_lengths[slot],
+                engine->half_edge_vectors + 3 * slot_k,
+                engine->half_edge_lengths[slot_k],
+                engine->half_edge_vectors + 3 * slot_kj,
+                engine->half_edge_squared_lengths[slot_kj],
+                engine->corner_sines[corner],
+                engine->radial_coordinates[vertex_j],
+                engine->radial_coordinates[vertex_k],
+                engine->angular_coordinates[vertex_j],
+                engine->angular_coordinates[vertex_k],
+                update_result
+            );
+            // Select the smallest update (compared like the tuple '(u_ijk, theta_i, vertex_k)')
+            if (!found
+                || update_result[0] < best[0]
+                || (update_result[0] == best[0] && update_result[1] < best[1])
+                || (update_result[0] == best[0] && update_result[1] == best[1] && vertex_k < best_k)) {
+                best[0] = update_result[0];
+                best[1] = update_result[1];
+                best_k = vertex_k;
+                found = 1;
+            }
+        }
+    }
+    result[0] = best[0];
+    result[1] = best[1];
+}
+
+
+static void free_engine(GPCEngine *engine)
+{
+    free(engine->radial_coordinates);
+    free(engine->angular_coordinates);
+    free(engine->x_coordinates);
+    free(engine->y_coordinates);
+    free(engine->edge_captured);
+    free(engine->gpc_edges);
+    free(engine->vertex_edge_head);
+    free(engine->vertex_link_next);
+    free(engine->vertex_link_row);
+    free(engine->face_row);
+    free(engine->gpc_faces);
+    free(engine->edge_face_head);
+    free(engine->edge_face_tail);
+    free(engine->edge_link_next);
+    free(engine->edge_link_row);
+    free(engine->cell_head);
+    free(engine->grid_link_next);
+    free(engine->grid_link_row);
+    free(engine->query_stamp);
+    free(engine->heap);
+    free(engine->reached_vertices);
+    free(engine->k_vertices);
+}
+
+
+static void clear_engine(GPCEngine *engine, int full)
+{
+    // Forget the GPC-system of the previous source point. Only the entries which it has touched are reset, unless
+    // 'full' is set (e.g. after an error has interrupted the bookkeeping).
+    if (full) {
+        for (long v = 0; v < engine->n_vertices; v++) {
+            engine->radial_coordinates[v] = INFINITY;
+            engine->angular_coordinates[v] = -1.0;
+            engine->x_coordinates[v] = INFINITY;
+            engine->y_coordinates[v] = INFINITY;
+            engine->vertex_edge_head[v] = -1;
+        }
+        for (long f = 0; f < engine->n_faces; f++) {
+            engine->face_row[f] = -1;
+        }
+        for (long e = 0; e < engine->n_edges; e++) {
+            engine->edge_captured[e] = 0;
+            engine->edge_face_head[e] = -1;
+            engine->edge_face_tail[e] = -1;
+        }
+        engine->grid_size = MAX_GRID_SIZE;
+    } else {
+        for (long idx = 0; idx < engine->n_reached_vertices; idx++) {
+            long v = engine->reached_vertices[idx];
+            engine->radial_coordinates[v] = INFINITY;
+            engine->angular_coordinates[v] = -1.0;
+            engine->x_coordinates[v] = INFINITY;
+            engine->y_coordinates[v] = INFINITY;
+            engine->vertex_edge_head[v] = -1;
+        }
+        for (long row = 0; row < engine->n_gpc_edges; row++) {
+            engine->edge_captured[edge_index(engine, engine->gpc_edges[2 * row], engine->gpc_edges[2 * row + 1])] = 0;
+        }
+        for (long row = 0; row < engine->n_gpc_faces; row++) {
+            long face[3] = {
+                (long)engine->gpc_faces[3 * row], (long)engine->gpc_faces[3 * row + 1], (long)engine->gpc_faces[3 * row + 2]
+            };
+            engine->face_row[face_index(engine, face)] = -1;
+            long face_edges[3][2] = {{face[0], face[1]}, {face[1], face[2]}, {face[0], face[2]}};
+            for (int e = 0; e < 3; e++) {
+                long edge = edge_index(engine, face_edges[e][0], face_edges[e][1]);
+                engine->edge_face_head[edge] = -1;
+                engine->edge_face_tail[edge] = -1;
+            }
+        }
+    }
+    for (long cell = 0; cell < engine->grid_size * engine->grid_size; cell++) {
+        engine->cell_head[cell] = -1;
+    }
+    engine->n_reached_vertices = 0;
+    engine->n_gpc_edges = 0;
+    engine->n_gpc_faces = 0;
+    engine->n_vertex_links = 0;
+    engine->n_edge_links = 0;
+    engine->n_grid_links = 0;
+    engine->heap_size = 0;
+    engine->out_of_memory = 0;
+    engine->error[0] = '\0';
+}
+
+
+static int init_engine(GPCEngine *engine, long n_vertices, long n_edges, long n_faces)
+{
+    // Allocates the buffers of the engine for meshes of the given size. They are re-used for all source points.
+    engine->n_vertices = n_vertices;
+    engine->n_edges = n_edges;
+    engine->n_faces = n_faces;
+    engine->radial_coordinates = malloc((n_vertices + 1) * sizeof(double));
+    engine->angular_coordinates = malloc((n_vertices + 1) * sizeof(double));
+    engine->x_coordinates = malloc((n_vertices + 1) * sizeof(double));
+    engine->y_coordinates = malloc((n_vertices + 1) * sizeof(double));
+    engine->edge_captured = calloc(n_edges + 1, sizeof(char));
+    engine->vertex_edge_head = malloc((n_vertices + 1) * sizeof(long));
+    engine->vertex_link_next = malloc((2 * n_edges + 1) * sizeof(long));
+    engine->vertex_link_row = malloc((2 * n_edges + 1) * sizeof(long));
+    engine->face_row = malloc((n_faces + 1) * sizeof(long));
+    engine->edge_face_head = malloc((n_edges + 1) * sizeof(long));
+    engine->edge_face_tail = malloc((n_edges + 1) * sizeof(long));
+    engine->edge_link_next = malloc((3 * n_faces + 1) * sizeof(long));
+    engine->edge_link_row = malloc((3 * n_faces + 1) * sizeof(long));
+    engine->cell_head = malloc(MAX_GRID_SIZE * MAX_GRID_SIZE * sizeof(long));
+    engine->query_stamp = calloc(n_edges + 1, sizeof(long));
+    engine->reached_vertices = malloc((n_vertices + 1) * sizeof(long));
+    if (engine->radial_coordinates == NULL || engine->angular_coordinates == NULL || engine->x_coordinates == NULL
+        || engine->y_coordinates == NULL || engine->edge_captured == NULL || engine->vertex_edge_head == NULL
+        || engine->vertex_link_next == NULL || engine->vertex_link_row == NULL || engine->face_row == NULL
+        || engine->edge_face_head == NULL || engine->edge_face_tail == NULL || engine->edge_link_next == NULL
+        || engine->edge_link_row == NULL || engine->cell_head == NULL || engine->query_stamp == NULL
+        || engine->reached_vertices == NULL) {
+        free_engine(engine);
+        memset(engine, 0, sizeof(GPCEngine));
+        return -1;
+    }
+    clear_engine(engine, 1);
+    return 0;
+}
+
+
+static int compute_gpc_system(GPCEngine *engine, long source_point, double u_max, double eps)
+{
+    // Expects the buffers of the engine to be cleared (see 'clear_engine')
+    long required = engine->max_edge_faces + 1;
+    if (grow((void **)&engine->k_vertices, &engine->k_vertices_capacity, required, sizeof(long)) < 0) {
+        engine->out_of_memory = 1;
+        return -1;
+    }
+    long *k_vertices = engine->k_vertices;
+
+    //////////////////////////////////////////////////////////////
+    // Initialize GPC-system with the one-hop-neighborhood
+    //////////////////////////////////////////////////////////////
+    const double *r3_source_point = engine->vertices + 3 * source_point;
+    npy_int64 first_neighbor = engine->adjacency_indptr[source_point];
+    npy_int64 last_neighbor = engine->adjacency_indptr[source_point + 1];
+    double reference_direction[3] = {0., 0., 0.};
+    if (first_neighbor < last_neighbor) {
+        const double *r3_reference = engine->vertices + 3 * engine->adjacency_indices[first_neighbor];
+        for (int d = 0; d < 3; d++) {
+            reference_direction[d] = r3_reference[d] - r3_source_point[d];
+        }
+    }
+    for (npy_int64 idx = first_neighbor; idx < last_neighbor; idx++) {
+        long neighbor = (long)engine->adjacency_indices[idx];
+        double direction[3], reference[3];
+        for (int d = 0; d < 3; d++) {
+            direction[d] = engine->vertices[3 * neighbor + d] - r3_source_point[d];
+            reference[d] = reference_direction[d];
+        }
+        double rho = sqrt(direction[0] * direction[0] + direction[1] * direction[1] + direction[2] * direction[2]);
+        double theta = compute_angle_360(reference, direction, engine->rotation_axis);
+        engine->reached_vertices[engine->n_reached_vertices++] = neighbor;
+        engine->radial_coordinates[neighbor] = rho;
+        engine->angular_coordinates[neighbor] = theta;
+        engine->x_coordinates[neighbor] = rho * cos(theta);
+        engine->y_coordinates[neighbor] = rho * sin(theta);
+    }
+    engine->reached_vertices[engine->n_reached_vertices++] = source_point;
+    engine->radial_coordinates[source_point] = 0.;
+    engine->angular_coordinates[source_point] = 0.;
+    engine->x_coordinates[source_point] = 0.;
+    engine->y_coordinates[source_point] = 0.;
+
+    // The grid covers all radial coordinates. Its cells approximate the edge lengths around the source point.
+    double grid_radius = u_max;
+    double mean_distance = 0.;
+    for (npy_int64 idx = first_neighbor; idx < last_neighbor; idx++) {
+        double rho = engine->radial_coordinates[engine->adjacency_indices[idx]];
+        grid_radius = rho > grid_radius ? rho : grid_radius;
+        mean_distance += rho / (double)(last_neighbor - first_neighbor);
+    }
+    grid_radius += mean_distance;
+    engine->grid_size = 1;
+    engine->grid_origin = 0.;
+    engine->cell_size = 1.;
+    if (isfinite(grid_radius) && mean_distance > 0.) {
+        double cells = ceil(2. * grid_radius / mean_distance);
+        engine->grid_size = cells < MAX_GRID_SIZE ? (long)cells : MAX_GRID_SIZE;
+        engine->grid_origin = -grid_radius;
+        engine->cell_size = 2. * grid_radius / (double)engine->grid_size;
+    }
+
+    // Initialize face- and edge-cache with one-hop-neighborhood edges from source-point
+    for (npy_int64 idx = first_neighbor; idx < last_neighbor; idx++) {
+        long neighbor = (long)engine->adjacency_indices[idx];
+        if (add_edge(engine, source_point, neighbor) < 0) {
+            return -1;
+        }
+        long edge = edge_index(engine, source_point, neighbor);
+        for (npy_int64 f = engine->edge_faces_indptr[edge]; f < engine->edge_faces_indptr[edge + 1]; f++) {
+            const npy_int64 *mesh_face = engine->faces + 3 * engine->edge_faces_indices[f];
+            long face[3] = {(long)mesh_face[0], (long)mesh_face[1], (long)mesh_face[2]};
+            if (add_face(engine, face) < 0) {
+                    return -1;
+            }
+        }
+    }
+
+    // Initialize min-heap over radial distances
+    for (npy_int64 idx = first_neighbor; idx < last_neighbor; idx++) {
+        long neighbor = (long)engine->adjacency_indices[idx];
+        if (heap_push(engine, engine->radial_coordinates[neighbor], neighbor) < 0) {
+            engine->out_of_memory = 1;
+            return -1;
+        }
+    }
+
+    ///////////////////////////////////
+    // Algorithm to compute GPC-systems
+    ///////////////////////////////////
+    int status = 0;
+    while (engine->heap_size > 0 && status >= 0) {
+        // Get vertex from min-heap that is closest to GPC-system origin
+        HeapEntry entry = heap_pop(engine);
+        long vertex_j = entry.vertex;
+        if (entry.dist > engine->radial_coordinates[vertex_j]) {
+            // Stale entry, the vertex has been improved and re-queued since (equals a decrease-key)
+            continue;
+        }
+        for (npy_int64 idx = engine->adjacency_indptr[vertex_j]; idx < engine->adjacency_indptr[vertex_j + 1]; idx++) {
+            long vertex_i = (long)engine->adjacency_indices[idx];
+            if (vertex_i == source_point) {
+                continue;
+            }
+            double result[2];
+            long n_k_vertices;
+            compute_distance_and_angle(engine, vertex_i, vertex_j, k_vertices, &n_k_vertices, result);
+            double new_u_i = result[0];
+            if (new_u_i < u_max && engine->radial_coordinates[vertex_i] / new_u_i > 1 + eps) {
+                status = update(engine, vertex_i, new_u_i, result[1], vertex_j, k_vertices, n_k_vertices, 1);
+                if (status < 0) {
+                    break;
+                }
+                if (status == 1 && heap_push(engine, new_u_i, vertex_i) < 0) {
+                    engine->out_of_memory = 1;
+                    status = -1;
+                    break;
+                }
+            }
+        }
+    }
+    return status < 0 ? -1 : 0;
+}
+
+
+#define GPC_WORKSPACE_NAME "c_extension.GPCWorkspace"
+
+
+static void destroy_gpc_workspace(PyObject *capsule)
+{
+    GPCEngine *engine = (GPCEngine *)PyCapsule_GetPointer(capsule, GPC_WORKSPACE_NAME);
+    if (engine != NULL) {
+        free_engine(engine);
+        free(engine);
+    }
+}
+
+
+static PyObject *create_gpc_workspace_wrapper(PyObject *self, PyObject *args) {
+    long n_vertices, n_edges, n_faces;
+
+    if(!PyArg_ParseTuple(args, "lll", &n_vertices, &n_edges, &n_faces)) {
+        return NULL;
+    }
+    if (n_vertices < 0 || n_edges < 0 || n_faces < 0) {
+        PyErr_SetString(PyExc_ValueError, "Mesh sizes must not be negative!");
+        return NULL;
+    }
+    GPCEngine *engine = calloc(1, sizeof(GPCEngine));
+    if (engine == NULL || init_engine(engine, n_vertices, n_edges, n_faces) < 0) {
+        free(engine);
+        return PyErr_NoMemory();
+    }
+    PyObject *capsule = PyCapsule_New(engine, GPC_WORKSPACE_NAME, destroy_gpc_workspace);
+    if (capsule == NULL) {
+        free_engine(engine);
+        free(engine);
+    }
+    return capsule;
+}
+
+
+static int compare_indices(const void *a, const void *b)
+{
+    npy_int64 index_a = *(const npy_int64 *)a, index_b = *(const npy_int64 *)b;
+    return (index_a > index_b) - (index_a < index_b);
+}
+
+
+static PyObject *gpc_system_result(GPCEngine *engine)
+{
+    // Returns the reached vertices in ascending order, their radial and angular coordinates and the captured edges
+    // and faces
+    npy_intp n_reached = engine->n_reached_vertices;
+    npy_intp edges_shape[2] = {engine->n_gpc_edges, 2};
+    npy_intp faces_shape[2] = {engine->n_gpc_faces, 3};
+    PyArrayObject *arrays[5];
+    arrays[0] = (PyArrayObject *)PyArray_SimpleNew(1, &n_reached, NPY_INT64);
+    arrays[1] = (PyArrayObject *)PyArray_SimpleNew(1, &n_reached, NPY_DOUBLE);
+    arrays[2] = (PyArrayObject *)PyArray_SimpleNew(1, &n_reached, NPY_DOUBLE);
+    arrays[3] = (PyArrayObject *)PyArray_SimpleNew(2, edges_shape, NPY_INT64);
+    arrays[4] = (PyArrayObject *)PyArray_SimpleNew(2, faces_shape, NPY_INT64);
+    PyObject *result = NULL;
+    if (arrays[0] != NULL && arrays[1] != NULL && arrays[2] != NULL && arrays[3] != NULL && arrays[4] != NULL) {
+        npy_int64 *vertex_indices = (npy_int64 *)PyArray_DATA(arrays[0]);
+        double *radial_coordinates = (double *)PyArray_DATA(arrays[1]);
+        double *angular_coordinates = (double *)PyArray_DATA(arrays[2]);
+        for (npy_intp idx = 0; idx < n_reached; idx++) {
+            vertex_indices[idx] = engine->reached_vertices[idx];
+        }
+        qsort(vertex_indices, n_reached, sizeof(npy_int64), compare_indices);
+        for (npy_intp idx = 0; idx < n_reached; idx++) {
+            radial_coordinates[idx] = engine->radial_coordinates[vertex_indices[idx]];
+            angular_coordinates[idx] = engine->angular_coordinates[vertex_indices[idx]];
+        }
+        if (engine->n_gpc_edges > 0) {
+            memcpy(PyArray_DATA(arrays[3]), engine->gpc_edges, 2 * engine->n_gpc_edges * sizeof(npy_int64));
+        }
+        if (engine->n_gpc_faces > 0) {
+            memcpy(PyArray_DATA(arrays[4]), engine->gpc_faces, 3 * engine->n_gpc_faces * sizeof(npy_int64));
+        }
+        result = Py_BuildValue("(OOOOO)", arrays[0], arrays[1], arrays[2], arrays[3], arrays[4]);
+    }
+    for (int i = 0; i < 5; i++) {
+        Py_XDECREF(arrays[i]);
+    }
+    return result;
+}
+
+
+static PyObject *compute_gpc_system_wrapper(PyObject *self, PyObject *args) {
+    PyObject *objects[15];
+    PyObject *workspace = Py_None;
+    long source_point;
+    double u_max, eps;
+
+    if(!PyArg_ParseTuple(args,
+                         "OOOOOOOOOOOOOOOldd|O",
+                         &objects[0],
+                         &objects[1],
+                         &objects[2],
+                         &objects[3],
+                         &objects[4],
+                         &objects[5],
+                         &objects[6],
+                         &objects[7],
+                         &objects[8],
+                         &objects[9],
+                         &objects[10],
+                         &objects[11],
+                         &objects[12],
+                         &objects[13],
+                         &objects[14],
+                         &source_point,
+                         &u_max,
+                         &eps,
+                         &workspace)) {
+        return NULL;
+    }
+
+    // Use the buffers of the given workspace or temporary ones
+    GPCEngine temporary_engine = {0};
+    GPCEngine *engine = &temporary_engine;
+    if (workspace != Py_None) {
+        engine = (GPCEngine *)PyCapsule_GetPointer(workspace, GPC_WORKSPACE_NAME);
+        if (engine == NULL) {
+            return NULL;
+        }
+        if (engine->in_use) {
+            PyErr_SetString(PyExc_RuntimeError, "The GPC workspace is already in use by another thread!");
+            return NULL;
+        }
+    }
+
+    // Translate inputs into contiguous numpy arrays:
+    // vertices, rotation_axis, adjacency_indptr, adjacency_indices, adjacency_edges, edge_faces_indptr,
+    // edge_faces_indices, faces, half_edge_vectors, half_edge_lengths, half_edge_squared_lengths, opposite_vertices,
+    // adjacent_slots, opposite_slots, corner_sines
+    int types[] = {
+        NPY_DOUBLE, NPY_DOUBLE, NPY_INT64, NPY_INT64, NPY_INT64, NPY_INT64, NPY_INT64, NPY_INT64,
+        NPY_DOUBLE, NPY_DOUBLE, NPY_DOUBLE, NPY_INT64, NPY_INT64, NPY_INT64, NPY_DOUBLE
+    };
+    int dims[] = {2, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 2, 2, 2, 2};
+    PyArrayObject *arrays[15] = {NULL};
+    for (int i = 0; i < 15; i++) {
+        arrays[i] = (PyArrayObject *)PyArray_FROM_OTF(objects[i], types[i], NPY_ARRAY_IN_ARRAY);
+        if (arrays[i] == NULL || PyArray_NDIM(arrays[i]) != dims[i]) {
+            for (int j = 0; j <= i; j++) {
+                Py_XDECREF(arrays[j]);
+            }
+            if (!PyErr_Occurred()) {
+                PyErr_SetString(PyExc_ValueError, "Mesh arrays have wrong dimensions!");
+            }
+            return NULL;
+        }
+    }
+
+    long n_vertices = (long)PyArray_DIM(arrays[0], 0);
+    long n_edges = (long)PyArray_DIM(arrays[5], 0) - 1;
+    long n_faces = (long)PyArray_DIM(arrays[7], 0);
+    int valid = PyArray_DIM(arrays[0], 1) == 3
+        && PyArray_DIM(arrays[1], 0) == 3
+        && PyArray_DIM(arrays[2], 0) == n_vertices + 1
+        && n_edges >= 0
+        && PyArray_DIM(arrays[7], 1) == 3
+        && PyArray_DIM(arrays[8], 0) == PyArray_DIM(arrays[3], 0)
+        && PyArray_DIM(arrays[8], 1) == 3
+        && PyArray_DIM(arrays[9], 0) == PyArray_DIM(arrays[3], 0)
+        && PyArray_DIM(arrays[10], 0) == PyArray_DIM(arrays[3], 0)
+        && PyArray_DIM(arrays[11], 0) == PyArray_DIM(arrays[3], 0);
+    for (int i = 12; i < 15; i++) {
+        valid = valid
+            && PyArray_DIM(arrays[i], 0) == PyArray_DIM(arrays[11], 0)
+            && PyArray_DIM(arrays[i], 1) == PyArray_DIM(arrays[11], 1);
+    }
+    valid = valid
+        && source_point >= 0
+        && source_point < n_vertices;
+    if (valid && workspace != Py_None
+        && (engine->n_vertices != n_vertices || engine->n_edges != n_edges || engine->n_faces != n_faces)) {
+        PyErr_SetString(PyExc_ValueError, "The GPC workspace has been created for a mesh of another size!");
+        valid = 0;
+    }
+    if (valid && workspace == Py_None && init_engine(engine, n_vertices, n_edges, n_faces) < 0) {
+        PyErr_NoMemory();
+        valid = 0;
+    }
+    if (!valid) {
+        for (int i = 0; i < 15; i++) {
+            Py_DECREF(arrays[i]);
+        }
+        if (!PyErr_Occurred()) {
+            PyErr_SetString(PyExc_ValueError, "Mesh arrays have inconsistent shapes or the source point is invalid!");
+        }
+        return NULL;
+    }
+
+    engine->vertices = (const double *)PyArray_DATA(arrays[0]);
+    engine->adjacency_indptr = (const npy_int64 *)PyArray_DATA(arrays[2]);
+    engine->adjacency_indices = (const npy_int64 *)PyArray_DATA(arrays[3]);
+    engine->adjacency_edges = (const npy_int64 *)PyArray_DATA(arrays[4]);
+    engine->edge_faces_indptr = (const npy_int64 *)PyArray_DATA(arrays[5]);
+    engine->edge_faces_indices = (const npy_int64 *)PyArray_DATA(arrays[6]);
+    engine->faces = (const npy_int64 *)PyArray_DATA(arrays[7]);
+    engine->half_edge_vectors = (const double *)PyArray_DATA(arrays[8]);
+    engine->half_edge_lengths = (const double *)PyArray_DATA(arrays[9]);
+    engine->half_edge_squared_lengths = (const double *)PyArray_DATA(arrays[10]);
+    engine->opposite_vertices = (const npy_int64 *)PyArray_DATA(arrays[11]);
+    engine->adjacent_slots = (const npy_int64 *)PyArray_DATA(arrays[12]);
+    engine->opposite_slots = (const npy_int64 *)PyArray_DATA(arrays[13]);
+    engine->corner_sines = (const double *)PyArray_DATA(arrays[14]);
+    engine->max_edge_faces = (long)PyArray_DIM(arrays[11], 1);
+    for (int d = 0; d < 3; d++) {
+        engine->rotation_axis[d] = ((const double *)PyArray_DATA(arrays[1]))[d];
+    }
+
+    // The buffers are only touched without holding the GIL, hence claim them while holding it
+    engine->in_use = 1;
+    int status;
+    Py_BEGIN_ALLOW_THREADS
+    status = compute_gpc_system(engine, source_point, u_max, eps);
+    Py_END_ALLOW_THREADS
+
+    PyObject *result = NULL;
+    if (status < 0) {
+        if (engine->out_of_memory) {
+            PyErr_NoMemory();
+        } else {
+            PyErr_SetString(PyExc_RuntimeError, engine->error);
+        }
+    } else {
+        result = gpc_system_result(engine);
+    }
+
+    // Clearing the buffers requires the mesh arrays
+    if (workspace == Py_None) {
+        free_engine(engine);
+    } else {
+        clear_engine(engine, status < 0);
+        engine->in_use = 0;
+    }
+    for (int i = 0; i < 15; i++) {
+        Py_DECREF(arrays[i]);
+    }
+    return result;
+}
+
 static PyMethodDef C_Extension_Methods[] = {
     {"compute_dist_and_dir", compute_dist_and_dir_wrapper, METH_VARARGS, "Compute GPC in C."},
     {"compute_angle", compute_angle_wrapper, METH_VARARGS, "Compute the angle between two vectors."},
     {"compute_angle_360", compute_angle_360_wrapper, METH_VARARGS, "Compute the angle between two vectors (range 360)."},
+    {"compute_dist_and_dir_batch", compute_dist_and_dir_batch_wrapper, METH_VARARGS, "Compute multiple GPC in C."},
+    {"compute_cached_dist_and_dir_batch", compute_cached_dist_and_dir_batch_wrapper, METH_VARARGS,
+     "Compute multiple GPC from the cached geometry of a mesh in C."},
+    {"compute_half_edge_geometry", compute_half_edge_geometry_wrapper, METH_VARARGS,
+     "Compute the lengths of half-edges and the angles of triangle corners."},
+    {"compute_angle_360_batch", compute_angle_360_batch_wrapper, METH_VARARGS, "Compute multiple angles (range 360)."},
+    {"compute_gpc_system", compute_gpc_system_wrapper, METH_VARARGS, "Compute an entire GPC-system in C."},
+    {"create_gpc_workspace", create_gpc_workspace_wrapper, METH_VARARGS,
+     "Allocate the buffers of 'compute_gpc_system' for re-use across GPC-systems of a mesh."},
     {NULL, NULL, 0, NULL}
 };
 
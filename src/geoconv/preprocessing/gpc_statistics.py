@@ -0,0 +1,144 @@
+from geoconv.preprocessing.gpc_system import GPC_SYSTEM_COUNTERS
+
+import numpy as np
+
+
+# All statistics which are recorded for each GPC-system
+STATISTICS = GPC_SYSTEM_COUNTERS + ["system_vertices", "system_faces", "wall_time"]
+
+
+class GPCStatistics:
+    def __init__(self, source_points, values):
+        """Statistics that have been recorded while computing GPC-systems.
+
+        For each source point the following statistics are recorded:
+            - heap_pushes: The amount of vertices pushed onto the min-heap.
+            - heap_pops: The amount of vertices popped from the min-heap.
+            - decrease_keys: The amount of improvements of queued vertices. Each would have caused a redundant pop
+              of an outdated heap entry.
+            - updates_attempted: The amount of improving updates that have been passed to `GPCSystem.update`.
+            - update_calls: The amount of calls of `GPCSystem.update`, including the ones caused by `add_face`.
+            - intersection_tests: The amount of calls of `GPCSystem.line_segment_intersection`.
+            - intersection_rejections: The amount of updates rejected due to intersections.
+            - max_face_recursion_depth: The maximal recursion depth of `GPCSystem.add_face`.
+            - system_vertices: The amount of vertices in the final GPC-system.
+            - system_faces: The amount of faces in the final GPC-system.
+            - wall_time: The seconds required to compute the GPC-system.
+
+        Counters which have not been measured (e.g. by the c-extension engine or for warm-started GPC-systems) are
+        NaN. They are ignored by `histogram`, `outliers` and `summary`.
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The source points of the GPC-systems for which statistics have been recorded.
+        values: dict
+            Maps the name of each statistic to an array containing its value for each source point.
+        """
+        self.source_points = source_points
+        self.values = values
+
+    def __len__(self):
+        return self.source_points.shape[0]
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+    @classmethod
+    def from_states(cls, states):
+        """Collects the statistics of GPC-system states (see `GPCSystemGroup.compute_gpc_system_states`).
+
+        Parameters
+        ----------
+        states: list
+            The states of the GPC-systems. States without statistics are skipped.
+
+        Returns
+        -------
+        GPCStatistics:
+            The collected statistics.
+        """
+        states = [state for state in states if "statistics" in state]
+        return cls(
+            np.array([state["source_point"] for state in states], dtype=np.int64),
+            {
+                name: np.array([state["statistics"][name] for state in states], dtype=np.float64)
+                for name in STATISTICS
+            }
+        )
+
+    def histogram(self, name, bins=10):
+        """Computes the histogram of a statistic.
+
+        Parameters
+        ----------
+        name: str
+            The name of the statistic.
+        bins: int
+            The amount of bins.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            The counts and the bin edges (see `np.histogram`).
+        """
+        values = self.values[name]
+        return np.histogram(values[~np.isnan(values)], bins=bins)
+
+    def outliers(self, name, n=10):
+        """Returns the source points with the largest values of a statistic.
+
+        Parameters
+        ----------
+        name: str
+            The name of the statistic.
+        n: int
+            The amount of source points to return.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            The source points in descending order of their values and their values.
+        """
+        measured = np.nonzero(~np.isnan(self.values[name]))[0]
+        order = measured[np.argsort(-self.values[name][measured], kind="stable")[:n]]
+        return self.source_points[order], self.values[name][order]
+
+    def summary(self, bins=10, n_outliers=5):
+        """Summarizes all statistics with their mean, quantiles, histogram and outliers.
+
+        Parameters
+        ----------
+        bins: int
+            The amount of histogram bins.
+        n_outliers: int
+            The amount of outliers which are listed for each statistic.
+
+        Returns
+        -------
+        str:
+            A printable summary.
+        """
+        lines = [f"Statistics of {len(self)} GPC-systems"]
+        if len(self) == 0:
+            return lines[0]
+        for name in STATISTICS:
+            values = self.values[name]
+            values = values[~np.isnan(values)]
+            if values.shape[0] == 0:
+                lines.append(f"{name}: not measured")
+                continue
+            median, q99 = np.quantile(values, [.5, .99])
+            lines.append(
+                f"{name}: total={values.sum():g} | mean={values.mean():g} | median={median:g} | 99%={q99:g} | "
+                f"max={values.max():g}"
+            )
+            counts, edges = self.histogram(name, bins=bins)
+            lines.append(
+                "    histogram: " + " ".join(f"[{edges[i]:.3g}, {edges[i + 1]:.3g}]: {counts[i]}" for i in range(bins))
+            )
+            source_points, outlier_values = self.outliers(name, n=n_outliers)
+            lines.append(
+                "    outliers: " + ", ".join(f"{s}: {v:g}" for s, v in zip(source_points.tolist(), outlier_values))
+            )
+        return "\n".join(lines)
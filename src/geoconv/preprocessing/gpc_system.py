@@ -1,5 +1,8 @@
 from geoconv.preprocessing.barycentric_coordinates import polar_to_cart
-from geoconv.utils.misc import get_neighbors, get_faces_of_edge, compute_vector_angle, gpc_systems_into_cart
+from geoconv.preprocessing.gpc_system_cache import EdgeCache, FaceCache, EdgeGrid
+from geoconv.preprocessing.mesh_geometry import MeshGeometry
+from geoconv.preprocessing.mesh_topology import MeshTopology
+from geoconv.utils.misc import compute_vector_angle, gpc_systems_into_cart
 
 from matplotlib import pyplot as plt
 from matplotlib.patches import Polygon
@@ -9,8 +12,98 @@ import numpy as np
 import sys
 
 
+# Counters which are recorded by GPC-systems that collect statistics
+GPC_SYSTEM_COUNTERS = [
+    "heap_pushes",
+    "heap_pops",
+    "decrease_keys",
+    "updates_attempted",
+    "update_calls",
+    "intersection_tests",
+    "intersection_rejections",
+    "max_face_recursion_depth"
+]
+
+# The coordinates of a GPC-system state (see `GPCSystem.get_state`)
+STATE_COORDINATES = ["radial_coordinates", "angular_coordinates", "x_coordinates", "y_coordinates"]
+
+
+def cast_state(state, dtype):
+    """Casts the coordinates of a GPC-system state into another floating point type.
+
+    Parameters
+    ----------
+    state: dict
+        The state of a GPC-system (see `GPCSystem.get_state`).
+    dtype: np.dtype
+        The floating point type of the coordinates.
+
+    Returns
+    -------
+    dict:
+        The state with cast coordinates. Coordinates which already have the given type are not copied.
+    """
+    return dict(state, **{key: state[key].astype(dtype, copy=False) for key in STATE_COORDINATES if key in state})
+
+
+def compute_initial_coordinates(source_point, topology, mesh_geometry, use_c=True):
+    """Computes the polar coordinates of a source point and its one-hop-neighbors.
+
+    Angle coordinates are given w.r.t. the vector `x - source_point` with `x` being the first neighbor returned by
+    `get_neighbors`.
+
+    Parameters
+    ----------
+    source_point: int
+        The index of the source point.
+    topology: MeshTopology
+        The topology of the mesh.
+    mesh_geometry: MeshGeometry
+        The geometry of the mesh.
+    use_c: bool
+        A flag whether to use the c-extension.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray):
+        The radial and angular coordinates for all vertices of the mesh (`np.inf` and -1 for vertices other than the
+        source point and its neighbors).
+    """
+    n_vertices = mesh_geometry.vertices.shape[0]
+    radial_coordinates = np.full((n_vertices,), np.inf)
+    angular_coordinates = np.full((n_vertices,), -1.0)
+
+    #######################################
+    # Calculate initial radial coordinates
+    #######################################
+    source_point_neighbors = topology.get_neighbors(source_point)
+    r3_source_point = mesh_geometry.vertices[source_point]
+    r3_neighbors = mesh_geometry.vertices[source_point_neighbors]
+    radial_coordinates[source_point_neighbors] = np.linalg.norm(
+        r3_neighbors - np.stack([r3_source_point for _ in range(len(source_point_neighbors))]), ord=2, axis=-1
+    )
+    radial_coordinates[source_point] = .0
+
+    ########################################
+    # Calculate initial angular coordinates
+    ########################################
+    rotation_axis = mesh_geometry.vertex_normals[source_point]
+    theta_neighbors = np.full((len(source_point_neighbors, )), .0)
+    # Angles of all neighbors are computed at once
+    vectors_a = np.repeat((r3_neighbors[0] - r3_source_point)[None, :], len(source_point_neighbors), axis=0)
+    vectors_b = r3_neighbors - r3_source_point
+    if use_c:
+        c_extension.compute_angle_360_batch(theta_neighbors, vectors_a, vectors_b, rotation_axis)
+    else:
+        theta_neighbors[:] = compute_vector_angle(vectors_a, vectors_b, rotation_axis)
+    angular_coordinates[source_point_neighbors] = theta_neighbors
+    angular_coordinates[source_point] = 0.0
+    return radial_coordinates, angular_coordinates
+
+
 class GPCSystem:
-    def __init__(self, source_point, object_mesh, use_c=True, soft_clear=False):
+    def __init__(self, source_point, object_mesh, use_c=True, soft_clear=False, topology=None,
+                 collect_statistics=False, mesh_geometry=None):
         """Compute the initial radial and angular coordinates around a source point and setup caches.
 
         Angle coordinates are always given w.r.t. some reference direction. The choice of a reference
@@ -20,6 +113,7 @@ class GPCSystem:
         This class handles two caches which connect GPC-system- with mesh information:
             - Edge-cache: Remembers all edges to a vertex
             - Face-cache: Remembers all faces to a sorted edge
+        Additionally, a spatial grid over the cartesian edge coordinates restricts intersection tests to nearby edges.
 
         Parameters
         ----------
@@ -30,42 +124,40 @@ class GPCSystem:
         use_c: bool
             A flag whether to use the c-extension.
         soft_clear: bool
-            Whether to re-use old edge- and face-caches.
+            Whether to re-use the allocated edge- and face-caches of a previous GPC-system.
+        topology: MeshTopology
+            The precomputed topology of `object_mesh`. If not given, it will be computed.
+        collect_statistics: bool
+            Whether to count the operations of the GPC-algorithm in `statistics` (see `GPC_SYSTEM_COUNTERS`). A soft
+            clear resets the counters.
+        mesh_geometry: MeshGeometry
+            The precomputed geometry of `object_mesh`. If not given, it will be computed.
         """
+        # Counters of the GPC-algorithm
+        if not soft_clear:
+            self.statistics = dict.fromkeys(GPC_SYSTEM_COUNTERS, 0) if collect_statistics else None
+        elif self.statistics is not None:
+            self.statistics = dict.fromkeys(GPC_SYSTEM_COUNTERS, 0)
+        self.face_recursion_depth = 0
+        # Radius to which the GPC-system has been truncated due to a work budget
+        self.truncation_radius = None
+
         # Remember the underlying mesh
         self.object_mesh = object_mesh
+        if topology is None:
+            topology = MeshTopology(object_mesh.faces, object_mesh.vertices.shape[0])
+        self.topology = topology
+        if mesh_geometry is None:
+            mesh_geometry = MeshGeometry(object_mesh, topology=topology)
+        self.mesh_geometry = mesh_geometry
+        n_vertices = mesh_geometry.vertices.shape[0]
         self.source_point = source_point
-        self.radial_coordinates = np.full((object_mesh.vertices.shape[0],), np.inf)
-        self.angular_coordinates = np.full((object_mesh.vertices.shape[0],), -1.0)
-        self.x_coordinates = np.full((object_mesh.vertices.shape[0],), np.inf)
-        self.y_coordinates = np.full((object_mesh.vertices.shape[0],), np.inf)
-
-        #######################################
-        # Calculate initial radial coordinates
-        #######################################
-        source_point_neighbors = get_neighbors(source_point, object_mesh)
-        r3_source_point = object_mesh.vertices[source_point]
-        r3_neighbors = object_mesh.vertices[source_point_neighbors]
-        self.radial_coordinates[source_point_neighbors] = np.linalg.norm(
-            r3_neighbors - np.stack([r3_source_point for _ in range(len(source_point_neighbors))]), ord=2, axis=-1
+        self.radial_coordinates, self.angular_coordinates = compute_initial_coordinates(
+            source_point, topology, mesh_geometry, use_c=use_c
         )
-        self.radial_coordinates[source_point] = .0
-
-        ########################################
-        # Calculate initial angular coordinates
-        ########################################
-        ref_neighbor = source_point_neighbors[0]
-        rotation_axis = object_mesh.vertex_normals[source_point]
-        theta_neighbors = np.full((len(source_point_neighbors, )), .0)
-        for idx, neighbor in enumerate(source_point_neighbors):
-            vector_a = object_mesh.vertices[ref_neighbor] - object_mesh.vertices[source_point]
-            vector_b = object_mesh.vertices[neighbor] - object_mesh.vertices[source_point]
-            if use_c:
-                theta_neighbors[idx] = c_extension.compute_angle_360(vector_a, vector_b, rotation_axis)
-            else:
-                theta_neighbors[idx] = compute_vector_angle(vector_a, vector_b, rotation_axis)
-        self.angular_coordinates[source_point_neighbors] = theta_neighbors
-        self.angular_coordinates[source_point] = 0.0
+        self.x_coordinates = np.full((n_vertices,), np.inf)
+        self.y_coordinates = np.full((n_vertices,), np.inf)
+        source_point_neighbors = self.topology.get_neighbors(source_point)
 
         ##########################################
         # Calculate initial Cartesian coordinates
@@ -80,13 +172,20 @@ class GPCSystem:
         ####################################################################################
         # Initialize face- and edge-cache with one-hop-neighborhood edges from source-point
         ####################################################################################
-        if not soft_clear:
-            self.edges = {-1: []}
-            self.faces = {(-1, -1): []}
-        self.edges[source_point] = []
+        if soft_clear:
+            # Keep the allocated buffers but forget the edges and faces of the previous GPC-system
+            self.edges.clear()
+            self.faces.clear()
+        else:
+            self.edges = EdgeCache(n_vertices)
+            self.faces = FaceCache(n_vertices)
+        self.edges.reset_vertex(source_point)
+        # The mean one-hop-distance approximates the edge lengths around the source point
+        self.edge_grid = EdgeGrid(
+            self.x_coordinates, self.y_coordinates, cell_size=self.radial_coordinates[source_point_neighbors].mean()
+        )
         for neighbor in source_point_neighbors:
-            edge, considered_faces = get_faces_of_edge(np.array([source_point, neighbor]), object_mesh)
-            edge = list(edge)
+            edge, considered_faces = self.topology.get_faces_of_edge(np.array([source_point, neighbor]))
             # Add edges to edge-cache
             self.add_edge(edge)
             # Add faces to face-cache
@@ -94,7 +193,7 @@ class GPCSystem:
                 self.add_face(face)
 
     def soft_clear(self, source_point, use_c=True):
-        """Reset radial- and angular coordinates, keep underlying mesh and edge- and face-caches.
+        """Reset coordinates and caches, keep underlying mesh, topology and the allocated cache buffers.
 
         Parameters
         ----------
@@ -103,7 +202,159 @@ class GPCSystem:
         use_c: bool
             A flag whether to use the c-extension
         """
-        self.__init__(source_point, self.object_mesh, use_c=use_c, soft_clear=True)
+        self.__init__(
+            source_point,
+            self.object_mesh,
+            use_c=use_c,
+            soft_clear=True,
+            topology=self.topology,
+            mesh_geometry=self.mesh_geometry
+        )
+
+    def assign(self,
+               radial_coordinates,
+               angular_coordinates,
+               edges,
+               faces,
+               x_coordinates=None,
+               y_coordinates=None,
+               cell_size=None):
+        """Overwrite coordinates and caches with a GPC-system that has been computed elsewhere (e.g. in C).
+
+        Parameters
+        ----------
+        radial_coordinates: np.ndarray
+            The radial coordinates for all vertices of the mesh (`np.inf` for vertices outside the GPC-system).
+        angular_coordinates: np.ndarray
+            The angular coordinates for all vertices of the mesh (-1 for vertices outside the GPC-system).
+        edges: np.ndarray
+            A 2D-array containing the sorted edges captured by the GPC-system.
+        faces: np.ndarray
+            A 2D-array containing the sorted faces captured by the GPC-system in the order of their capture.
+        x_coordinates: np.ndarray
+            The x-coordinates for all vertices of the mesh. If not given, they are computed from the polar coordinates.
+        y_coordinates: np.ndarray
+            The y-coordinates for all vertices of the mesh. If not given, they are computed from the polar coordinates.
+        cell_size: float
+            The cell size of the edge-grid. If not given, the cell size of the current edge-grid is kept.
+        """
+        self.radial_coordinates = radial_coordinates
+        self.angular_coordinates = angular_coordinates
+        if x_coordinates is None or y_coordinates is None:
+            x_coordinates = np.full(radial_coordinates.shape, np.inf)
+            y_coordinates = np.full(radial_coordinates.shape, np.inf)
+            reached = radial_coordinates != np.inf
+            xy = polar_to_cart(angles=angular_coordinates[reached], scales=radial_coordinates[reached])
+            x_coordinates[reached] = xy[:, 0]
+            y_coordinates[reached] = xy[:, 1]
+        self.x_coordinates = x_coordinates
+        self.y_coordinates = y_coordinates
+        if cell_size is None:
+            cell_size = self.edge_grid.cell_size
+
+        self.edges = EdgeCache(radial_coordinates.shape[0], capacity=max(edges.shape[0], 1))
+        self.faces = FaceCache(radial_coordinates.shape[0], capacity=max(faces.shape[0], 1))
+        self.edge_grid = EdgeGrid(self.x_coordinates, self.y_coordinates, cell_size=cell_size)
+        for edge in edges.tolist():
+            self.edges.add(edge)
+            self.edge_grid.add(edge)
+        for face in faces.tolist():
+            self.faces.add(face)
+
+    def get_state(self, dtype=None):
+        """Returns a sparse copy of the coordinates and the captured edges and faces of the GPC-system.
+
+        The state only contains the coordinates of the vertices that have been reached by the GPC-system and does not
+        reference the underlying mesh. Hence, it is cheap to store and to send between processes.
+
+        Parameters
+        ----------
+        dtype: np.dtype
+            If given, the coordinates are cast into this floating point type (see `cast_state`).
+
+        Returns
+        -------
+        dict:
+            The source point, the amount of mesh vertices, the sorted indices of the reached vertices and their polar
+            and cartesian coordinates, the captured edges and faces, the cell size of the edge-grid and the radius to
+            which the GPC-system has been truncated (`None` if it has not been truncated).
+        """
+        vertex_indices = np.nonzero(self.radial_coordinates != np.inf)[0]
+        state = {
+            "source_point": self.source_point,
+            "n_vertices": self.radial_coordinates.shape[0],
+            "vertex_indices": vertex_indices,
+            "radial_coordinates": self.radial_coordinates[vertex_indices],
+            "angular_coordinates": self.angular_coordinates[vertex_indices],
+            "x_coordinates": self.x_coordinates[vertex_indices],
+            "y_coordinates": self.y_coordinates[vertex_indices],
+            "edges": self.edges[-1].copy(),
+            "faces": self.faces[(-1, -1)].copy(),
+            "cell_size": self.edge_grid.cell_size,
+            "truncation_radius": self.truncation_radius
+        }
+        return state if dtype is None else cast_state(state, dtype)
+
+    @classmethod
+    def from_state(cls, state, object_mesh, topology=None, mesh_geometry=None):
+        """Re-creates a GPC-system from a state returned by `get_state` without re-computing it.
+
+        Parameters
+        ----------
+        state: dict
+            The state of a GPC-system.
+        object_mesh: trimesh.Trimesh
+            The mesh on which the GPC-system has been computed.
+        topology: MeshTopology
+            The precomputed topology of `object_mesh`. If not given, it will be computed.
+        mesh_geometry: MeshGeometry
+            The precomputed geometry of `object_mesh`. If not given, it will be computed once the GPC-system is re-used
+            for another source point (see `soft_clear`).
+
+        Returns
+        -------
+        GPCSystem:
+            The GPC-system described by `state`.
+        """
+        gpc_system = cls.__new__(cls)
+        gpc_system.object_mesh = object_mesh
+        if topology is None:
+            topology = MeshTopology(object_mesh.faces, object_mesh.vertices.shape[0])
+        gpc_system.topology = topology
+        gpc_system.mesh_geometry = mesh_geometry
+        gpc_system.statistics = None
+        gpc_system.face_recursion_depth = 0
+        gpc_system.assign_state(state)
+        return gpc_system
+
+    def assign_state(self, state):
+        """Overwrite the GPC-system with a state returned by `get_state`.
+
+        Parameters
+        ----------
+        state: dict
+            The state of a GPC-system on the same mesh.
+        """
+        self.source_point = state["source_point"]
+        self.truncation_radius = state.get("truncation_radius")
+
+        # Expand sparse coordinates, keeping their floating point type
+        coordinates = []
+        for key, fill_value in zip(STATE_COORDINATES, [np.inf, -1.0, np.inf, np.inf]):
+            dense = np.full((state["n_vertices"],), fill_value, dtype=state[key].dtype)
+            dense[state["vertex_indices"]] = state[key]
+            coordinates.append(dense)
+        radial_coordinates, angular_coordinates, x_coordinates, y_coordinates = coordinates
+
+        self.assign(
+            radial_coordinates,
+            angular_coordinates,
+            state["edges"],
+            state["faces"],
+            x_coordinates=x_coordinates,
+            y_coordinates=y_coordinates,
+            cell_size=state["cell_size"]
+        )
 
     def add_edge(self, edge):
         """Add an edge to the GPC-system
@@ -116,17 +367,9 @@ class GPCSystem:
         if np.inf in [self.x_coordinates[edge[0]], self.x_coordinates[edge[1]]]:
             raise RuntimeError(f"Edge {edge} lacks GPC: {[self.x_coordinates[edge[0]], self.x_coordinates[edge[1]]]}")
 
-        edge = list(np.sort(edge))
-        # Check if edge was seen once
-        if edge not in self.edges[-1]:
-            self.edges[-1].append(edge)
-        for vertex in edge:
-            # Check whether node already exists
-            if vertex not in self.edges.keys():
-                self.edges[vertex] = []
-            # Check whether edge is already saved under node
-            if edge not in self.edges[vertex]:
-                self.edges[vertex].append(edge)
+        edge = sorted(edge)
+        if self.edges.add(edge):
+            self.edge_grid.add(edge)
 
     def add_face(self, face):
         """Add a face to the GPC-system
@@ -136,25 +379,24 @@ class GPCSystem:
         face: np.ndarray
             The face to add
         """
-        face = list(np.sort(face))
-        if face not in self.faces[(-1, -1)]:
-            self.faces[(-1, -1)].append(face)
+        if self.statistics is not None:
+            self.face_recursion_depth += 1
+            self.statistics["max_face_recursion_depth"] = max(
+                self.statistics["max_face_recursion_depth"], self.face_recursion_depth
+            )
+        face = sorted(face)
+        self.faces.add(face)
         face_edges = [
             [face[0], face[1]], [face[1], face[2]], [face[0], face[2]]
         ]
         for edge in face_edges:
-            if (edge[0], edge[1]) not in self.faces.keys():
-                self.faces[(edge[0], edge[1])] = [face]
-            elif face not in self.faces[(edge[0], edge[1])]:
-                self.faces[(edge[0], edge[1])].append(face)
-
             # Recursively check all edges on whether their 2nd face is entirely describable with GPCs
-            for new_face in get_faces_of_edge(edge, self.object_mesh)[1]:
+            for new_face in self.topology.get_faces_of_edge(edge)[1]:
                 new_face = np.sort(new_face)
                 # If all face coordinates are known and face has not been seen, then update GPC-system with `new_face`
                 if (not np.array_equal(new_face, face)
                     and not np.any(np.isinf(self.radial_coordinates[new_face]))
-                    and list(new_face) not in self.faces[(-1, -1)]):
+                    and not self.faces.contains(new_face)):
                     self.update(
                         new_face[0],
                         self.radial_coordinates[new_face[0]],
@@ -163,6 +405,8 @@ class GPCSystem:
                         [new_face[2]],
                         update=False
                     )
+        if self.statistics is not None:
+            self.face_recursion_depth -= 1
 
     def update(self, vertex_i, rho_i, theta_i, vertex_j, k_vertices, plot_name="", update=True):
         """Update the GPC-system while preventing to edge intersections
@@ -189,6 +433,8 @@ class GPCSystem:
         bool:
             Whether the update succeeded, i.e. the update on `vertex_i` did not cause intersections
         """
+        if self.statistics is not None:
+            self.statistics["update_calls"] += 1
         for vertex_k in [k for k in k_vertices if not np.isinf(self.radial_coordinates[k])]:
             # Sort vertex indices such that edge-cache does not store edges twice
             sorted_face = np.sort([vertex_i, vertex_j, vertex_k])
@@ -200,10 +446,10 @@ class GPCSystem:
                 [sorted_face[0], sorted_face[1]], [sorted_face[1], sorted_face[2]], [sorted_face[0], sorted_face[2]]
             ]
 
-            if vertex_i in self.edges.keys():
-                edges_of_interest = self.edges[vertex_i].copy()
+            if vertex_i in self.edges:
+                edges_of_interest = self.edges[vertex_i]
             else:
-                self.edges[vertex_i] = []
+                self.edges.reset_vertex(vertex_i)
                 edges_of_interest = []
 
             for edge in updated_face_edges:
@@ -225,7 +471,11 @@ class GPCSystem:
                 else:
                     edge_snd_vertex = [self.x_coordinates[edge[1]], self.y_coordinates[edge[1]]]
 
+                if self.statistics is not None:
+                    self.statistics["intersection_tests"] += 1
                 if self.line_segment_intersection(edge_fst_vertex, edge_snd_vertex):
+                    if self.statistics is not None:
+                        self.statistics["intersection_rejections"] += 1
                     # Return 'False' to indicate failed update due to intersection
                     return False
 
@@ -238,6 +488,7 @@ class GPCSystem:
 
                 self.x_coordinates[vertex_i] = x
                 self.y_coordinates[vertex_i] = y
+                self.edge_grid.move_vertex(int(vertex_i))
 
             ################
             # Add new edges
@@ -318,9 +569,11 @@ class GPCSystem:
         """
         x1, y1 = edge_fst_vertex[0], edge_fst_vertex[1]
         x2, y2 = edge_snd_vertex[0], edge_snd_vertex[1]
-        all_edges = np.array(self.edges[-1])
-        xs3, ys3 = self.x_coordinates[all_edges[:, 0]], self.y_coordinates[all_edges[:, 0]]
-        xs4, ys4 = self.x_coordinates[all_edges[:, 1]], self.y_coordinates[all_edges[:, 1]]
+        # Only edges close to the new line segment can intersect it
+        segments = self.edge_grid.query(edge_fst_vertex, edge_snd_vertex)
+        if segments.shape[0] == 0:
+            return False
+        xs3, ys3, xs4, ys4 = segments.T
 
         denominators = (x1 - x2) * (ys3 - ys4) - (y1 - y2) * (xs3 - xs4)
         if 0. in denominators:
@@ -353,7 +606,7 @@ class GPCSystem:
             Whether to translate geodesic polar coordinates into cartesian.
         """
         gpc_system_triangles = self.get_gpc_system()
-        gpc_system_triangles = gpc_system_triangles[np.array(self.faces[(-1, -1)])]
+        gpc_system_triangles = gpc_system_triangles[self.faces[(-1, -1)]]
         if in_cart:
             return gpc_systems_into_cart(gpc_system_triangles)
         else:
@@ -0,0 +1,362 @@
+import math
+import numpy as np
+
+
+class EdgeCache:
+    def __init__(self, n_vertices, capacity=64):
+        """Edge-cache of a GPC-system.
+
+        Remembers all edges captured by a GPC-system and all edges to a vertex. Edges are identified by the integer key
+        `edge[0] * n_vertices + edge[1]` of the sorted edge, which allows for constant time membership checks and
+        insertions. All edges are stored in a growable numpy-buffer in the order of their insertion.
+
+        Indexing mirrors the former dictionary-based cache:
+            - `edge_cache[-1]` returns a (n_edges, 2)-array view of all captured edges.
+            - `edge_cache[vertex]` returns the list of captured edges of `vertex`.
+
+        Parameters
+        ----------
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+        capacity: int
+            The initial capacity of the edge-buffer.
+        """
+        self.n_vertices = n_vertices
+        self._buffer = np.empty((capacity, 2), dtype=np.int64)
+        self._size = 0
+        self._rows = {}
+        self._vertex_edges = {}
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, vertex):
+        return vertex == -1 or vertex in self._vertex_edges
+
+    def __getitem__(self, vertex):
+        if vertex == -1:
+            return self._buffer[:self._size]
+        return list(self._vertex_edges[vertex].values())
+
+    def key(self, edge):
+        """Returns the integer key of a sorted edge
+
+        Parameters
+        ----------
+        edge: list
+            The sorted edge
+
+        Returns
+        -------
+        int:
+            The key of the edge
+        """
+        return int(edge[0]) * self.n_vertices + int(edge[1])
+
+    def contains(self, edge):
+        """Checks whether a sorted edge has been captured
+
+        Parameters
+        ----------
+        edge: list
+            The sorted edge
+
+        Returns
+        -------
+        bool:
+            Whether the edge is contained in the edge-cache.
+        """
+        return self.key(edge) in self._rows
+
+    def clear(self):
+        """Forgets all captured edges while keeping the allocated edge-buffer"""
+        self._size = 0
+        self._rows = {}
+        self._vertex_edges = {}
+
+    def reset_vertex(self, vertex):
+        """Forgets all edges stored under a vertex (the edge remains captured by the GPC-system)
+
+        Parameters
+        ----------
+        vertex: int
+            The vertex to reset
+        """
+        self._vertex_edges[vertex] = {}
+
+    def add(self, edge):
+        """Adds a sorted edge to the edge-cache
+
+        Parameters
+        ----------
+        edge: list
+            The sorted edge to add
+
+        Returns
+        -------
+        bool:
+            Whether the edge has not been captured before.
+        """
+        key = self.key(edge)
+        is_new = key not in self._rows
+        if is_new:
+            if self._size == self._buffer.shape[0]:
+                self._buffer = np.concatenate([self._buffer, np.empty_like(self._buffer)])
+            self._buffer[self._size] = edge
+            self._rows[key] = self._size
+            self._size += 1
+        for vertex in edge:
+            vertex_edges = self._vertex_edges.setdefault(int(vertex), {})
+            if key not in vertex_edges:
+                vertex_edges[key] = [int(edge[0]), int(edge[1])]
+        return is_new
+
+
+class FaceCache:
+    def __init__(self, n_vertices, capacity=64):
+        """Face-cache of a GPC-system.
+
+        Remembers all faces captured by a GPC-system and all captured faces to a sorted edge. Faces are identified by
+        the integer key of the sorted face, which allows for constant time membership checks and insertions. All faces
+        are stored in a growable numpy-buffer in the order of their insertion.
+
+        Indexing mirrors the former dictionary-based cache:
+            - `face_cache[(-1, -1)]` returns a (n_faces, 3)-array view of all captured faces.
+            - `face_cache[(a, b)]` returns the list of captured faces of the sorted edge `(a, b)`.
+
+        Parameters
+        ----------
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+        capacity: int
+            The initial capacity of the face-buffer.
+        """
+        self.n_vertices = n_vertices
+        self._buffer = np.empty((capacity, 3), dtype=np.int64)
+        self._size = 0
+        self._rows = {}
+        self._edge_faces = {}
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, edge):
+        if edge[0] == -1:
+            return True
+        return int(edge[0]) * self.n_vertices + int(edge[1]) in self._edge_faces
+
+    def __getitem__(self, edge):
+        if edge[0] == -1:
+            return self._buffer[:self._size]
+        return self._edge_faces[int(edge[0]) * self.n_vertices + int(edge[1])]
+
+    def key(self, face):
+        """Returns the integer key of a sorted face
+
+        Parameters
+        ----------
+        face: list
+            The sorted face
+
+        Returns
+        -------
+        int:
+            The key of the face
+        """
+        return (int(face[0]) * self.n_vertices + int(face[1])) * self.n_vertices + int(face[2])
+
+    def contains(self, face):
+        """Checks whether a sorted face has been captured
+
+        Parameters
+        ----------
+        face: list
+            The sorted face
+
+        Returns
+        -------
+        bool:
+            Whether the face is contained in the face-cache.
+        """
+        return self.key(face) in self._rows
+
+    def clear(self):
+        """Forgets all captured faces while keeping the allocated face-buffer"""
+        self._size = 0
+        self._rows = {}
+        self._edge_faces = {}
+
+    def add(self, face):
+        """Adds a sorted face to the face-cache
+
+        Parameters
+        ----------
+        face: list
+            The sorted face to add
+
+        Returns
+        -------
+        bool:
+            Whether the face has not been captured before.
+        """
+        key = self.key(face)
+        is_new = key not in self._rows
+        if is_new:
+            if self._size == self._buffer.shape[0]:
+                self._buffer = np.concatenate([self._buffer, np.empty_like(self._buffer)])
+            self._buffer[self._size] = face
+            self._rows[key] = self._size
+            self._size += 1
+        face = [int(face[0]), int(face[1]), int(face[2])]
+        for a, b in [(face[0], face[1]), (face[1], face[2]), (face[0], face[2])]:
+            edge_faces = self._edge_faces.setdefault(a * self.n_vertices + b, [])
+            if face not in edge_faces:
+                edge_faces.append(face)
+        return is_new
+
+
+class EdgeGrid:
+    def __init__(self, x_coordinates, y_coordinates, cell_size, capacity=64):
+        """Uniform grid over the cartesian coordinates of the edges captured by a GPC-system.
+
+        Each edge is registered in all grid cells that overlap its bounding box. A line segment can only intersect
+        edges whose bounding boxes overlap its own bounding box, such that intersection tests only need to consider the
+        edges within the cells that are covered by the line segment. The grid is updated incrementally whenever an edge
+        is added or a vertex changes its coordinates. Edges with unknown (infinite) coordinates are not registered.
+        Added edges are registered lazily, i.e. with the next query or vertex movement.
+
+        Parameters
+        ----------
+        x_coordinates: np.ndarray
+            The x-coordinates of the GPC-system. The array is referenced, not copied.
+        y_coordinates: np.ndarray
+            The y-coordinates of the GPC-system. The array is referenced, not copied.
+        cell_size: float
+            The side length of a grid cell. Cells of side length one are used if it is not positive and finite.
+        capacity: int
+            The initial capacity of the edge- and segment-buffers.
+        """
+        self.x_coordinates = x_coordinates
+        self.y_coordinates = y_coordinates
+        self.cell_size = cell_size
+        # Coinciding vertices around the source point yield a cell size of zero
+        self._cell_scale = cell_size if math.isfinite(cell_size) and cell_size > 0 else 1.
+        self._edges = np.empty((capacity, 2), dtype=np.int64)
+        # Persistent cartesian coordinates (x1, y1, x2, y2) of each edge
+        self.segments = np.empty((capacity, 4))
+        self._size = 0
+        self._edge_cells = []
+        self._vertex_rows = {}
+        self._cells = {}
+        self._n_registered = 0
+        self._pending = []
+
+    def __len__(self):
+        return self._size
+
+    def _cell_range(self, x_min, y_min, x_max, y_max):
+        return (
+            math.floor(x_min / self._cell_scale),
+            math.floor(y_min / self._cell_scale),
+            math.floor(x_max / self._cell_scale),
+            math.floor(y_max / self._cell_scale)
+        )
+
+    def _register(self, row):
+        # Remove edge from previously covered cells
+        for cell in self._edge_cells[row]:
+            self._cells[cell].discard(row)
+        if self._edge_cells[row]:
+            self._n_registered -= 1
+        self._edge_cells[row] = []
+
+        # Update the segment coordinates and insert edge into covered cells
+        vertex_1, vertex_2 = self._edges[row]
+        segment = (
+            float(self.x_coordinates[vertex_1]), float(self.y_coordinates[vertex_1]),
+            float(self.x_coordinates[vertex_2]), float(self.y_coordinates[vertex_2])
+        )
+        self.segments[row] = segment
+        if not all(math.isfinite(c) for c in segment):
+            return
+        cx_min, cy_min, cx_max, cy_max = self._cell_range(
+            min(segment[0], segment[2]), min(segment[1], segment[3]),
+            max(segment[0], segment[2]), max(segment[1], segment[3])
+        )
+        for cx in range(cx_min, cx_max + 1):
+            for cy in range(cy_min, cy_max + 1):
+                self._cells.setdefault((cx, cy), set()).add(row)
+                self._edge_cells[row].append((cx, cy))
+        self._n_registered += 1
+
+    def _flush(self):
+        for row in self._pending:
+            self._register(row)
+        self._pending = []
+
+    def add(self, edge):
+        """Adds an edge to the grid
+
+        Parameters
+        ----------
+        edge: list
+            The edge to add
+        """
+        if self._size == self._edges.shape[0]:
+            self._edges = np.concatenate([self._edges, np.empty_like(self._edges)])
+            self.segments = np.concatenate([self.segments, np.empty_like(self.segments)])
+        row = self._size
+        self._edges[row] = edge
+        self._edge_cells.append([])
+        self._size += 1
+        for vertex in edge:
+            self._vertex_rows.setdefault(int(vertex), []).append(row)
+        self._pending.append(row)
+
+    def move_vertex(self, vertex):
+        """Updates all edges of a vertex after its coordinates have changed
+
+        Parameters
+        ----------
+        vertex: int
+            The vertex which has been moved
+        """
+        self._flush()
+        for row in self._vertex_rows.get(vertex, []):
+            self._register(row)
+
+    def query(self, edge_fst_vertex, edge_snd_vertex):
+        """Returns the segments of all edges which might intersect a given line segment
+
+        Parameters
+        ----------
+        edge_fst_vertex: np.ndarray
+            The cartesian coordinates of the first vertex of the line segment
+        edge_snd_vertex: np.ndarray
+            The cartesian coordinates of the second vertex of the line segment
+
+        Returns
+        -------
+        np.ndarray:
+            A 2D-array containing the segments (x1, y1, x2, y2) of all edges whose bounding box overlaps the bounding
+            box of the given line segment.
+        """
+        self._flush()
+        x1, y1 = float(edge_fst_vertex[0]), float(edge_fst_vertex[1])
+        x2, y2 = float(edge_snd_vertex[0]), float(edge_snd_vertex[1])
+        if not all(math.isfinite(c) for c in (x1, y1, x2, y2)):
+            return self.segments[:self._size]
+
+        cx_min, cy_min, cx_max, cy_max = self._cell_range(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        if (cx_max - cx_min + 1) * (cy_max - cy_min + 1) > self._n_registered:
+            # Line segment covers more cells than there are edges
+            rows = [row for row in range(self._size) if self._edge_cells[row]]
+        else:
+            rows = set()
+            for cx in range(cx_min, cx_max + 1):
+                for cy in range(cy_min, cy_max + 1):
+                    cell = self._cells.get((cx, cy))
+                    if cell:
+                        rows.update(cell)
+            rows = list(rows)
+        return self.segments[rows]
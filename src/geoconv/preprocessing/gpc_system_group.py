@@ -1,45 +1,993 @@
-from geoconv.preprocessing.gpc_system import GPCSystem
-from geoconv.preprocessing.gpc_system_utils import compute_distance_and_angle
-from geoconv.utils.misc import get_neighbors
+from geoconv.preprocessing.gpc_statistics import GPCStatistics
+from geoconv.preprocessing.barycentric_coordinates import polar_to_cart
+from geoconv.preprocessing.gpc_system import GPC_SYSTEM_COUNTERS, GPCSystem, cast_state, compute_initial_coordinates
+from geoconv.preprocessing.heat_method import HeatMethod
+from geoconv.preprocessing.indexed_heap import IndexedMinHeap
+from geoconv.preprocessing.gpc_system_utils import compute_distance_and_angle, compute_u_ijk_and_angle
+from geoconv.preprocessing.lazy_gpc_systems import LazyGPCSystems
+from geoconv.preprocessing.mesh_geometry import GEOMETRY_ARRAYS, MeshGeometry
+from geoconv.preprocessing.mesh_topology import MeshTopology
+from geoconv.preprocessing.packed_gpc_systems import PackedGPCSystems
+from geoconv.preprocessing.vectorized_gpc_systems import VectorizedGPCSystems
 
-from multiprocessing import Pool
+from functools import partial
+from multiprocessing import Pool, resource_tracker, shared_memory
+from multiprocessing.pool import ThreadPool
 from tqdm import tqdm
 
+import c_extension
 import numpy as np
+import threading
+import hashlib
 import warnings
-import heapq
+import gc
+import trimesh
+import pickle
+import json
+import time
+import os
+
+
+# The GPC-system group of a worker process, the shared memory blocks it refers to and the topology of its mesh
+_worker_group = None
+_worker_mesh = None
+_worker_shared_memory = []
+_worker_topology = (None, None)
+
+
+def _share_array(array):
+    """Copies an array into a new shared memory block
+
+    Parameters
+    ----------
+    array: np.ndarray
+        The array to share
+
+    Returns
+    -------
+    (shared_memory.SharedMemory, tuple):
+        The shared memory block and the name, shape and dtype that are required to attach to it.
+    """
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _get_worker_group(shared_arrays, group_kwargs):
+    """Returns the GPC-system group of a worker process for a mesh whose arrays reside in shared memory
+
+    The group is re-created once a worker receives a chunk of another mesh. The mesh topology is only re-computed if
+    the faces have changed, i.e. workers of a `GPCSystemPool` compute it once for all meshes with identical
+    connectivity. The mesh geometry is shared read-only among all workers.
+
+    Parameters
+    ----------
+    shared_arrays: dict
+        Name, shape and dtype of the shared faces and geometry arrays (see `GEOMETRY_ARRAYS`).
+    group_kwargs: dict
+        Keyword arguments for the `GPCSystemGroup` of the worker.
+
+    Returns
+    -------
+    GPCSystemGroup:
+        The GPC-system group of the worker for the given mesh.
+    """
+    global _worker_group, _worker_mesh, _worker_topology
+    mesh = tuple(name for name, _, _ in shared_arrays.values())
+    if mesh == _worker_mesh:
+        return _worker_group
+
+    # Release the arrays of the previous mesh before detaching from its shared memory
+    _worker_group, _worker_mesh = None, None
+    gc.collect()
+    for shm in _worker_shared_memory:
+        shm.close()
+    _worker_shared_memory.clear()
+
+    arrays = {}
+    for key, (name, shape, dtype) in shared_arrays.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _worker_shared_memory.append(shm)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    faces_name, topology = _worker_topology
+    if faces_name != shared_arrays["faces"][0]:
+        # The topology keeps a copy of the faces, such that it outlives the shared memory block
+        topology = MeshTopology(arrays["faces"].copy(), arrays["vertices"].shape[0])
+        _worker_topology = (shared_arrays["faces"][0], topology)
+    object_mesh = trimesh.Trimesh(
+        vertices=arrays["vertices"], faces=topology.faces, vertex_normals=arrays["vertex_normals"], process=False
+    )
+    _worker_group = GPCSystemGroup(
+        object_mesh,
+        topology=topology,
+        mesh_geometry=MeshGeometry.from_arrays(arrays, topology),
+        **group_kwargs
+    )
+    _worker_mesh = mesh
+    return _worker_group
+
+
+def _compute_chunk(chunk, u_max, budget=None, gpc_system_group=None, shared_mesh=None):
+    if gpc_system_group is None:
+        gpc_system_group = _get_worker_group(*shared_mesh)
+    source_points, warm_start_faces = chunk
+    return gpc_system_group.compute_gpc_system_states(
+        source_points, u_max, warm_start_faces=warm_start_faces, budget=budget
+    )
+
+
+def _load_checkpoints(checkpoint_dir, properties):
+    """Loads all GPC-system states from a checkpoint directory
+
+    Parameters
+    ----------
+    checkpoint_dir: str
+        The checkpoint directory. It is created if it does not exist.
+    properties: dict
+        The properties of the current computation (e.g. the maximal radius). They must match the properties with
+        which the checkpoints have been written.
+
+    Returns
+    -------
+    (list, int):
+        The loaded states and the number of checkpoint files.
+    """
+    properties_path = f"{checkpoint_dir}/checkpoint.json"
+    if not os.path.exists(checkpoint_dir):
+        os.makedirs(checkpoint_dir)
+    if os.path.exists(properties_path):
+        with open(properties_path, "r") as properties_file:
+            checkpoint_properties = json.load(properties_file)
+        if checkpoint_properties != properties:
+            raise RuntimeError(
+                f"The checkpoints in '{checkpoint_dir}' have been computed with {checkpoint_properties}, which differs "
+                f"from the current configuration {properties}."
+            )
+    else:
+        with open(properties_path, "w") as properties_file:
+            json.dump(properties, properties_file, indent=4)
+
+    # Incomplete checkpoints only exist as temporary files, which are ignored
+    checkpoint_files = [f for f in os.listdir(checkpoint_dir) if f.startswith("states_") and f.endswith(".pkl")]
+    states = []
+    for checkpoint_file in checkpoint_files:
+        with open(f"{checkpoint_dir}/{checkpoint_file}", "rb") as f:
+            states.extend(pickle.load(f))
+    return states, len(checkpoint_files)
+
+
+def _write_checkpoint(checkpoint_dir, checkpoint_number, states):
+    """Atomically writes GPC-system states into a new checkpoint file
+
+    Parameters
+    ----------
+    checkpoint_dir: str
+        The checkpoint directory.
+    checkpoint_number: int
+        The number of the checkpoint file.
+    states: list
+        The GPC-system states to store.
+    """
+    checkpoint_path = f"{checkpoint_dir}/states_{checkpoint_number}.pkl"
+    with open(f"{checkpoint_path}.tmp", "wb") as f:
+        pickle.dump(states, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
+
+
+def get_orientations(triangles):
+    """Computes the orientations of 2D-triangles
+
+    Parameters
+    ----------
+    triangles: np.ndarray
+        A 3D-array of shape (n_triangles, 3, 2) containing the cartesian coordinates of the triangles.
+
+    Returns
+    -------
+    np.ndarray:
+        The signs of the signed areas of the triangles.
+    """
+    edges_1 = triangles[:, 1] - triangles[:, 0]
+    edges_2 = triangles[:, 2] - triangles[:, 0]
+    return np.sign(edges_1[:, 0] * edges_2[:, 1] - edges_1[:, 1] * edges_2[:, 0])
+
+
+def get_warm_start_faces(gpc_system):
+    """Extracts the data of a GPC-system that is required to warm start the GPC-system of the next frame
+
+    Parameters
+    ----------
+    gpc_system: [GPCSystem, PackedGPCSystem]
+        The GPC-system of the previous frame.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray):
+        The captured faces in the order of their capture and their orientations.
+    """
+    return (
+        np.array(gpc_system.faces[(-1, -1)], dtype=np.int64),
+        get_orientations(gpc_system.get_gpc_triangles(in_cart=True))
+    )
+
+
+def truncate_state(state, u_max):
+    """Restricts the state of a GPC-system to a smaller radius (see `GPCSystem.get_state`)
+
+    Since GPC-systems are computed in increasing order of radial distances, the GPC-system for a smaller radius is
+    (up to deviations at its border, see `GPCSystemGroup.compute`) given by the vertices within that radius and the
+    edges and faces between them.
+
+    Parameters
+    ----------
+    state: dict
+        The state of a GPC-system.
+    u_max: float
+        The smaller radius.
+
+    Returns
+    -------
+    dict:
+        The state of the GPC-system that only contains vertices with a radial coordinate smaller than `u_max`.
+    """
+    keep = state["radial_coordinates"] < u_max
+    vertex_indices = state["vertex_indices"][keep]
+    truncated_state = dict(state)
+    for key in ["vertex_indices", "radial_coordinates", "angular_coordinates", "x_coordinates", "y_coordinates"]:
+        truncated_state[key] = state[key][keep]
+    truncated_state["edges"] = state["edges"][np.isin(state["edges"], vertex_indices).all(axis=-1)]
+    truncated_state["faces"] = state["faces"][np.isin(state["faces"], vertex_indices).all(axis=-1)]
+    return truncated_state
+
+
+def limit_state(state, max_vertices=None, max_faces=None):
+    """Truncates the state of a GPC-system to the largest radius that respects the given vertex- and face-counts
+
+    Parameters
+    ----------
+    state: dict
+        The state of a GPC-system (see `GPCSystem.get_state`).
+    max_vertices: int
+        The maximal amount of vertices of the GPC-system.
+    max_faces: int
+        The maximal amount of faces of the GPC-system.
+
+    Returns
+    -------
+    dict:
+        The (truncated) state. The radius of a truncation is stored under 'truncation_radius'.
+    """
+    radius = np.inf
+    if max_vertices is not None and state["vertex_indices"].shape[0] > max_vertices:
+        radius = np.sort(state["radial_coordinates"])[max_vertices]
+    if max_faces is not None and state["faces"].shape[0] > max_faces:
+        local_faces = np.searchsorted(state["vertex_indices"], state["faces"])
+        face_radii = np.sort(state["radial_coordinates"][local_faces].max(axis=-1))
+        radius = min(radius, face_radii[max_faces])
+    if radius == np.inf:
+        return state
+    state = truncate_state(state, radius)
+    if state.get("truncation_radius") is None or radius < state["truncation_radius"]:
+        state["truncation_radius"] = float(radius)
+    return state
+
+
+class GPCSystemPool:
+    def __init__(self, processes):
+        """A pool of worker processes which computes the GPC-systems of multiple meshes.
+
+        Starting worker processes and computing the mesh topology within each worker is costly compared to the
+        GPC-systems of a small mesh. A `GPCSystemPool` keeps its workers alive across all `GPCSystemGroup`s which are
+        given the pool (see the `pool`-argument of `GPCSystemGroup`). The faces of a mesh are published once per
+        topology, such that workers only re-compute the topology if the connectivity changes.
+
+        The pool should be closed once it is not needed anymore (see `close`), e.g. by using it as a context manager.
+        If a computation within the pool is interrupted, its workers are terminated, since queued tasks still refer to
+        the shared mesh. The pool cannot be used afterward.
+
+        Parameters
+        ----------
+        processes: int
+            The amount of worker processes.
+        """
+        self.processes = processes
+        # Workers have to inherit the resource tracker. Otherwise, each worker starts its own one, which unlinks the
+        # shared memory blocks that the worker attached to once the worker is stopped.
+        resource_tracker.ensure_running()
+        self.pool = Pool(processes)
+        self.terminated = False
+        self.topology = None
+        self._faces_memory = None
+        self._shared_faces = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def share_topology(self, topology):
+        """Publishes the faces of a topology to the workers, unless they have been published before.
+
+        Parameters
+        ----------
+        topology: MeshTopology
+            The topology of the mesh whose GPC-systems shall be computed next.
+
+        Returns
+        -------
+        tuple:
+            The name, shape and dtype of the shared faces.
+        """
+        if self.topology is None or (topology is not self.topology and not self.topology.matches(topology.faces)):
+            self._release_faces()
+            self._faces_memory, self._shared_faces = _share_array(topology.faces)
+        self.topology = topology
+        return self._shared_faces
+
+    def imap_unordered(self, func, iterable):
+        """Applies a function to all elements of an iterable within the workers (see `Pool.imap_unordered`)"""
+        if self.terminated:
+            raise RuntimeError(
+                "The GPC-system pool has been terminated, e.g. because a computation has been interrupted. Create a "
+                "new 'GPCSystemPool'."
+            )
+        return self.pool.imap_unordered(func, iterable)
+
+    def terminate(self):
+        """Stops the workers immediately. The pool cannot be used afterward."""
+        self.terminated = True
+        self.pool.terminate()
+        self._release_faces()
+
+    def close(self):
+        """Waits until the workers finished their tasks and stops them"""
+        self.pool.close()
+        self.pool.join()
+        self._release_faces()
+
+    def _release_faces(self):
+        if self._faces_memory is not None:
+            self._faces_memory.close()
+            self._faces_memory.unlink()
+            self._faces_memory, self._shared_faces = None, None
 
 
 class GPCSystemGroup:
-    def __init__(self, object_mesh, eps=0.000001, use_c=True, processes=1):
+    def __init__(self,
+                 object_mesh,
+                 eps=0.000001,
+                 use_c=True,
+                 processes=1,
+                 topology=None,
+                 use_c_engine=False,
+                 backend="processes",
+                 chunk_size=None,
+                 collect_statistics=False,
+                 mesh_geometry=None,
+                 dtype=np.float64,
+                 pool=None):
+        """Computes and stores the GPC-systems of all vertices of a mesh.
+
+        Parameters
+        ----------
+        object_mesh: trimesh.Trimesh
+            A loaded object mesh.
+        eps: float
+            The minimal relative improvement of a radial coordinate to update a vertex.
+        use_c: bool
+            A flag whether to use the c-extension for the update computations.
+        processes: int
+            The amount of concurrent processes (or threads) that compute GPC-systems. Without a `pool`, a single
+            process computes the GPC-systems within the calling process.
+        topology: MeshTopology
+            The precomputed topology of `object_mesh`. If not given, it will be computed. A topology can be shared by
+            all meshes with identical faces.
+        use_c_engine: bool
+            A flag whether to compute entire GPC-systems within the c-extension. The Python implementation remains the
+            reference implementation and is used whenever update steps shall be plotted. The engine allocates its
+            buffers once per thread and does not require a propagated `GPCSystem` (see `compute_engine_state`).
+        backend: str
+            Either 'processes', 'threads', 'vectorized' or 'heat'. The 'processes'-backend copies the mesh into each
+            worker process. The 'threads'-backend shares the mesh and its topology among a pool of threads. The
+            c-extension releases the GIL while computing, such that threads scale across cores in combination with
+            `use_c_engine=True`. Each thread then spends most of its time in the engine, using its own buffers. The
+            'vectorized'-backend propagates many GPC-systems in lockstep with numpy (see `VectorizedGPCSystems`). The
+            'heat'-backend does not propagate GPC-systems, but approximates them for many source points at once with
+            prefactorized sparse solves (see `HeatMethod`). It is much faster, but less accurate.
+        chunk_size: int
+            The amount of source points that are sent to a worker at once. Workers fetch new chunks as soon as they
+            finished their previous one. If not given, the vertices are divided into 16 chunks per worker. For the
+            'vectorized'- and 'heat'-backends, this is the amount of source points per batch (256 if not given).
+        collect_statistics: bool
+            Whether to record statistics for each GPC-system while computing (see `GPCStatistics`). The statistics of
+            the last computation are stored in `statistics`. Only the propagating backends record statistics. The
+            c-extension engine only records wall times and system sizes, its counters are NaN.
+        mesh_geometry: MeshGeometry
+            The precomputed geometry of `object_mesh` (see `MeshGeometry`). If not given, it will be computed.
+        dtype: np.dtype
+            The floating point type in which the coordinates of completed GPC-systems are stored, e.g. `np.float32` to
+            halve their memory footprint. GPC-systems are always propagated in `np.float64` and only cast once they
+            are complete (see `cast_state`).
+        pool: GPCSystemPool
+            If given, the 'processes'-backend computes GPC-systems within the workers of this pool instead of starting
+            new worker processes for each computation. The pool is not closed by the group and `processes` is ignored.
+        """
+        if backend not in ["processes", "threads", "vectorized", "heat"]:
+            raise RuntimeError(
+                f"Unknown backend '{backend}'. Select a backend from: ['processes', 'threads', 'vectorized', 'heat']"
+            )
         self.object_mesh = object_mesh
+        if topology is None:
+            topology = MeshTopology(object_mesh.faces, object_mesh.vertices.shape[0])
+        elif not topology.matches(object_mesh.faces, object_mesh.vertices.shape[0]):
+            raise RuntimeError("The given topology has been computed for a mesh with different faces.")
+        self.topology = topology
+        if mesh_geometry is None:
+            mesh_geometry = MeshGeometry(object_mesh, topology=topology)
+        self.mesh_geometry = mesh_geometry
         self.eps = eps
         self.use_c = use_c
         self.processes = processes
+        self.use_c_engine = use_c_engine
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.batch_engine = None
+        # The buffers of the c-extension engine are allocated once per thread (see `get_engine_workspace`)
+        self._engine_workspaces = threading.local()
+        self.collect_statistics = collect_statistics
+        self.dtype = np.dtype(dtype)
+        self.pool = pool
+        if pool is not None:
+            self.processes = pool.processes
+        self.statistics = None
+        self.truncation_radii = {}
         self.object_mesh_gpc_systems = None
+        # The GPC-systems for which the reverse index has been built, the sorted vertices, their GPC-systems and the
+        # offsets of each vertex (see `get_reverse_index`)
+        self._reverse_index = (None, None, None, None)
 
-    def compute(self, u_max=.04):
+    def compute(self,
+                u_max=.04,
+                packed=False,
+                checkpoint_dir="",
+                checkpoint_interval=600.,
+                warm_start=None,
+                max_vertices=None,
+                max_faces=None,
+                time_budget=None):
         """Computes geodesic polar coordinates for all vertices within an object mesh.
 
+        Parameters
+        ----------
+        u_max: [float, list]
+            The maximal radius for each GPC-system. If a list of radii is given, the GPC-systems are computed once for
+            the largest radius and restricted to each of the given radii (see `truncate_state`). Only the GPC-systems
+            of the largest radius are exact. The others approximate GPC-systems computed with the smaller radius,
+            since the propagations to both radii can settle the vertices close to the smaller radius differently. For
+            example, on a noisy icosphere with 642 vertices and the radii [0.3, 0.5], deviations are restricted to
+            vertices whose radial coordinates exceed 85% of the smaller radius. At most one such vertex per GPC-system
+            (and the faces that contain it) is missing or added, and the coordinates of the other vertices differ by
+            at most 1% of the smaller radius (radial) and 0.1 radians (angular).
+        packed: bool
+            Whether to store the GPC-systems as `PackedGPCSystems`, which only keeps the coordinates of the vertices
+            and the faces reached by each GPC-system. Otherwise, an array of `GPCSystem`-objects is stored.
+        checkpoint_dir: str
+            If given, completed GPC-systems are periodically written into this directory. GPC-systems found in this
+            directory are not computed again, which allows to resume an interrupted computation. Checkpoints of another
+            mesh (see `get_mesh_fingerprint`) or of another configuration are rejected with a `RuntimeError`.
+        checkpoint_interval: float
+            The minimal amount of seconds between two checkpoints.
+        warm_start: [np.ndarray, PackedGPCSystems]
+            The GPC-systems of a previous frame of a mesh sequence with identical connectivity. They are used to warm
+            start the computation of the GPC-systems (see `compute_gpc_system`). Warm-started GPC-systems are only
+            approximations of the GPC-systems computed from scratch, as they keep the faces of the previous frame
+            (see `replay_faces`). For example, on a noisy icosphere with 642 vertices and `u_max=0.3` whose vertices
+            have been moved by Gaussian noise with a standard deviation of 0.002, the radial coordinates differ by up
+            to 2.3% of `u_max`.
+        max_vertices: int
+            If given, GPC-systems with more vertices are truncated to the largest radius that respects this limit.
+        max_faces: int
+            If given, GPC-systems with more faces are truncated to the largest radius that respects this limit.
+        time_budget: float
+            If given, the propagation of a GPC-system is stopped after this amount of seconds and the GPC-system is
+            truncated to the radius that has been settled by then. Only supported by the Python propagation.
+
+        The radii of truncated GPC-systems are stored in `truncation_radii` (source point to radius) and a warning
+        is raised. The limits are checked while propagating, such that oversized GPC-systems are not fully computed.
+
+        Returns
+        -------
+        list:
+            Only if a list of radii is given. The GPC-systems for each radius in the order of `u_max`. The GPC-systems
+            of the largest radius are also stored in `object_mesh_gpc_systems`.
+        """
+        radii = None
+        if isinstance(u_max, (list, tuple, np.ndarray)):
+            radii = [float(radius) for radius in u_max]
+            u_max = max(radii)
+        budget = {"max_vertices": max_vertices, "max_faces": max_faces, "time_budget": time_budget}
+        if all(limit is None for limit in budget.values()):
+            # Without a budget, warm starts do not require a `GPCSystem` (see `compute_gpc_system_states`)
+            budget = None
+
+        n_vertices = self.object_mesh.vertices.shape[0]
+        states = [None for _ in range(n_vertices)]
+
+        # Resume from checkpoints
+        n_checkpoints = 0
+        if checkpoint_dir:
+            checkpoint_properties = {
+                "n_vertices": n_vertices,
+                "u_max": u_max,
+                "eps": self.eps,
+                "mesh_fingerprint": self.get_mesh_fingerprint()
+            }
+            if self.backend in ["vectorized", "heat"]:
+                checkpoint_properties["backend"] = self.backend
+            if self.dtype != np.float64:
+                checkpoint_properties["dtype"] = self.dtype.name
+            if budget is not None:
+                for key, limit in budget.items():
+                    if limit is not None:
+                        checkpoint_properties[key] = limit
+            checkpoint_states, n_checkpoints = _load_checkpoints(checkpoint_dir, checkpoint_properties)
+            for state in checkpoint_states:
+                states[state["source_point"]] = state
+        pending_source_points = np.array([idx for idx, state in enumerate(states) if state is None], dtype=np.int64)
+
+        progress_bar = tqdm(
+            total=n_vertices, initial=n_vertices - pending_source_points.shape[0], postfix="Computing GPC-systems"
+        )
+        unsaved_states = []
+        last_checkpoint = time.time()
+        chunk_states_iterator = self.compute_gpc_system_chunks(
+            pending_source_points, u_max, warm_start=warm_start, budget=budget
+        )
+        try:
+            for chunk_states in chunk_states_iterator:
+                # Backends which cannot stop early are limited afterward
+                chunk_states = [limit_state(state, max_vertices, max_faces) for state in chunk_states]
+                for state in chunk_states:
+                    states[state["source_point"]] = state
+                progress_bar.update(len(chunk_states))
+                unsaved_states.extend(chunk_states)
+                if checkpoint_dir and time.time() - last_checkpoint >= checkpoint_interval:
+                    _write_checkpoint(checkpoint_dir, n_checkpoints, unsaved_states)
+                    n_checkpoints += 1
+                    unsaved_states = []
+                    last_checkpoint = time.time()
+        finally:
+            chunk_states_iterator.close()
+            # Keep completed GPC-systems, also if the computation has been interrupted
+            if checkpoint_dir and unsaved_states:
+                _write_checkpoint(checkpoint_dir, n_checkpoints, unsaved_states)
+            progress_bar.close()
+
+        if self.collect_statistics:
+            self.statistics = GPCStatistics.from_states(states)
+        self.truncation_radii = {
+            state["source_point"]: state["truncation_radius"]
+            for state in states if state.get("truncation_radius") is not None
+        }
+        if self.truncation_radii:
+            warnings.warn(
+                f"{len(self.truncation_radii)} GPC-systems have been truncated to meet the work budget. Their radii "
+                f"are stored in 'truncation_radii'.",
+                RuntimeWarning
+            )
+        self.object_mesh_gpc_systems = self.from_states(states, packed)
+        if radii is not None:
+            return [
+                self.object_mesh_gpc_systems if radius == u_max
+                else self.from_states([truncate_state(state, radius) for state in states], packed)
+                for radius in radii
+            ]
+
+    def from_states(self, states, packed=False):
+        """Creates GPC-systems from their states (see `GPCSystem.get_state`).
+
+        Parameters
+        ----------
+        states: list
+            The states of the GPC-systems of all vertices in the order of their source points.
+        packed: bool
+            Whether to return `PackedGPCSystems` or an array of `GPCSystem`-objects.
+
+        Returns
+        -------
+        [np.ndarray, PackedGPCSystems]:
+            The GPC-systems.
+        """
+        n_vertices = self.object_mesh.vertices.shape[0]
+        if packed:
+            return PackedGPCSystems.from_states(states, n_vertices)
+        gpc_systems = np.empty(n_vertices, dtype=object)
+        for source_point, state in enumerate(states):
+            gpc_systems[source_point] = GPCSystem.from_state(
+                state, self.object_mesh, topology=self.topology, mesh_geometry=self.mesh_geometry
+            )
+        return gpc_systems
+
+    def compute_lazy(self, u_max=.04, n_radial=None, n_angular=None, template_radius=None, max_bytes=256 * 2 ** 20,
+                     spill_dir=""):
+        """Prepares GPC-systems that are only computed once they are requested.
+
+        Nothing is computed up front. `object_mesh_gpc_systems` is set to `LazyGPCSystems`, which computes (and
+        caches) a GPC-system when it is indexed for the first time.
+
         Parameters
         ----------
         u_max: float
             The maximal radius for each GPC-system.
+        n_radial: int
+            The amount of radial coordinates of the template. Only required for barycentric coordinates.
+        n_angular: int
+            The amount of angular coordinates of the template. Only required for barycentric coordinates.
+        template_radius: float
+            The radius of the template. Only required for barycentric coordinates.
+        max_bytes: int
+            The maximal amount of bytes which are kept in memory for computed GPC-systems.
+        spill_dir: str
+            If given, GPC-systems which are evicted from memory are stored in this directory.
+
+        Returns
+        -------
+        LazyGPCSystems:
+            The lazily computed GPC-systems.
         """
-        n_vertices = self.object_mesh.vertices.shape[0]
-        vertex_indices = np.arange(n_vertices)
-        with Pool(self.processes) as p:
-            gpc_systems = p.starmap(
-                self.compute_gpc_system,
-                tqdm(
-                    [(vi, u_max) for vi in vertex_indices],
-                    total=n_vertices,
-                    postfix="Computing GPC-systems"
+        self.object_mesh_gpc_systems = LazyGPCSystems(
+            self,
+            u_max=u_max,
+            n_radial=n_radial,
+            n_angular=n_angular,
+            template_radius=template_radius,
+            max_bytes=max_bytes,
+            spill_dir=spill_dir
+        )
+        return self.object_mesh_gpc_systems
+
+    def compute_gpc_system_chunks(self, source_points, u_max, warm_start=None, budget=None):
+        """Computes GPC-systems for the given source points in chunks, using the configured backend.
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The indices of the source points.
+        u_max: float
+            The maximal radius for each GPC-system.
+        warm_start: [np.ndarray, PackedGPCSystems]
+            The GPC-systems of a previous frame which are used to warm start the computation.
+        budget: dict
+            The work budget of each GPC-system (see `compute_gpc_system`). The batch-backends ignore the budget.
+
+        Returns
+        -------
+        generator:
+            Yields the states (see `GPCSystem.get_state`) of each completed chunk in the order of completion.
+        """
+        if self.backend in ["vectorized", "heat"]:
+            # Warm starts are not supported, all GPC-systems of a batch are computed at once
+            if self.batch_engine is None:
+                if self.backend == "heat":
+                    self.batch_engine = HeatMethod(self.object_mesh, topology=self.topology)
+                else:
+                    self.batch_engine = VectorizedGPCSystems(
+                        self.object_mesh, topology=self.topology, eps=self.eps, mesh_geometry=self.mesh_geometry
+                    )
+            chunk_size = 256 if self.chunk_size is None else self.chunk_size
+            for start in range(0, source_points.shape[0], chunk_size):
+                yield [
+                    cast_state(state, self.dtype)
+                    for state in self.batch_engine.compute_gpc_system_states(
+                        source_points[start:start + chunk_size], u_max
+                    )
+                ]
+            return
+
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = max(1, int(np.ceil(source_points.shape[0] / (16 * self.processes))))
+        chunks = []
+        for start in range(0, source_points.shape[0], chunk_size):
+            chunk = source_points[start:start + chunk_size]
+            warm_start_faces = None
+            if warm_start is not None:
+                warm_start_faces = [get_warm_start_faces(warm_start[source_point]) for source_point in chunk]
+            chunks.append((chunk, warm_start_faces))
+
+        if self.pool is None and self.processes == 1:
+            # Starting a single worker does not pay off
+            for chunk in chunks:
+                yield _compute_chunk(chunk, u_max, budget=budget, gpc_system_group=self)
+            return
+
+        shared_blocks, temporary_pool, pool, completed = [], None, None, False
+        try:
+            if self.backend == "threads":
+                # Threads share the mesh and its topology
+                pool = temporary_pool = ThreadPool(self.processes)
+                compute_chunk = partial(_compute_chunk, gpc_system_group=self)
+            else:
+                pool = self.pool
+                if pool is None:
+                    pool = temporary_pool = GPCSystemPool(self.processes)
+                # Publish mesh arrays once via shared memory instead of pickling the mesh for every task. Workers
+                # re-use the precomputed mesh geometry instead of computing it themselves.
+                shared_arrays = {"faces": pool.share_topology(self.topology)}
+                for key in GEOMETRY_ARRAYS:
+                    shm, shared_arrays[key] = _share_array(getattr(self.mesh_geometry, key))
+                    shared_blocks.append(shm)
+                group_kwargs = {
+                    "eps": self.eps,
+                    "use_c": self.use_c,
+                    "use_c_engine": self.use_c_engine,
+                    "collect_statistics": self.collect_statistics,
+                    "dtype": self.dtype
+                }
+                compute_chunk = partial(_compute_chunk, shared_mesh=(shared_arrays, group_kwargs))
+            # Chunks are distributed dynamically to balance the load among workers
+            for chunk_states in pool.imap_unordered(partial(compute_chunk, u_max=u_max, budget=budget), chunks):
+                yield chunk_states
+            completed = True
+        finally:
+            if temporary_pool is not None:
+                temporary_pool.terminate()
+            elif not completed and pool is not None:
+                # Workers of a persistent pool might still compute queued chunks on the shared blocks
+                pool.terminate()
+            for shm in shared_blocks:
+                shm.close()
+                shm.unlink()
+
+    def get_affected_gpc_systems(self, modified_vertices):
+        """Determines the GPC-systems which can change if the given vertices are moved.
+
+        A GPC-system only depends on the positions of the vertices it reaches. Furthermore, a moved vertex can only
+        become part of a GPC-system if it neighbors a vertex of that GPC-system. Hence, every GPC-system that reaches a
+        modified vertex or one of its neighbors is affected. These GPC-systems are looked up in a reverse index, which
+        lists the GPC-systems that reach each vertex (see `get_reverse_index`). Of `LazyGPCSystems`, only GPC-systems
+        which have already been computed can be affected.
+
+        Parameters
+        ----------
+        modified_vertices: np.ndarray
+            The indices of the modified vertices.
+
+        Returns
+        -------
+        np.ndarray:
+            The indices of the affected GPC-systems (equal to their source points).
+        """
+        candidates = [np.unique(modified_vertices)]
+        for vertex in candidates[0]:
+            candidates.append(self.topology.get_neighbors(vertex))
+        candidates = np.unique(np.concatenate(candidates).astype(np.int64))
+
+        if isinstance(self.object_mesh_gpc_systems, LazyGPCSystems):
+            return self.object_mesh_gpc_systems.get_reaching_gpc_systems(candidates)
+        offsets, gpc_system_indices = self.get_reverse_index()
+        return np.unique(
+            np.concatenate(
+                [np.empty((0,), dtype=np.int64)]
+                + [gpc_system_indices[offsets[vertex]:offsets[vertex + 1]] for vertex in candidates]
+            )
+        )
+
+    def get_reverse_index(self):
+        """Returns the GPC-systems which reach each vertex.
+
+        The reverse index is built once for the current GPC-systems and kept up to date by `update`.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            Offsets and GPC-system indices. The GPC-systems which reach vertex `v` are
+            `gpc_system_indices[offsets[v]:offsets[v + 1]]`.
+        """
+        gpc_systems = self._reverse_index[0]
+        if gpc_systems is not self.object_mesh_gpc_systems:
+            gpc_systems = self.object_mesh_gpc_systems
+            if isinstance(gpc_systems, PackedGPCSystems):
+                vertices = np.asarray(gpc_systems.vertex_indices, dtype=np.int64)
+                gpc_system_indices = np.repeat(
+                    np.arange(len(gpc_systems), dtype=np.int64), np.diff(gpc_systems.vertex_offsets)
+                )
+            else:
+                vertices = [np.nonzero(gpc_system.radial_coordinates != np.inf)[0] for gpc_system in gpc_systems]
+                gpc_system_indices = np.repeat(
+                    np.arange(len(gpc_systems), dtype=np.int64), [idx.shape[0] for idx in vertices]
+                )
+                vertices = np.concatenate(vertices).astype(np.int64)
+            self._set_reverse_index(vertices, gpc_system_indices)
+        _, _, gpc_system_indices, offsets = self._reverse_index
+        return offsets, gpc_system_indices
+
+    def _set_reverse_index(self, vertices, gpc_system_indices):
+        order = np.argsort(vertices, kind="stable")
+        vertices = vertices[order]
+        offsets = np.searchsorted(vertices, np.arange(self.object_mesh.vertices.shape[0] + 1))
+        self._reverse_index = (self.object_mesh_gpc_systems, vertices, gpc_system_indices[order], offsets)
+
+    def update(self, modified_vertices, u_max=.04):
+        """Recomputes the GPC-systems which are affected by moved vertices.
+
+        The vertex positions of `self.object_mesh` must already be updated. All other GPC-systems remain untouched.
+        Use the returned indices to update the barycentric coordinates accordingly (see the `gpc_system_indices`
+        argument of `compute_barycentric_coordinates`). Affected `LazyGPCSystems` are discarded instead (see
+        `LazyGPCSystems.invalidate`) and re-computed once they are requested.
+
+        Parameters
+        ----------
+        modified_vertices: np.ndarray
+            The indices of the moved vertices.
+        u_max: float
+            The maximal radius with which the GPC-systems have been computed. Ignored for `LazyGPCSystems`.
+
+        Returns
+        -------
+        np.ndarray:
+            The indices of the re-computed (or discarded) GPC-systems.
+        """
+        affected = self.get_affected_gpc_systems(modified_vertices)
+        # The mesh geometry and the batch engines depend on the vertex positions
+        self.mesh_geometry = MeshGeometry(self.object_mesh, topology=self.topology)
+        self.batch_engine = None
+        if isinstance(self.object_mesh_gpc_systems, LazyGPCSystems):
+            # Lazy GPC-systems are re-computed once they are requested again
+            self.object_mesh_gpc_systems.invalidate(affected)
+            return affected
+        states = [state for chunk_states in self.compute_gpc_system_chunks(affected, u_max) for state in chunk_states]
+
+        if isinstance(self.object_mesh_gpc_systems, PackedGPCSystems):
+            self.object_mesh_gpc_systems = self.object_mesh_gpc_systems.replace(states)
+        else:
+            for state in states:
+                self.object_mesh_gpc_systems[state["source_point"]] = GPCSystem.from_state(
+                    state, self.object_mesh, topology=self.topology, mesh_geometry=self.mesh_geometry
                 )
+
+        # Only the entries of the re-computed GPC-systems are replaced in the reverse index
+        _, vertices, gpc_system_indices, _ = self._reverse_index
+        kept = ~np.isin(gpc_system_indices, affected)
+        self._set_reverse_index(
+            np.concatenate([vertices[kept]] + [state["vertex_indices"].astype(np.int64) for state in states]),
+            np.concatenate(
+                [gpc_system_indices[kept]]
+                + [np.full(state["vertex_indices"].shape, state["source_point"], dtype=np.int64) for state in states]
             )
-        self.object_mesh_gpc_systems = np.array(gpc_systems).flatten()
+        )
+        return affected
+
+    def save(self, path):
+        """Stores the computed GPC-systems in a memory-mappable format (see `PackedGPCSystems.save`).
+
+        Parameters
+        ----------
+        path: str
+            The path to the directory in which the GPC-systems shall be stored.
+        """
+        gpc_systems = self.object_mesh_gpc_systems
+        if not isinstance(gpc_systems, PackedGPCSystems):
+            gpc_systems = PackedGPCSystems.from_states(
+                [gpc_system.get_state() for gpc_system in gpc_systems], self.object_mesh.vertices.shape[0]
+            )
+        gpc_systems.save(path)
+
+    def load(self, path, mmap_mode="r"):
+        """Loads GPC-systems which have been stored with `save`.
+
+        The loaded GPC-systems are stored as `PackedGPCSystems`. By default, they are memory-mapped, such that only
+        the accessed GPC-systems are read from disk.
+
+        Parameters
+        ----------
+        path: str
+            The path to the directory in which the GPC-systems are stored.
+        mmap_mode: str
+            The mode in which the arrays are memory-mapped (see `np.load`). If `None`, the arrays are read into memory.
+        """
+        gpc_systems = PackedGPCSystems.load(path, mmap_mode=mmap_mode)
+        if gpc_systems.n_vertices != self.object_mesh.vertices.shape[0]:
+            raise RuntimeError(
+                f"The GPC-systems stored at '{path}' belong to a mesh with {gpc_systems.n_vertices} vertices, but the "
+                f"current mesh has {self.object_mesh.vertices.shape[0]} vertices."
+            )
+        self.object_mesh_gpc_systems = gpc_systems
+
+    def get_mesh_fingerprint(self):
+        """Returns a fingerprint of the vertex positions and the faces of the mesh.
+
+        Stored GPC-systems (e.g. checkpoints) shall only be re-used for a mesh with the same fingerprint.
+
+        Returns
+        -------
+        str:
+            The SHA-256 hash of the vertices and the faces.
+        """
+        vertices = np.ascontiguousarray(self.object_mesh.vertices, dtype=np.float64)
+        faces = np.ascontiguousarray(self.object_mesh.faces, dtype=np.int64)
+        fingerprint = hashlib.sha256()
+        fingerprint.update(np.array(vertices.shape + faces.shape, dtype=np.int64).tobytes())
+        fingerprint.update(vertices.tobytes())
+        fingerprint.update(faces.tobytes())
+        return fingerprint.hexdigest()
+
+    def compute_gpc_system_states(self, source_points, u_max, warm_start_faces=None, budget=None):
+        """Computes the GPC-systems for multiple source points and returns their states.
+
+        One GPC-system object is re-used for all source points (see `GPCSystem.soft_clear`).
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The indices of the source points
+        u_max: float
+            The maximal radius for each GPC-system.
+        warm_start_faces: list
+            If given, the captured faces and their orientations of each source point in a previous frame (see
+            `get_warm_start_faces`).
+        budget: dict
+            If given, the keyword arguments 'max_vertices', 'max_faces' and 'time_budget' of `compute_gpc_system`.
+
+        Returns
+        -------
+        list:
+            The states (see `GPCSystem.get_state`) of the computed GPC-systems with coordinates of type `dtype`.
+        """
+        states = []
+        gpc_system = None
+        for idx, source_point in enumerate(source_points):
+            start_time = time.perf_counter()
+            warm_start = None if warm_start_faces is None else warm_start_faces[idx]
+            # States that are computed elsewhere are used as is and no GPC-system object is set up
+            state = None
+            if self.use_c_engine:
+                state = self.compute_engine_state(int(source_point), u_max)
+                # The engine ignores time budgets, vertex- and face-counts are limited afterward
+                if budget is not None:
+                    state = limit_state(state, budget.get("max_vertices"), budget.get("max_faces"))
+            elif warm_start is not None and budget is None:
+                state = self.replay_faces(int(source_point), *warm_start, u_max=u_max)
+                # Inconsistent warm starts are computed from scratch
+                warm_start = None
+            if state is None:
+                gpc_system = self.compute_gpc_system(
+                    int(source_point),
+                    u_max,
+                    gpc_system=gpc_system,
+                    warm_start_faces=warm_start,
+                    **({} if budget is None else budget)
+                )
+                state = gpc_system.get_state(dtype=self.dtype)
+                statistics = gpc_system.statistics
+            else:
+                state = cast_state(state, self.dtype)
+                # Counters of the propagation are not measured
+                statistics = dict.fromkeys(GPC_SYSTEM_COUNTERS, np.nan)
+            wall_time = time.perf_counter() - start_time
+            if self.collect_statistics:
+                state["statistics"] = dict(
+                    statistics,
+                    system_vertices=state["vertex_indices"].shape[0],
+                    system_faces=state["faces"].shape[0],
+                    wall_time=wall_time
+                )
+            states.append(state)
+        return states
 
-    def compute_gpc_system(self, source_point, u_max, gpc_system=None, plot_path=""):
+    def compute_gpc_system(self,
+                           source_point,
+                           u_max,
+                           gpc_system=None,
+                           plot_path="",
+                           warm_start_faces=None,
+                           max_vertices=None,
+                           max_faces=None,
+                           time_budget=None):
         """Computes local GPC for one given source point.
 
         This method implements the algorithm of:
@@ -54,48 +1002,106 @@ class GPCSystemGroup:
         u_max: float
             The maximal distance (e.g. radius of the patch) which a vertex may have to `source_point`
         gpc_system: GPCSystem
-            A GPC-system that has been computed previously on the same mesh. Its caches can be re-used
-            which saves computation time.
+            A GPC-system that has been computed previously on the same mesh. It is reset and re-used, which saves
+            re-allocating its caches. Note that the returned GPC-system is the given object.
         plot_path: bool
             If given, the update steps will be plotted and stored at the given path.
+        warm_start_faces: (np.ndarray, np.ndarray)
+            The faces captured by the GPC-system of `source_point` on a previous frame of a mesh sequence with
+            identical connectivity and their orientations (see `get_warm_start_faces`). Only the coordinates of the
+            vertices of these faces are re-solved (see `replay_faces`), which only approximates the GPC-system. If this
+            is inconsistent with the current frame, the GPC-system is computed from scratch. Warm starts are ignored by
+            the c-extension engine.
+        max_vertices: int
+            If given, the propagation stops once more vertices have been settled and the GPC-system is truncated to
+            the largest radius that respects this limit (see `limit_state`).
+        max_faces: int
+            If given, the propagation stops once more faces have been captured and the GPC-system is truncated to the
+            largest radius that respects this limit (see `limit_state`).
+        time_budget: float
+            If given, the propagation stops after this amount of seconds and the GPC-system is truncated to the radius
+            that has been settled by then. Ignored by the c-extension engine.
+
+        The radius of a truncated GPC-system is stored in its `truncation_radius`-attribute.
 
         Returns
         -------
         GPCSystem:
             A GPC-system.
         """
+        # Compute the GPC-system entirely within the c-extension. The GPC-system object only receives the result.
+        if self.use_c_engine and not plot_path:
+            gpc_system = self._assign_state(self.compute_engine_state(source_point, u_max), gpc_system)
+            return self._limit_gpc_system(gpc_system, max_vertices, max_faces)
+
+        ######################################
+        # Re-solve faces of the previous frame
+        ######################################
+        if warm_start_faces is not None and not plot_path:
+            state = self.replay_faces(source_point, *warm_start_faces, u_max=u_max)
+            if state is not None:
+                return self._limit_gpc_system(self._assign_state(state, gpc_system), max_vertices, max_faces)
+            # Inconsistent warm start, compute GPC-system from scratch
+
         ########################
         # Initialize GPC-system
         ########################
         if gpc_system is None:
-            gpc_system = GPCSystem(source_point, self.object_mesh, use_c=True)
+            gpc_system = GPCSystem(
+                source_point,
+                self.object_mesh,
+                use_c=True,
+                topology=self.topology,
+                collect_statistics=self.collect_statistics,
+                mesh_geometry=self.mesh_geometry
+            )
         else:
             gpc_system.soft_clear(source_point)
-        # Check whether initialization distances are larger than given max-radius
-        check_array = np.array([x for x in gpc_system.radial_coordinates if not np.isinf(x)])
-        if check_array.max() > u_max:
-            warnings.warn(
-                f"You chose a 'u_max' to be smaller then {check_array.max()}, which has been seen as an initialization"
-                f" length for a GPC-system. Current GPC-system will only contain initialization vertices.",
-                RuntimeWarning
-            )
+        self._check_initialization_radius(
+            gpc_system.radial_coordinates[self.topology.get_neighbors(source_point)], u_max
+        )
 
         ############################################
         # Initialize min-heap over radial distances
         ############################################
-        candidates = []
-        for neighbor in get_neighbors(source_point, self.object_mesh):
-            candidates.append((gpc_system.radial_coordinates[neighbor], neighbor))
-        heapq.heapify(candidates)
+        # Improved vertices that are still queued get their keys decreased, such that no vertex is popped with an
+        # outdated radial coordinate
+        candidates = IndexedMinHeap(
+            (gpc_system.radial_coordinates[neighbor], neighbor)
+            for neighbor in self.topology.get_neighbors(source_point)
+        )
+        statistics = gpc_system.statistics
+        if statistics is not None:
+            statistics["heap_pushes"] += len(candidates)
 
         ###################################
         # Algorithm to compute GPC-systems
         ###################################
         plot_number = 0
+        rotation_axis = self.mesh_geometry.vertex_normals[source_point]
+        # Popped vertices (and the source point) have been settled up to the radial coordinate of the current vertex
+        settled_vertices = {source_point}
+        start_time = time.time()
         while candidates:
             # Get vertex from min-heap that is closest to GPC-system origin
-            j_dist, j = heapq.heappop(candidates)
-            j_neighbors = get_neighbors(j, self.object_mesh)
+            j_dist, j = candidates.pop()
+            if statistics is not None:
+                statistics["heap_pops"] += 1
+
+            # Stop propagating once the work budget is exhausted
+            settled_vertices.add(j)
+            if (
+                (max_vertices is not None and len(settled_vertices) > max_vertices)
+                or (max_faces is not None and len(gpc_system.faces) > max_faces and self._count_settled_faces(
+                    gpc_system, j_dist
+                ) > max_faces)
+                or (time_budget is not None and time.time() - start_time > time_budget)
+            ):
+                gpc_system.assign_state(truncate_state(gpc_system.get_state(), j_dist))
+                gpc_system.truncation_radius = float(j_dist)
+                break
+
+            j_neighbors = self.topology.get_neighbors(j)
             j_neighbors = [j for j in j_neighbors if j != source_point]
             for i in j_neighbors:
                 # Compute the (updated) geodesic distance `new_u_i` and angular coordinate of the i-th neighbor from the
@@ -105,18 +1111,269 @@ class GPCSystemGroup:
                     j,
                     gpc_system,
                     self.use_c,
-                    rotation_axis=self.object_mesh.vertex_normals[source_point]
+                    rotation_axis=rotation_axis
                 )
                 # In difference to the original pseudocode, we add 'new_u_i < u_max' to this IF-query
                 # to ensure that the radial coordinates do not exceed 'u_max'.
                 if new_u_i < u_max and gpc_system.radial_coordinates[i] / new_u_i > 1 + self.eps:
+                    if statistics is not None:
+                        statistics["updates_attempted"] += 1
                     if plot_path:
                         if gpc_system.update(
                             i, new_u_i, new_theta_i, j, k_vertices, plot_name=f"{plot_path}/{plot_number}"
                         ):
-                            heapq.heappush(candidates, (new_u_i, i))
+                            decreased = candidates.push(new_u_i, i)
                             plot_number += 1
+                            if statistics is not None:
+                                statistics["decrease_keys" if decreased else "heap_pushes"] += 1
                     else:
                         if gpc_system.update(i, new_u_i, new_theta_i, j, k_vertices):
-                            heapq.heappush(candidates, (new_u_i, i))
+                            decreased = candidates.push(new_u_i, i)
+                            if statistics is not None:
+                                statistics["decrease_keys" if decreased else "heap_pushes"] += 1
+        return self._limit_gpc_system(gpc_system, max_vertices, max_faces)
+
+    def compute_engine_state(self, source_point, u_max):
+        """Computes a GPC-system entirely within the c-extension and returns its state.
+
+        The engine propagates the GPC-system without holding the GIL and re-uses the buffers of the calling thread
+        (see `get_engine_workspace`). No `GPCSystem` is set up, the state is built from the output of the engine.
+
+        Parameters
+        ----------
+        source_point: int
+            The index of the source point of the GPC-system
+        u_max: float
+            The maximal radius of the GPC-system
+
+        Returns
+        -------
+        dict:
+            The state of the GPC-system (see `GPCSystem.get_state`).
+        """
+        mesh_geometry = self.mesh_geometry
+        vertex_indices, radial_coordinates, angular_coordinates, edges, faces = c_extension.compute_gpc_system(
+            mesh_geometry.vertices,
+            mesh_geometry.vertex_normals[source_point],
+            self.topology.adjacency_indptr,
+            self.topology.adjacency_indices,
+            self.topology.adjacency_edges,
+            self.topology.edge_faces_indptr,
+            self.topology.edge_faces_indices,
+            self.topology.faces,
+            mesh_geometry.half_edge_vectors,
+            mesh_geometry.half_edge_lengths,
+            mesh_geometry.half_edge_squared_lengths,
+            mesh_geometry.opposite_vertices,
+            mesh_geometry.adjacent_slots,
+            mesh_geometry.opposite_slots,
+            mesh_geometry.corner_sines,
+            source_point,
+            u_max,
+            self.eps,
+            self.get_engine_workspace()
+        )
+        neighbors = self.topology.get_neighbors(source_point)
+        self._check_initialization_radius(radial_coordinates[np.searchsorted(vertex_indices, neighbors)], u_max)
+        xy = polar_to_cart(angles=angular_coordinates, scales=radial_coordinates)
+        # The mean one-hop-distance approximates the edge lengths around the source point (see `GPCSystem`)
+        cell_size = np.linalg.norm(
+            mesh_geometry.vertices[neighbors] - mesh_geometry.vertices[source_point], ord=2, axis=-1
+        ).mean()
+        return {
+            "source_point": source_point,
+            "n_vertices": mesh_geometry.vertices.shape[0],
+            "vertex_indices": vertex_indices,
+            "radial_coordinates": radial_coordinates,
+            "angular_coordinates": angular_coordinates,
+            "x_coordinates": xy[:, 0].copy(),
+            "y_coordinates": xy[:, 1].copy(),
+            "edges": edges,
+            "faces": faces,
+            "cell_size": cell_size,
+            "truncation_radius": None
+        }
+
+    def get_engine_workspace(self):
+        """Returns the buffers of the c-extension engine for the calling thread.
+
+        The buffers are allocated once per thread and mesh size (see `c_extension.create_gpc_workspace`). After each
+        GPC-system, the engine only resets the entries which it has touched.
+
+        Returns
+        -------
+        object:
+            The workspace of the c-extension engine.
+        """
+        sizes = (
+            self.mesh_geometry.vertices.shape[0],
+            self.topology.edge_faces_indptr.shape[0] - 1,
+            self.topology.faces.shape[0]
+        )
+        workspace = getattr(self._engine_workspaces, "workspace", None)
+        if workspace is None or workspace[0] != sizes:
+            workspace = (sizes, c_extension.create_gpc_workspace(*sizes))
+            self._engine_workspaces.workspace = workspace
+        return workspace[1]
+
+    def _assign_state(self, state, gpc_system=None):
+        # GPC-systems which have been computed elsewhere do not record counters
+        if gpc_system is None:
+            gpc_system = GPCSystem.from_state(
+                state, self.object_mesh, topology=self.topology, mesh_geometry=self.mesh_geometry
+            )
+        else:
+            gpc_system.assign_state(state)
+        if self.collect_statistics:
+            gpc_system.statistics = dict.fromkeys(GPC_SYSTEM_COUNTERS, np.nan)
         return gpc_system
+
+    @staticmethod
+    def _check_initialization_radius(neighbor_distances, u_max):
+        # Check whether initialization distances are larger than given max-radius
+        if neighbor_distances.max() > u_max:
+            warnings.warn(
+                f"You chose a 'u_max' to be smaller then {neighbor_distances.max()}, which has been seen as an"
+                f" initialization length for a GPC-system. Current GPC-system will only contain initialization"
+                f" vertices.",
+                RuntimeWarning
+            )
+
+    @staticmethod
+    def _count_settled_faces(gpc_system, radius):
+        """Counts the captured faces whose vertices have radial coordinates smaller than `radius`"""
+        faces = gpc_system.faces[(-1, -1)]
+        return int((gpc_system.radial_coordinates[faces].max(axis=-1) < radius).sum())
+
+    @staticmethod
+    def _limit_gpc_system(gpc_system, max_vertices, max_faces):
+        """Truncates a GPC-system in-place if it exceeds the given vertex- or face-count (see `limit_state`)"""
+        if max_vertices is None and max_faces is None:
+            return gpc_system
+        state = limit_state(gpc_system.get_state(), max_vertices, max_faces)
+        if state["truncation_radius"] != gpc_system.truncation_radius:
+            gpc_system.assign_state(state)
+        return gpc_system
+
+    def replay_faces(self, source_point, faces, orientations, u_max):
+        """Re-solves the coordinates of the vertices of previously captured faces.
+
+        Starting from the one-hop-neighborhood of the source point (see `compute_initial_coordinates`), vertices are
+        solved in the order in which the faces have been captured. Each vertex receives the smallest Euclidean update
+        from the faces that contain it and whose other two vertices are already solved. Since the faces are known, no
+        intersection tests are performed. Instead, the faces must keep their orientations within the GPC-system and all
+        vertices must stay within `u_max`.
+
+        Vertices that were not reached in the previous frame are not added. If such a vertex receives an update within
+        `u_max` from a face whose other two vertices have been solved, the GPC-system might have grown on the current
+        frame and the faces are not re-solved.
+
+        The re-solved GPC-system is an approximation. A propagation from scratch might capture the faces in another
+        order and thus assign other coordinates. For example, on a noisy icosphere with 642 vertices and `u_max=0.3`
+        whose vertices have been moved by Gaussian noise with a standard deviation of 0.002, the radial coordinates
+        of re-solved GPC-systems differ by up to 2.3% of `u_max` from the ones computed from scratch.
+
+        Parameters
+        ----------
+        source_point: int
+            The index of the source point of the GPC-system.
+        faces: np.ndarray
+            The faces of a previous GPC-system of the same source point in the order of their capture.
+        orientations: np.ndarray
+            The orientations (signs of the signed areas) of `faces` in the previous GPC-system.
+        u_max: float
+            The maximal distance which a vertex may have to the source point of the GPC-system.
+
+        Returns
+        -------
+        [dict, None]:
+            The state of the re-solved GPC-system (see `GPCSystem.get_state`) or `None` if the faces could not be
+            re-solved consistently.
+        """
+        rotation_axis = self.mesh_geometry.vertex_normals[source_point]
+        radial_coordinates, angular_coordinates = compute_initial_coordinates(
+            source_point, self.topology, self.mesh_geometry
+        )
+        faces = np.asarray(faces, dtype=np.int64)
+        faces_list = faces.tolist()
+        vertex_faces = {}
+        for face in faces_list:
+            for vertex in face:
+                vertex_faces.setdefault(vertex, []).append(face)
+
+        for face in faces_list:
+            unknown_vertices = [v for v in face if radial_coordinates[v] == np.inf]
+            if not unknown_vertices:
+                continue
+            if len(unknown_vertices) > 1:
+                return None
+            vertex_i = unknown_vertices[0]
+            updates = []
+            for vertex_face in vertex_faces[vertex_i]:
+                vertex_j, vertex_k = [v for v in vertex_face if v != vertex_i]
+                if radial_coordinates[vertex_j] < np.inf and radial_coordinates[vertex_k] < np.inf:
+                    updates.append(
+                        compute_u_ijk_and_angle(
+                            vertex_i,
+                            vertex_j,
+                            vertex_k,
+                            radial_coordinates,
+                            angular_coordinates,
+                            self.mesh_geometry,
+                            self.use_c,
+                            rotation_axis
+                        )
+                    )
+            new_u_i, new_theta_i = min(updates)
+            if not new_u_i < u_max:
+                return None
+            radial_coordinates[vertex_i] = new_u_i
+            angular_coordinates[vertex_i] = new_theta_i
+
+        # Check whether unreached vertices can be updated from faces with two solved vertices
+        reached = radial_coordinates != np.inf
+        frontier_faces = self.topology.faces[reached[self.topology.faces].sum(axis=-1) == 2]
+        if frontier_faces.shape[0] > 0:
+            rows = np.arange(frontier_faces.shape[0])
+            unreached = np.argmin(reached[frontier_faces], axis=-1)
+            frontier_u, _ = compute_u_ijk_and_angle(
+                frontier_faces[rows, unreached],
+                frontier_faces[rows, (unreached + 1) % 3],
+                frontier_faces[rows, (unreached + 2) % 3],
+                radial_coordinates,
+                angular_coordinates,
+                self.mesh_geometry,
+                self.use_c,
+                rotation_axis
+            )
+            if (frontier_u < u_max).any():
+                return None
+
+        # Check for flipped faces
+        if not np.array_equal(
+            get_orientations(polar_to_cart(angles=angular_coordinates[faces], scales=radial_coordinates[faces])),
+            orientations
+        ):
+            return None
+
+        # Captured edges are given by the edges of the captured faces
+        face_edges = faces[:, [0, 1, 1, 2, 0, 2]].reshape((-1, 2))
+        _, first_occurrence = np.unique(face_edges, axis=0, return_index=True)
+        vertex_indices = np.nonzero(reached)[0]
+        xy = polar_to_cart(angles=angular_coordinates[vertex_indices], scales=radial_coordinates[vertex_indices])
+        neighbors = self.topology.get_neighbors(source_point)
+        self._check_initialization_radius(radial_coordinates[neighbors], u_max)
+        return {
+            "source_point": source_point,
+            "n_vertices": radial_coordinates.shape[0],
+            "vertex_indices": vertex_indices,
+            "radial_coordinates": radial_coordinates[vertex_indices],
+            "angular_coordinates": angular_coordinates[vertex_indices],
+            "x_coordinates": xy[:, 0].copy(),
+            "y_coordinates": xy[:, 1].copy(),
+            "edges": face_edges[np.sort(first_occurrence)],
+            "faces": faces,
+            # The mean one-hop-distance approximates the edge lengths around the source point (see `GPCSystem`)
+            "cell_size": radial_coordinates[neighbors].mean(),
+            "truncation_radius": None
+        }
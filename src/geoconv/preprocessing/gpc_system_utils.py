@@ -1,4 +1,5 @@
-from geoconv.utils.misc import get_faces_of_edge, compute_vector_angle
+from geoconv.preprocessing.mesh_geometry import MeshGeometry
+from geoconv.utils.misc import compute_vector_angle
 
 from scipy.linalg import blas
 
@@ -15,20 +16,25 @@ def compute_u_ijk_and_angle(vertex_i, vertex_j, vertex_k, u, theta, object_mesh,
       (https://onlinelibrary.wiley.com/doi/full/10.1111/j.1467-8659.2012.03187.x)
     > Melvær, Eivind Lyche, and Martin Reimers.
 
+    Passing index arrays for `vertex_i`, `vertex_j` and `vertex_k` computes the updates for multiple triangles at once.
+    If the precomputed geometry of the mesh is given instead of the mesh, the edge vectors and (for the c-extension)
+    their lengths and the angle at vertex i are taken from it. The results equal the ones computed from the vertices
+    up to rounding errors of the BLAS-kernels, whose results can depend on the memory alignment of their inputs.
+
     Parameters
     ----------
-    vertex_i: int
+    vertex_i: [int, np.ndarray]
         The index of the vertex for which we want to update the distance and angle
-    vertex_j: int
+    vertex_j: [int, np.ndarray]
         The index of the second vertex in the triangle of vertex i
-    vertex_k: int
+    vertex_k: [int, np.ndarray]
         The index of the third vertex in the triangle of vertex i
     u: np.ndarray
         The currently known radial coordinates
     theta: np.ndarray
         The currently known angular coordinates
-    object_mesh: trimesh.Trimesh
-        A loaded object mesh
+    object_mesh: [trimesh.Trimesh, MeshGeometry]
+        A loaded object mesh or its precomputed geometry
     use_c: bool
         A flag whether to use the c-extension
     rotation_axis: np.ndarray [DEPRECATED]
@@ -37,14 +43,32 @@ def compute_u_ijk_and_angle(vertex_i, vertex_j, vertex_k, u, theta, object_mesh,
     Returns
     -------
     (float, float)
-        The Euclidean update u_ijk for vertex i (see equation 13 in paper) and the new angle vertex i
+        The Euclidean update u_ijk for vertex i (see equation 13 in paper) and the new angle vertex i. Arrays of
+        updates and angles are returned for batched inputs.
     """
+    edges = None
+    if isinstance(object_mesh, MeshGeometry):
+        if use_c:
+            return compute_cached_u_ijk_and_angle(vertex_i, vertex_j, vertex_k, u, theta, object_mesh)
+        edges = object_mesh.get_edge_vectors(vertex_i, vertex_j, vertex_k)
 
     # Convert indices to vectors
     u_j, u_k = u[[vertex_j, vertex_k]]
     theta_i_init, theta_j, theta_k = theta[[vertex_i, vertex_j, vertex_k]]
     vertex_i, vertex_j, vertex_k = object_mesh.vertices[[vertex_i, vertex_j, vertex_k]]
 
+    if vertex_i.ndim == 2:
+        if use_c:
+            result = np.empty((vertex_i.shape[0], 2))
+            c_extension.compute_dist_and_dir_batch(
+                result, vertex_i, vertex_j, vertex_k, u_j, u_k, theta_j, theta_k, rotation_axis
+            )
+            return result[:, 0], result[:, 1]
+        else:
+            return compute_u_ijk_and_angle_vectorized(
+                vertex_i, vertex_j, vertex_k, u_j, u_k, theta_j, theta_k, edges=edges
+            )
+
     if use_c:
         result = np.array([0., 0.])
         c_extension.compute_dist_and_dir(
@@ -60,19 +84,21 @@ def compute_u_ijk_and_angle(vertex_i, vertex_j, vertex_k, u, theta, object_mesh,
         )
         u_ijk, theta_i = result
     else:
-        e_j = np.empty(3)
-        blas.dcopy(vertex_j, e_j)
-        blas.daxpy(vertex_i, e_j, a=-1.0)
+        e_j, e_k, e_kj = np.empty(3), np.empty(3), np.empty(3)
+        if edges is None:
+            blas.dcopy(vertex_j, e_j)
+            blas.daxpy(vertex_i, e_j, a=-1.0)
+            blas.dcopy(vertex_k, e_k)
+            blas.daxpy(vertex_i, e_k, a=-1.0)
+            blas.dcopy(vertex_k, e_kj)
+            blas.daxpy(vertex_j, e_kj, a=-1.0)
+        else:
+            # Copy the cached edge vectors, as they are scaled in-place below
+            blas.dcopy(edges[0], e_j)
+            blas.dcopy(edges[1], e_k)
+            blas.dcopy(edges[2], e_kj)
         e_j_norm = blas.dnrm2(e_j)
-
-        e_k = np.empty(3)
-        blas.dcopy(vertex_k, e_k)
-        blas.daxpy(vertex_i, e_k, a=-1.0)
         e_k_norm = blas.dnrm2(e_k)
-
-        e_kj = np.empty(3)
-        blas.dcopy(vertex_k, e_kj)
-        blas.daxpy(vertex_j, e_kj, a=-1.0)
         e_kj_sqnrm = blas.ddot(e_kj, e_kj)
 
         A = e_j_norm * e_k_norm * np.sin(compute_vector_angle(e_j, e_k, None))
@@ -146,6 +172,126 @@ def compute_u_ijk_and_angle(vertex_i, vertex_j, vertex_k, u, theta, object_mesh,
     return u_ijk, theta_i
 
 
+def compute_cached_u_ijk_and_angle(vertex_i, vertex_j, vertex_k, u, theta, mesh_geometry):
+    """Euclidean update procedure of the c-extension which takes the triangle geometry from a `MeshGeometry`
+
+    Parameters
+    ----------
+    vertex_i: [int, np.ndarray]
+        The index of the vertex for which we want to update the distance and angle
+    vertex_j: [int, np.ndarray]
+        The index of the second vertex in the triangle of vertex i
+    vertex_k: [int, np.ndarray]
+        The index of the third vertex in the triangle of vertex i
+    u: np.ndarray
+        The currently known radial coordinates
+    theta: np.ndarray
+        The currently known angular coordinates
+    mesh_geometry: MeshGeometry
+        The precomputed geometry of the mesh
+
+    Returns
+    -------
+    (float, float)
+        The Euclidean update u_ijk for vertex i (see equation 13 in paper) and the new angle vertex i. Arrays of
+        updates and angles are returned for batched inputs.
+    """
+    vertices_i, vertices_j, vertices_k = np.atleast_1d(vertex_i, vertex_j, vertex_k)
+    result = np.empty((vertices_i.shape[0], 2))
+    c_extension.compute_cached_dist_and_dir_batch(
+        result,
+        vertices_i,
+        vertices_j,
+        vertices_k,
+        u,
+        theta,
+        mesh_geometry.vertices,
+        mesh_geometry.topology.adjacency_indptr,
+        mesh_geometry.topology.adjacency_indices,
+        mesh_geometry.opposite_vertices,
+        mesh_geometry.adjacent_slots,
+        mesh_geometry.opposite_slots,
+        mesh_geometry.half_edge_vectors,
+        mesh_geometry.half_edge_lengths,
+        mesh_geometry.half_edge_squared_lengths,
+        mesh_geometry.corner_sines
+    )
+    if np.ndim(vertex_i) == 1:
+        return result[:, 0], result[:, 1]
+    return result[0, 0], result[0, 1]
+
+
+def compute_u_ijk_and_angle_vectorized(vertices_i, vertices_j, vertices_k, u_j, u_k, theta_j, theta_k, edges=None):
+    """Vectorized numpy-variant of the Euclidean update procedure for multiple triangles
+
+    Parameters
+    ----------
+    vertices_i: np.ndarray
+        A 2D-array of shape (n, 3) containing the coordinates of the vertices which shall be updated
+    vertices_j: np.ndarray
+        A 2D-array of shape (n, 3) containing the coordinates of the second vertices of the triangles
+    vertices_k: np.ndarray
+        A 2D-array of shape (n, 3) containing the coordinates of the third vertices of the triangles
+    u_j: np.ndarray
+        The radial coordinates of the second vertices
+    u_k: np.ndarray
+        The radial coordinates of the third vertices
+    theta_j: np.ndarray
+        The angular coordinates of the second vertices
+    theta_k: np.ndarray
+        The angular coordinates of the third vertices
+    edges: tuple
+        The precomputed edge vectors `vertices_j - vertices_i`, `vertices_k - vertices_i` and `vertices_k - vertices_j`
+        (see `MeshGeometry.get_edge_vectors`). Computed from the vertices if not given.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        The Euclidean updates u_ijk for the vertices i (see equation 13 in paper) and their new angles
+    """
+    if edges is None:
+        edges = vertices_j - vertices_i, vertices_k - vertices_i, vertices_k - vertices_j
+    e_j, e_k, e_kj = edges
+    e_j_norm = np.linalg.norm(e_j, axis=-1)
+    e_k_norm = np.linalg.norm(e_k, axis=-1)
+    e_kj_sqnrm = np.einsum("ij,ij->i", e_kj, e_kj)
+
+    A = e_j_norm * e_k_norm * np.sin(compute_vector_angle(e_j, e_k, None))
+    radicand = (e_kj_sqnrm - np.square(u_j - u_k)) * (np.square(u_j + u_k) - e_kj_sqnrm)
+
+    # Updates along the triangle edges (used if the triangle update is not valid)
+    j = u_j + e_j_norm
+    k = u_k + e_k_norm
+    edge_u_ijk = np.where(j <= k, j, k)
+    edge_theta_i = np.where(j <= k, theta_j, theta_k)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        H = np.sqrt(np.maximum(radicand, 0.))
+        u_j_sq, u_k_sq = np.square(u_j), np.square(u_k)
+        x_j = A * (e_kj_sqnrm + u_k_sq - u_j_sq) + np.einsum("ij,ij->i", e_k, e_kj) * H
+        x_k = A * (e_kj_sqnrm + u_j_sq - u_k_sq) - np.einsum("ij,ij->i", e_j, e_kj) * H
+        # If x_k < 0 or x_k < 0 then alpha > 1, causing theta_i to be negative (and we don't want that).
+        use_edges = (radicand <= 0) | (x_j < 0) | (x_k < 0)
+
+        # Compute distance
+        denominator = 2 * A * e_kj_sqnrm
+        result_vectors = (x_j / denominator)[:, None] * e_j + (x_k / denominator)[:, None] * e_k
+        u_ijk = np.linalg.norm(result_vectors, axis=-1)
+
+        # Compute angle
+        s = result_vectors + vertices_i
+        phi_kj = compute_vector_angle(vertices_k - s, vertices_j - s, None)
+        phi_ij = compute_vector_angle(vertices_i - s, vertices_j - s, None)
+        alpha = phi_ij / phi_kj
+
+        # Pay attention to 0-2pi-discontinuity
+        theta_k = np.where((theta_k <= theta_j) & (theta_j - theta_k >= np.pi), theta_k + 2 * np.pi, theta_k)
+        theta_j = np.where((theta_k > theta_j) & (theta_k - theta_j >= np.pi), theta_j + 2 * np.pi, theta_j)
+        theta_i = np.fmod((1 - alpha) * theta_j + alpha * theta_k, 2 * np.pi)
+
+    return np.where(use_edges, edge_u_ijk, u_ijk), np.where(use_edges, edge_theta_i, theta_i)
+
+
 def compute_distance_and_angle(vertex_i, vertex_j, gpc_system, use_c, rotation_axis):
     """Euclidean update procedure for geodesic distance approximation
 
@@ -176,37 +322,56 @@ def compute_distance_and_angle(vertex_i, vertex_j, gpc_system, use_c, rotation_a
     """
     # We consider both faces of `sorted_edge` for computing the coordinates to `vertex_i`
     sorted_edge = np.sort([vertex_i, vertex_j])
-    if (sorted_edge[0], sorted_edge[1]) in gpc_system.faces.keys():
+    if (sorted_edge[0], sorted_edge[1]) in gpc_system.faces:
         # Use cache to get faces of `sorted_edge`
         considered_faces = gpc_system.faces[(sorted_edge[0], sorted_edge[1])]
     else:
-        _, considered_faces = get_faces_of_edge(sorted_edge, gpc_system.object_mesh)
+        _, considered_faces = gpc_system.topology.get_faces_of_edge(sorted_edge)
 
     # Compute GPC for `vertex_i` considering both faces of `[vertex_i, vertex_j]`
-    updates = []
     k_vertices = []
+    known_k_vertices = []
     for face in considered_faces:
         vertex_k = [v for v in face if v not in [vertex_i, vertex_j]][0]
         k_vertices.append(vertex_k)
         # We need to know the distance to `vertex_k`
         if gpc_system.radial_coordinates[vertex_k] < np.inf and gpc_system.angular_coordinates[vertex_k] >= 0.:
+            known_k_vertices.append(vertex_k)
+
+    # If no GPC have been found for `vertex_i`, return default GPC
+    if not known_k_vertices:
+        return np.inf, -1.0, None
+
+    if use_c:
+        # Compute the updates of all faces with one call to the c-extension
+        n_updates = len(known_k_vertices)
+        u_ijk, phi_i = compute_u_ijk_and_angle(
+            np.full(n_updates, vertex_i),
+            np.full(n_updates, vertex_j),
+            np.array(known_k_vertices),
+            gpc_system.radial_coordinates,
+            gpc_system.angular_coordinates,
+            gpc_system.mesh_geometry,
+            use_c,
+            rotation_axis
+        )
+        updates = list(zip(u_ijk.tolist(), phi_i.tolist(), known_k_vertices))
+    else:
+        # Vectorizing numpy-operations over one or two faces does not pay off
+        updates = []
+        for vertex_k in known_k_vertices:
             u_ijk, phi_i = compute_u_ijk_and_angle(
                 vertex_i,
                 vertex_j,
                 vertex_k,
                 gpc_system.radial_coordinates,
                 gpc_system.angular_coordinates,
-                gpc_system.object_mesh,
+                gpc_system.mesh_geometry,
                 use_c,
                 rotation_axis
             )
             updates.append((u_ijk, phi_i, vertex_k))
 
-    # If no GPC have been found for `vertex_i`, return default GPC
-    if not updates:
-        return np.inf, -1.0, None
-
     # If two GPC have been found for `vertex_i`, return the smallest distance to `vertex_i`
-    else:
-        u_ijk, phi_i, vertex_k = min(updates)
-        return u_ijk, phi_i, k_vertices
+    u_ijk, phi_i, vertex_k = min(updates)
+    return u_ijk, phi_i, k_vertices
@@ -0,0 +1,248 @@
+from geoconv.preprocessing.mesh_topology import MeshTopology
+from geoconv.utils.misc import compute_vector_angle
+
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+import numpy as np
+
+
+class HeatMethod:
+    def __init__(self, object_mesh, topology=None, time_step=None, regularization=1e-8):
+        """Approximates GPC-systems with the heat method and the vector heat method.
+
+        Compare:
+        > [The Heat Method for Distance Computation](https://doi.org/10.1145/3131280)
+        > Keenan Crane, Clarisse Weischedel and Max Wardetzky
+
+        > [The Vector Heat Method](https://doi.org/10.1145/3243651)
+        > Nicholas Sharp, Yousuf Soliman and Keenan Crane
+
+        Radial coordinates are geodesic distances computed with the heat method. Angular coordinates are computed with
+        the vector heat method by comparing the parallel transport of the reference direction of the source point with
+        the diffused radial direction. Tangent spaces are described by the angles of the outgoing edges of a vertex
+        w.r.t. the edge to its first neighbor, rotating around the vertex normal. The reference direction of a
+        GPC-system is therefore the same as in `GPCSystem`.
+
+        All linear systems are factorized once for the whole mesh. Afterward, GPC-systems for many source points are
+        obtained by a few sparse solves with one right-hand side per source point.
+
+        Parameters
+        ----------
+        object_mesh: trimesh.Trimesh
+            A loaded object mesh.
+        topology: MeshTopology
+            The precomputed topology of `object_mesh`. If not given, it will be computed.
+        time_step: float
+            The time step of the heat flow. Defaults to the squared mean edge length.
+        regularization: float
+            The mass-matrix multiple that is added to the Laplacian of the Poisson problem, which is singular otherwise.
+        """
+        self.vertices = np.asarray(object_mesh.vertices, dtype=np.float64)
+        self.vertex_normals = np.asarray(object_mesh.vertex_normals, dtype=np.float64)
+        self.faces = np.asarray(object_mesh.faces, dtype=np.int64)
+        if topology is None:
+            topology = MeshTopology(self.faces, self.vertices.shape[0])
+        self.topology = topology
+        n_vertices, n_faces = self.vertices.shape[0], self.faces.shape[0]
+
+        ####################
+        # Gradient operator
+        ####################
+        p0, p1, p2 = self.vertices[self.faces[:, 0]], self.vertices[self.faces[:, 1]], self.vertices[self.faces[:, 2]]
+        face_normals = np.cross(p1 - p0, p2 - p0)
+        double_areas = np.linalg.norm(face_normals, axis=-1)
+        face_normals = face_normals / double_areas[:, None]
+        # grad(u) = 1 / (2A) * sum_i u_i * (N x e_i), with e_i being the edge opposite to vertex i
+        rows, cols, data = [], [], []
+        for vertex_idx, opposite_edge in enumerate([p2 - p1, p0 - p2, p1 - p0]):
+            rotated_edge = np.cross(face_normals, opposite_edge) / double_areas[:, None]
+            for component in range(3):
+                rows.append(component * n_faces + np.arange(n_faces))
+                cols.append(self.faces[:, vertex_idx])
+                data.append(rotated_edge[:, component])
+        self.gradient = sparse.csr_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))), shape=(3 * n_faces, n_vertices)
+        )
+        self.face_areas = sparse.diags(np.tile(double_areas / 2, 3))
+
+        ######################################
+        # Cotangent Laplacian and mass matrix
+        ######################################
+        laplacian = (self.gradient.T @ self.face_areas @ self.gradient).tocsr()
+        vertex_areas = np.bincount(self.faces.reshape(-1), weights=np.repeat(double_areas / 6, 3), minlength=n_vertices)
+        mass = sparse.diags(vertex_areas)
+        if time_step is None:
+            time_step = np.linalg.norm(
+                self.vertices[topology.edges[:, 0]] - self.vertices[topology.edges[:, 1]], axis=-1
+            ).mean() ** 2
+        self.time_step = time_step
+
+        ############################################
+        # Tangent spaces and Levi-Civita connection
+        ############################################
+        # Angle of each outgoing edge w.r.t. the edge to the first neighbor
+        sources = np.repeat(np.arange(n_vertices), np.diff(topology.adjacency_indptr))
+        first_neighbors = topology.adjacency_indices[topology.adjacency_indptr[:-1]]
+        reference_edges = self.vertices[first_neighbors[sources]] - self.vertices[sources]
+        outgoing_edges = self.vertices[topology.adjacency_indices] - self.vertices[sources]
+        self.edge_angles = compute_vector_angle(reference_edges, outgoing_edges, None)
+        opposite_direction = np.einsum(
+            "ij,ij->i", np.cross(reference_edges, outgoing_edges), self.vertex_normals[sources]
+        ) < 0.0
+        self.edge_angles = np.where(opposite_direction, 2 * np.pi - self.edge_angles, self.edge_angles)
+        self.edge_angles[topology.adjacency_indptr[:-1]] = 0.
+
+        # Angle of edge (i, j) in the tangent space of i and of j
+        edge_angles = np.zeros((topology.edges.shape[0], 2))
+        is_first = self.topology.edges[topology.adjacency_edges, 0] == sources
+        edge_angles[topology.adjacency_edges, np.where(is_first, 0, 1)] = self.edge_angles
+        # Transport from the tangent space of j into the one of i
+        transport = np.exp(1j * (edge_angles[:, 0] - edge_angles[:, 1] + np.pi))
+        weights = -np.asarray(laplacian[topology.edges[:, 0], topology.edges[:, 1]]).reshape(-1)
+        connection_laplacian = sparse.csr_matrix(
+            (
+                np.concatenate([-weights * transport, -weights * np.conj(transport)]),
+                (
+                    np.concatenate([topology.edges[:, 0], topology.edges[:, 1]]),
+                    np.concatenate([topology.edges[:, 1], topology.edges[:, 0]])
+                )
+            ),
+            shape=(n_vertices, n_vertices)
+        ) + sparse.diags(laplacian.diagonal().astype(np.complex128))
+
+        ##################
+        # Factorizations
+        ##################
+        self.heat_solver = splu((mass + time_step * laplacian).tocsc())
+        self.poisson_solver = splu((laplacian + regularization * mass).tocsc())
+        self.vector_heat_solver = splu((mass + time_step * connection_laplacian).tocsc())
+
+    def compute_distances(self, source_points):
+        """Computes geodesic distances to multiple source points.
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The indices of the source points.
+
+        Returns
+        -------
+        np.ndarray:
+            A 2D-array of shape (n_vertices, n_source_points) containing the geodesic distances to each source point.
+        """
+        n_vertices, n_faces = self.vertices.shape[0], self.faces.shape[0]
+        columns = np.arange(source_points.shape[0])
+
+        # Diffuse heat from the source points
+        heat = np.zeros((n_vertices, source_points.shape[0]))
+        heat[source_points, columns] = 1.
+        heat = self.heat_solver.solve(heat)
+
+        # Normalize the negated gradient of the heat
+        gradient = (self.gradient @ heat).reshape((3, n_faces, -1))
+        gradient_norm = np.linalg.norm(gradient, axis=0)
+        gradient_norm[gradient_norm == 0.] = 1.
+        unit_field = -gradient / gradient_norm[None]
+
+        # Recover the distances whose gradients fit the unit vector field best
+        divergence = self.gradient.T @ (self.face_areas @ unit_field.reshape((3 * n_faces, -1)))
+        distances = self.poisson_solver.solve(divergence)
+        return distances - distances[source_points, columns][None]
+
+    def compute_angles(self, source_points):
+        """Computes the angular coordinates of all vertices w.r.t. multiple source points.
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The indices of the source points.
+
+        Returns
+        -------
+        np.ndarray:
+            A 2D-array of shape (n_vertices, n_source_points) containing the angular coordinates in [0, 2 * pi[.
+        """
+        n_vertices = self.vertices.shape[0]
+        columns = np.arange(source_points.shape[0])
+
+        # Parallel transport of the reference direction of each source point
+        reference_directions = np.zeros((n_vertices, source_points.shape[0]), dtype=np.complex128)
+        reference_directions[source_points, columns] = 1.
+        reference_directions = self.vector_heat_solver.solve(reference_directions)
+
+        # Diffusion of the radial directions at the neighbors of each source point
+        radial_directions = np.zeros((n_vertices, source_points.shape[0]), dtype=np.complex128)
+        for column, source_point in enumerate(source_points):
+            start, end = self.topology.adjacency_indptr[source_point], self.topology.adjacency_indptr[source_point + 1]
+            neighbors = self.topology.adjacency_indices[start:end]
+            radial_directions[neighbors, column] = np.exp(1j * (self._get_edge_angles(neighbors, source_point) + np.pi))
+        radial_directions = self.vector_heat_solver.solve(radial_directions)
+
+        return np.mod(np.angle(radial_directions / reference_directions), 2 * np.pi)
+
+    def _get_edge_angles(self, vertices, neighbor):
+        """Returns the angles of the edges from each of `vertices` to a common neighbor in their tangent spaces"""
+        angles = np.zeros((vertices.shape[0],))
+        for idx, vertex in enumerate(vertices):
+            start, end = self.topology.adjacency_indptr[vertex], self.topology.adjacency_indptr[vertex + 1]
+            position = np.nonzero(self.topology.adjacency_indices[start:end] == neighbor)[0][0]
+            angles[idx] = self.edge_angles[start + position]
+        return angles
+
+    def compute_gpc_system_states(self, source_points, u_max):
+        """Computes the GPC-systems for multiple source points and returns their states.
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The indices of the source points.
+        u_max: float
+            The maximal radius for each GPC-system.
+
+        Returns
+        -------
+        list:
+            The states of the GPC-systems (see `GPCSystem.get_state`). The faces of a GPC-system are all faces whose
+            vertices are within `u_max`, ordered by the largest radial coordinate of their vertices.
+        """
+        source_points = np.asarray(source_points, dtype=np.int64)
+        distances = self.compute_distances(source_points)
+        angles = self.compute_angles(source_points)
+
+        states = []
+        for column, source_point in enumerate(source_points.tolist()):
+            radial_coordinates, angular_coordinates = distances[:, column], angles[:, column]
+
+            # The one-hop-neighborhood is known exactly
+            start, end = self.topology.adjacency_indptr[source_point], self.topology.adjacency_indptr[source_point + 1]
+            neighbors = self.topology.adjacency_indices[start:end]
+            radial_coordinates[neighbors] = np.linalg.norm(
+                self.vertices[neighbors] - self.vertices[source_point], axis=-1
+            )
+            angular_coordinates[neighbors] = self.edge_angles[start:end]
+            radial_coordinates[source_point], angular_coordinates[source_point] = 0., 0.
+
+            # Capture all faces whose vertices are within the maximal radius
+            face_radial_coordinates = radial_coordinates[self.faces].max(axis=-1)
+            face_indices = np.nonzero(face_radial_coordinates < u_max)[0]
+            face_indices = face_indices[np.argsort(face_radial_coordinates[face_indices], kind="stable")]
+            faces = np.sort(self.faces[face_indices], axis=-1)
+            face_edges = faces[:, [0, 1, 1, 2, 0, 2]].reshape((-1, 2))
+            _, first_occurrence = np.unique(face_edges, axis=0, return_index=True)
+
+            vertex_indices = np.unique(faces)
+            states.append({
+                "source_point": source_point,
+                "n_vertices": self.vertices.shape[0],
+                "vertex_indices": vertex_indices,
+                "radial_coordinates": radial_coordinates[vertex_indices],
+                "angular_coordinates": angular_coordinates[vertex_indices],
+                "x_coordinates": radial_coordinates[vertex_indices] * np.cos(angular_coordinates[vertex_indices]),
+                "y_coordinates": radial_coordinates[vertex_indices] * np.sin(angular_coordinates[vertex_indices]),
+                "edges": face_edges[np.sort(first_occurrence)],
+                "faces": faces,
+                "cell_size": radial_coordinates[neighbors].mean(),
+                "truncation_radius": None
+            })
+        return states
@@ -0,0 +1,100 @@
+class IndexedMinHeap:
+    def __init__(self, entries=()):
+        """Binary min-heap over (key, item)-pairs which stores each item at most once.
+
+        The position of each item within the heap is remembered, such that the key of a queued item can be decreased
+        in logarithmic time instead of pushing a second entry for it. Thus, popped items always carry their current
+        key. Entries are ordered like tuples, i.e. ties between keys are broken by the items.
+
+        Parameters
+        ----------
+        entries: iterable
+            Initial (key, item)-pairs.
+        """
+        self._heap = []
+        self._positions = {}
+        for key, item in entries:
+            self.push(key, item)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def push(self, key, item):
+        """Inserts an item or decreases its key if it is already queued
+
+        Parameters
+        ----------
+        key: float
+            The key of the item
+        item: int
+            The item
+
+        Returns
+        -------
+        bool:
+            Whether the item has already been queued, i.e. whether its key has been decreased.
+        """
+        position = self._positions.get(item)
+        if position is None:
+            self._heap.append((key, item))
+            self._positions[item] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return False
+        if (key, item) < self._heap[position]:
+            self._heap[position] = (key, item)
+            self._sift_up(position)
+        return True
+
+    def pop(self):
+        """Removes and returns the entry with the smallest key
+
+        Returns
+        -------
+        (float, int):
+            The smallest key and its item.
+        """
+        entry = self._heap[0]
+        last = self._heap.pop()
+        del self._positions[entry[1]]
+        if self._heap:
+            self._heap[0] = last
+            self._positions[last[1]] = 0
+            self._sift_down(0)
+        return entry
+
+    def _sift_up(self, position):
+        heap, positions = self._heap, self._positions
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[position] = heap[parent]
+            positions[heap[position][1]] = position
+            position = parent
+        heap[position] = entry
+        positions[entry[1]] = position
+
+    def _sift_down(self, position):
+        heap, positions = self._heap, self._positions
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[position] = heap[child]
+            positions[heap[position][1]] = position
+            position = child
+        heap[position] = entry
+        positions[entry[1]] = position
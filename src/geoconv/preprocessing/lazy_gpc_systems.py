@@ -0,0 +1,238 @@
+from geoconv.preprocessing.barycentric_coordinates import (
+    create_template_matrix, compute_gpc_system_barycentric_coordinates
+)
+from geoconv.preprocessing.packed_gpc_systems import PackedGPCSystem
+
+from collections import OrderedDict
+
+import numpy as np
+import json
+import os
+
+
+# The arrays which are cached for each GPC-system
+CACHED_ARRAYS = ["vertex_indices", "radial_coordinates", "angular_coordinates", "faces"]
+
+
+class LazyGPCSystems:
+    def __init__(self,
+                 gpc_system_group,
+                 u_max=.04,
+                 n_radial=None,
+                 n_angular=None,
+                 template_radius=None,
+                 max_bytes=256 * 2 ** 20,
+                 spill_dir=""):
+        """GPC-systems which are computed when they are requested for the first time.
+
+        Indexing returns a `PackedGPCSystem`-view, such that `LazyGPCSystems` can replace the array of GPC-systems in
+        `GPCSystemGroup.object_mesh_gpc_systems`. Computed GPC-systems and their barycentric coordinates are kept in
+        a least-recently-used cache. If the cached arrays exceed `max_bytes`, the least-recently-used entries are
+        evicted. Evicted entries are written to `spill_dir` (if given) and read from there, instead of being
+        re-computed, when they are requested again. A spill directory can be re-used by later `LazyGPCSystems` for the
+        same mesh (see `GPCSystemGroup.get_mesh_fingerprint`) and configuration. Otherwise, a `RuntimeError` is raised.
+
+        Parameters
+        ----------
+        gpc_system_group: GPCSystemGroup
+            The GPC-system-group that is used to compute the GPC-systems.
+        u_max: float
+            The maximal radius for each GPC-system.
+        n_radial: int
+            The amount of radial coordinates of the template. Only required for barycentric coordinates.
+        n_angular: int
+            The amount of angular coordinates of the template. Only required for barycentric coordinates.
+        template_radius: float
+            The radius of the template. Only required for barycentric coordinates.
+        max_bytes: int
+            The maximal amount of bytes of all cached arrays.
+        spill_dir: str
+            If given, evicted entries are stored in this directory.
+        """
+        self.gpc_system_group = gpc_system_group
+        self.u_max = u_max
+        self.n_vertices = gpc_system_group.object_mesh.vertices.shape[0]
+        self.template_matrix = None
+        if n_radial is not None and n_angular is not None and template_radius is not None:
+            self.template_matrix = create_template_matrix(
+                n_radial=n_radial, n_angular=n_angular, radius=template_radius, in_cart=True
+            )
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.properties = {
+            "n_vertices": self.n_vertices,
+            "u_max": u_max,
+            "eps": gpc_system_group.eps,
+            "dtype": gpc_system_group.dtype.name,
+            "n_radial": n_radial,
+            "n_angular": n_angular,
+            "template_radius": template_radius,
+            "mesh_fingerprint": gpc_system_group.get_mesh_fingerprint()
+        }
+
+        self.cache = OrderedDict()
+        self.spilled = set()
+        self.nbytes = 0
+        self._gpc_system = None
+        if self.spill_dir:
+            self._open_spill_dir()
+
+    def __len__(self):
+        return self.n_vertices
+
+    def __getitem__(self, idx):
+        idx = self._index(idx)
+        entry = self._get_entry(idx)
+        return PackedGPCSystem(
+            idx,
+            self.n_vertices,
+            entry["vertex_indices"],
+            entry["radial_coordinates"],
+            entry["angular_coordinates"],
+            entry["faces"]
+        )
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __contains__(self, idx):
+        return idx in self.cache
+
+    def get_barycentric_coordinates(self, idx):
+        """Returns the barycentric coordinates of the template vertices within a GPC-system.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the source point of the GPC-system.
+
+        Returns
+        -------
+        np.ndarray:
+            A 4D-array containing the barycentric coordinates (see `compute_gpc_system_barycentric_coordinates`).
+        """
+        if self.template_matrix is None:
+            raise RuntimeError("Barycentric coordinates require 'n_radial', 'n_angular' and 'template_radius'.")
+        idx = self._index(idx)
+        entry = self._get_entry(idx)
+        if "barycentric_coordinates" not in entry:
+            entry["barycentric_coordinates"] = compute_gpc_system_barycentric_coordinates(
+                self[idx], self.template_matrix, dtype=self.gpc_system_group.dtype
+            )
+            self.nbytes += entry["barycentric_coordinates"].nbytes
+            self._evict()
+        return entry["barycentric_coordinates"]
+
+    def get_reaching_gpc_systems(self, vertices):
+        """Returns the computed GPC-systems which reach any of the given vertices.
+
+        GPC-systems that have not been computed yet are not returned, since they are computed for the current vertex
+        positions once they are requested.
+
+        Parameters
+        ----------
+        vertices: np.ndarray
+            The indices of the vertices.
+
+        Returns
+        -------
+        np.ndarray:
+            The indices of the computed GPC-systems which reach any of the given vertices.
+        """
+        reaching = []
+        for idx in sorted(set(self.cache) | self.spilled):
+            if idx in self.cache:
+                vertex_indices = self.cache[idx]["vertex_indices"]
+            else:
+                with np.load(self._spill_path(idx)) as spilled_entry:
+                    vertex_indices = spilled_entry["vertex_indices"]
+            if np.isin(vertex_indices, vertices).any():
+                reaching.append(idx)
+        return np.array(reaching, dtype=np.int64)
+
+    def invalidate(self, indices):
+        """Discards computed GPC-systems, e.g. after vertices of the mesh have been moved.
+
+        The GPC-systems and their barycentric coordinates are removed from the cache and from the spill directory.
+        They are computed again once they are requested.
+
+        Parameters
+        ----------
+        indices: np.ndarray
+            The indices of the GPC-systems to discard.
+        """
+        for idx in indices:
+            idx = self._index(idx)
+            entry = self.cache.pop(idx, None)
+            if entry is not None:
+                self.nbytes -= sum(array.nbytes for array in entry.values())
+            if idx in self.spilled:
+                os.remove(self._spill_path(idx))
+                self.spilled.discard(idx)
+        # The re-used GPC-system refers to the previous vertex positions
+        self._gpc_system = None
+        self.properties["mesh_fingerprint"] = self.gpc_system_group.get_mesh_fingerprint()
+        if self.spill_dir:
+            self._write_manifest()
+
+    def _open_spill_dir(self):
+        if not os.path.exists(self.spill_dir):
+            os.makedirs(self.spill_dir)
+        spilled = [f for f in os.listdir(self.spill_dir) if f.startswith("gpc_system_") and f.endswith(".npz")]
+        manifest_path = f"{self.spill_dir}/manifest.json"
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r") as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest != self.properties:
+                raise RuntimeError(
+                    f"The GPC-systems in '{self.spill_dir}' have been computed with {manifest}, which differs from the "
+                    f"current configuration {self.properties}."
+                )
+        elif spilled:
+            raise RuntimeError(f"The GPC-systems in '{self.spill_dir}' have been stored without a manifest.")
+        else:
+            self._write_manifest()
+        self.spilled = {int(f[len("gpc_system_"):-len(".npz")]) for f in spilled}
+
+    def _write_manifest(self):
+        with open(f"{self.spill_dir}/manifest.json", "w") as manifest_file:
+            json.dump(self.properties, manifest_file, indent=4)
+
+    def _spill_path(self, idx):
+        return f"{self.spill_dir}/gpc_system_{idx}.npz"
+
+    def _index(self, idx):
+        idx = int(idx)
+        if idx < 0:
+            idx += self.n_vertices
+        if not 0 <= idx < self.n_vertices:
+            raise IndexError(f"GPC-system index {idx} is out of bounds for {self.n_vertices} vertices.")
+        return idx
+
+    def _get_entry(self, idx):
+        if idx in self.cache:
+            self.cache.move_to_end(idx)
+            return self.cache[idx]
+
+        if idx in self.spilled:
+            with np.load(self._spill_path(idx)) as spilled_entry:
+                entry = {key: spilled_entry[key] for key in spilled_entry.files}
+        else:
+            self._gpc_system = self.gpc_system_group.compute_gpc_system(idx, self.u_max, gpc_system=self._gpc_system)
+            state = self._gpc_system.get_state(dtype=self.gpc_system_group.dtype)
+            entry = {key: state[key] for key in CACHED_ARRAYS}
+
+        self.cache[idx] = entry
+        self.nbytes += sum(array.nbytes for array in entry.values())
+        self._evict()
+        return entry
+
+    def _evict(self):
+        # Always keep the most recently used entry
+        while self.nbytes > self.max_bytes and len(self.cache) > 1:
+            idx, entry = self.cache.popitem(last=False)
+            self.nbytes -= sum(array.nbytes for array in entry.values())
+            if self.spill_dir:
+                np.savez(self._spill_path(idx), **entry)
+                self.spilled.add(idx)
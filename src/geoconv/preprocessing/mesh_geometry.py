@@ -0,0 +1,169 @@
+from geoconv.preprocessing.mesh_topology import MeshTopology
+
+import c_extension
+import numpy as np
+
+
+# The arrays which describe the geometry of a mesh (see `MeshGeometry`)
+GEOMETRY_ARRAYS = [
+    "vertices",
+    "vertex_normals",
+    "half_edge_vectors",
+    "half_edge_lengths",
+    "half_edge_squared_lengths",
+    "corner_angles",
+    "corner_sines"
+]
+
+# The half-edge tables of `MeshTopology` which are also accessible via `MeshGeometry`
+CONNECTIVITY_ARRAYS = ["reverse_slots", "opposite_vertices", "adjacent_slots", "opposite_slots"]
+
+
+class MeshGeometry:
+    def __init__(self, object_mesh, topology=None):
+        """Precomputed geometry of the triangle corners that are visited by the Euclidean update.
+
+        The update of a vertex `i` from a triangle `(i, j, k)` (see `compute_u_ijk_and_angle`) uses the edge vectors
+        `(i, j)`, `(i, k)` and `(j, k)`, their lengths and the angle of the triangle at `i`. These are computed once per
+        mesh and stored per half-edge slot (see the half-edge tables of `MeshTopology`):
+            - half_edge_vectors: The vectors `vertices[j] - vertices[i]`.
+            - half_edge_lengths / half_edge_squared_lengths: The (squared) lengths of the half-edges.
+            - corner_angles / corner_sines: The angle of the triangle `(i, j, k)` at `i` together with its sine for each
+              third vertex `k` in `opposite_vertices`.
+
+        The lengths and angles are computed by the c-extension with the same operations as the update itself, such that
+        updates from the cache equal updates from the vertices.
+
+        The half-edge tables (see `CONNECTIVITY_ARRAYS`) only depend on the connectivity. They are taken from the
+        topology, such that meshes with identical connectivity only compute the vertex-dependent arrays.
+
+        Furthermore, the vertices and vertex normals of the mesh are kept as plain arrays. In difference to accessing
+        them via a `trimesh.Trimesh`, this does not cause trimesh to check its cache (which hashes the arrays) on every
+        access. All arrays are read-only after construction and can be shared among workers (see `from_arrays`).
+
+        Parameters
+        ----------
+        object_mesh: trimesh.Trimesh
+            A loaded object mesh.
+        topology: MeshTopology
+            The precomputed topology of `object_mesh`. If not given, it will be computed.
+        """
+        self.vertices = np.array(object_mesh.vertices, dtype=np.float64)
+        self.vertex_normals = np.array(object_mesh.vertex_normals, dtype=np.float64)
+        if topology is None:
+            topology = MeshTopology(object_mesh.faces, self.vertices.shape[0])
+        self._init_connectivity(topology)
+
+        ##############
+        # Half-edges
+        ##############
+        sources = np.repeat(np.arange(self.vertices.shape[0]), np.diff(topology.adjacency_indptr))
+        self.half_edge_vectors = self.vertices[topology.adjacency_indices] - self.vertices[sources]
+        self.half_edge_lengths = np.empty(self.half_edge_vectors.shape[0])
+        self.half_edge_squared_lengths = np.empty(self.half_edge_vectors.shape[0])
+
+        ##########
+        # Corners
+        ##########
+        self.corner_angles = np.empty(self.adjacent_slots.shape)
+        self.corner_sines = np.empty(self.adjacent_slots.shape)
+        c_extension.compute_half_edge_geometry(
+            self.half_edge_lengths,
+            self.half_edge_squared_lengths,
+            self.corner_angles,
+            self.corner_sines,
+            self.half_edge_vectors,
+            self.adjacent_slots
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays, topology):
+        """Re-creates the geometry of a mesh from its arrays without re-computing them.
+
+        Parameters
+        ----------
+        arrays: dict
+            Maps the names in `GEOMETRY_ARRAYS` to the corresponding arrays of a `MeshGeometry`.
+        topology: MeshTopology
+            The topology of the mesh.
+
+        Returns
+        -------
+        MeshGeometry:
+            The geometry described by `arrays`.
+        """
+        mesh_geometry = cls.__new__(cls)
+        for key in GEOMETRY_ARRAYS:
+            setattr(mesh_geometry, key, arrays[key])
+        mesh_geometry._init_connectivity(topology)
+        return mesh_geometry
+
+    def _init_connectivity(self, topology):
+        self.topology = topology
+        for key in CONNECTIVITY_ARRAYS:
+            setattr(self, key, getattr(topology, key))
+
+    def get_slot(self, vertex_i, vertex_j):
+        """Returns the slot of the half-edge from `vertex_i` to `vertex_j` (see `MeshTopology.get_slot`)
+
+        Parameters
+        ----------
+        vertex_i: int
+            The first vertex of the half-edge
+        vertex_j: int
+            The second vertex of the half-edge
+
+        Returns
+        -------
+        int:
+            The slot of the half-edge. Raises a `ValueError` if both vertices are not connected.
+        """
+        return self.topology.get_slot(vertex_i, vertex_j)
+
+    def get_corners(self, vertices_i, vertices_j, vertices_k):
+        """Returns the corners of triangles `(i, j, k)` at `i` given as (slot of `(i, j)`, index of `k`)-pairs
+
+        Parameters
+        ----------
+        vertices_i: [int, np.ndarray]
+            The vertices at which the corners are located
+        vertices_j: [int, np.ndarray]
+            The second vertices of the triangles
+        vertices_k: [int, np.ndarray]
+            The third vertices of the triangles
+
+        Returns
+        -------
+        ([int, np.ndarray], [int, np.ndarray]):
+            The slots of the half-edges `(i, j)` and the positions of `k` in `opposite_vertices[slot]`.
+        """
+        if np.ndim(vertices_i) == 0:
+            slot = self.topology.get_slot(vertices_i, vertices_j)
+            return slot, self.opposite_vertices[slot].tolist().index(vertices_k)
+        slots = self.topology.find_slots(np.asarray(vertices_i), np.asarray(vertices_j))
+        positions = np.argmax(self.opposite_vertices[slots] == np.asarray(vertices_k)[:, None], axis=-1)
+        return slots, positions
+
+    def get_edge_vectors(self, vertices_i, vertices_j, vertices_k):
+        """Returns the edge vectors `(i, j)`, `(i, k)` and `(j, k)` of triangles `(i, j, k)`
+
+        Parameters
+        ----------
+        vertices_i: [int, np.ndarray]
+            The first vertices of the triangles
+        vertices_j: [int, np.ndarray]
+            The second vertices of the triangles
+        vertices_k: [int, np.ndarray]
+            The third vertices of the triangles
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray, np.ndarray):
+            The vectors `vertices[j] - vertices[i]`, `vertices[k] - vertices[i]` and `vertices[k] - vertices[j]`.
+        """
+        slots, positions = self.get_corners(vertices_i, vertices_j, vertices_k)
+        return (
+            self.half_edge_vectors[slots],
+            self.half_edge_vectors[self.adjacent_slots[slots, positions]],
+            self.half_edge_vectors[self.opposite_slots[slots, positions]]
+        )
@@ -0,0 +1,225 @@
+import numpy as np
+
+
+class MeshTopology:
+    def __init__(self, faces, n_vertices=None):
+        """Array-backed connectivity of a triangle mesh.
+
+        The topology is computed once per mesh and answers the neighborhood queries of the GPC-algorithm in constant
+        time (w.r.t. the mesh size). It stores:
+            - Vertex adjacency: CSR-arrays `adjacency_indptr` and `adjacency_indices`. The neighbors of vertex `v` are
+              given by `adjacency_indices[adjacency_indptr[v]:adjacency_indptr[v + 1]]`. `adjacency_edges` stores the
+              index of the corresponding (unique) edge for each neighbor.
+            - Edge-to-face table: CSR-arrays `edge_faces_indptr` and `edge_faces_indices` which contain the face
+              indices of each unique edge.
+            - Face-to-edge table: `face_edges[f]` contains the indices of the three unique edges of face `f`.
+            - Half-edge tables: A half-edge `(i, j)` is identified by its slot in the CSR-adjacency, i.e.
+              `slot = adjacency_indptr[i] + n` if `j` is the n-th neighbor of `i`. `reverse_slots` contains the slots
+              of the half-edges `(j, i)`. `opposite_vertices` contains the third vertices `k` of the faces of each
+              half-edge in the order of the edge-face-lookup, padded with -1. `adjacent_slots` and `opposite_slots`
+              contain the slots of the half-edges `(i, k)` and `(j, k)` for each third vertex.
+
+        The topology only depends on the faces. Hence, it can be computed once and re-used for all meshes with
+        identical connectivity, e.g. for the registrations of a data set or the frames of a mesh sequence (see
+        `matches`).
+
+        The neighbor- and face-orders equal the ones of `get_neighbors` and `get_faces_of_edge` for a
+        `trimesh.Trimesh` with the same faces, such that both yield identical GPC-systems.
+
+        Parameters
+        ----------
+        faces: np.ndarray
+            A 2D-array of shape (n_faces, 3) containing the vertex indices of each face.
+        n_vertices: int
+            The amount of vertices in the mesh. If not given, it is inferred from `faces`.
+        """
+        self.faces = np.asarray(faces, dtype=np.int64)
+        self.n_vertices = int(self.faces.max()) + 1 if n_vertices is None else n_vertices
+        n_faces = self.faces.shape[0]
+
+        ##################
+        # Determine edges
+        ##################
+        # Same ordering as 'trimesh.Trimesh.edges_sorted': three edges per face
+        face_edges_sorted = np.sort(self.faces[:, [0, 1, 1, 2, 2, 0]].reshape((-1, 2)), axis=1)
+        # Ordering unique edges by (second vertex, first vertex) resembles the order of 'trimesh.Trimesh.edges_unique'
+        edge_keys = face_edges_sorted[:, 1] * self.n_vertices + face_edges_sorted[:, 0]
+        _, first_occurrence, inverse = np.unique(edge_keys, return_index=True, return_inverse=True)
+        self.edges = face_edges_sorted[first_occurrence]
+        self.face_edges = inverse.reshape((n_faces, 3))
+        n_edges = self.edges.shape[0]
+
+        ##############################
+        # CSR vertex adjacency matrix
+        ##############################
+        # Neighbors are ordered by the edge index, which resembles the insertion order of the vertex adjacency graph
+        sources = self.edges.reshape(-1)
+        targets = self.edges[:, ::-1].reshape(-1)
+        edge_ids = np.repeat(np.arange(n_edges), 2)
+        order = np.argsort(sources, kind="stable")
+        self.adjacency_indptr = np.zeros(self.n_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=self.n_vertices), out=self.adjacency_indptr[1:])
+        self.adjacency_indices = targets[order]
+        self.adjacency_edges = edge_ids[order]
+
+        #######################
+        # CSR edge-face-lookup
+        #######################
+        edge_of_face_edge = self.face_edges.reshape(-1)
+        face_of_face_edge = np.repeat(np.arange(n_faces), 3)
+        order = np.argsort(edge_of_face_edge, kind="stable")
+        self.edge_faces_indptr = np.zeros(n_edges + 1, dtype=np.int64)
+        np.cumsum(np.bincount(edge_of_face_edge, minlength=n_edges), out=self.edge_faces_indptr[1:])
+        self.edge_faces_indices = face_of_face_edge[order]
+
+        ###################
+        # Half-edge tables
+        ###################
+        # Slots sorted by the keys of their half-edges for vectorized lookups
+        slot_sources = np.repeat(np.arange(self.n_vertices), np.diff(self.adjacency_indptr))
+        slot_keys = slot_sources * self.n_vertices + self.adjacency_indices
+        self._sorted_slots = np.argsort(slot_keys, kind="stable")
+        self._sorted_slot_keys = slot_keys[self._sorted_slots]
+        self.reverse_slots = self.find_slots(self.adjacency_indices, slot_sources)
+
+        edge_face_counts = np.diff(self.edge_faces_indptr)
+        max_edge_faces = max(int(edge_face_counts.max(initial=0)), 1)
+        edge_opposites = np.full((n_edges, max_edge_faces), -1, dtype=np.int64)
+        face_rows = np.repeat(np.arange(n_edges), edge_face_counts)
+        face_cols = np.arange(self.edge_faces_indices.shape[0]) - self.edge_faces_indptr[face_rows]
+        edge_opposites[face_rows, face_cols] = (
+            self.faces[self.edge_faces_indices].sum(axis=-1) - self.edges[face_rows].sum(axis=-1)
+        )
+        self.opposite_vertices = edge_opposites[self.adjacency_edges]
+
+        valid = self.opposite_vertices != -1
+        self.adjacent_slots = np.full(valid.shape, -1, dtype=np.int64)
+        self.opposite_slots = np.full(valid.shape, -1, dtype=np.int64)
+        self.adjacent_slots[valid] = self.find_slots(
+            np.broadcast_to(slot_sources[:, None], valid.shape)[valid], self.opposite_vertices[valid]
+        )
+        self.opposite_slots[valid] = self.find_slots(
+            np.broadcast_to(self.adjacency_indices[:, None], valid.shape)[valid], self.opposite_vertices[valid]
+        )
+
+        # Python lists for fast scalar access within the GPC-algorithm
+        self._slot_offsets = self.adjacency_indptr.tolist()
+        self._neighbors = [
+            self.adjacency_indices[self.adjacency_indptr[v]:self.adjacency_indptr[v + 1]].tolist()
+            for v in range(self.n_vertices)
+        ]
+        self._neighbor_edges = [
+            self.adjacency_edges[self.adjacency_indptr[v]:self.adjacency_indptr[v + 1]].tolist()
+            for v in range(self.n_vertices)
+        ]
+
+    def matches(self, faces, n_vertices=None):
+        """Checks whether the topology describes a mesh with the given faces
+
+        Parameters
+        ----------
+        faces: np.ndarray
+            A 2D-array of shape (n_faces, 3) containing the vertex indices of each face.
+        n_vertices: int
+            The amount of vertices in the mesh. Not checked if not given.
+
+        Returns
+        -------
+        bool:
+            Whether the topology has been computed from the same faces (and vertex count).
+        """
+        if n_vertices is not None and n_vertices != self.n_vertices:
+            return False
+        return np.array_equal(self.faces, faces)
+
+    def find_slots(self, vertices_a, vertices_b):
+        """Vectorized slot lookup of the half-edges `(vertices_a, vertices_b)`
+
+        Parameters
+        ----------
+        vertices_a: np.ndarray
+            The first vertices of the half-edges
+        vertices_b: np.ndarray
+            The second vertices of the half-edges
+
+        Returns
+        -------
+        np.ndarray:
+            The slots of the half-edges. -1 for vertices that are not connected.
+        """
+        keys = vertices_a * self.n_vertices + vertices_b
+        positions = np.minimum(np.searchsorted(self._sorted_slot_keys, keys), self._sorted_slot_keys.shape[0] - 1)
+        return np.where(self._sorted_slot_keys[positions] == keys, self._sorted_slots[positions], -1)
+
+    def get_slot(self, vertex_i, vertex_j):
+        """Returns the slot of the half-edge from `vertex_i` to `vertex_j`
+
+        Parameters
+        ----------
+        vertex_i: int
+            The first vertex of the half-edge
+        vertex_j: int
+            The second vertex of the half-edge
+
+        Returns
+        -------
+        int:
+            The slot of the half-edge. Raises a `ValueError` if both vertices are not connected.
+        """
+        return self._slot_offsets[vertex_i] + self._neighbors[vertex_i].index(vertex_j)
+
+    def get_neighbors(self, vertex):
+        """Returns the one-hop neighbors of a vertex
+
+        Parameters
+        ----------
+        vertex: int
+            The index of the vertex for which the neighbor indices shall be returned
+
+        Returns
+        -------
+        list:
+            A list of neighboring vertex-indices.
+        """
+        return self._neighbors[vertex]
+
+    def get_edge_index(self, vertex_a, vertex_b):
+        """Returns the index of the edge between two vertices
+
+        Parameters
+        ----------
+        vertex_a: int
+            The first vertex of the edge
+        vertex_b: int
+            The second vertex of the edge
+
+        Returns
+        -------
+        int:
+            The index of the edge in `self.edges` or -1 if both vertices are not connected.
+        """
+        neighbors = self._neighbors[vertex_a]
+        for idx, neighbor in enumerate(neighbors):
+            if neighbor == vertex_b:
+                return self._neighbor_edges[vertex_a][idx]
+        return -1
+
+    def get_faces_of_edge(self, edge):
+        """Determine the faces of a given edge
+
+        Parameters
+        ----------
+        edge: np.ndarray
+            The edge for which the faces shall be returned.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            The sorted edge and the faces which contain the edge.
+        """
+        edge = np.sort(edge)
+        edge_idx = self.get_edge_index(edge[0], edge[1])
+        if edge_idx == -1:
+            return edge, self.faces[:0]
+        face_indices = self.edge_faces_indices[self.edge_faces_indptr[edge_idx]:self.edge_faces_indptr[edge_idx + 1]]
+        return edge, self.faces[face_indices]
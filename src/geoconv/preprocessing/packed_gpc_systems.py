@@ -0,0 +1,277 @@
+from geoconv.preprocessing.barycentric_coordinates import polar_to_cart
+from geoconv.utils.misc import gpc_systems_into_cart
+
+import numpy as np
+import json
+import os
+
+
+# The arrays which describe packed GPC-systems
+PACKED_ARRAYS = [
+    "source_points",
+    "vertex_offsets",
+    "vertex_indices",
+    "radial_coordinates",
+    "angular_coordinates",
+    "face_offsets",
+    "faces"
+]
+
+
+class PackedGPCSystem:
+    def __init__(self, source_point, n_vertices, vertex_indices, radial_coordinates, angular_coordinates, faces):
+        """Lightweight view onto one GPC-system of `PackedGPCSystems`.
+
+        The view offers the accessors of `GPCSystem` which are required by `compute_barycentric_coordinates` and the
+        visualization helpers. Dense per-vertex coordinates are only materialized upon request.
+
+        Parameters
+        ----------
+        source_point: int
+            The index of the source point of the GPC-system.
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+        vertex_indices: np.ndarray
+            The sorted indices of the vertices reached by the GPC-system.
+        radial_coordinates: np.ndarray
+            The radial coordinates of the vertices in `vertex_indices`.
+        angular_coordinates: np.ndarray
+            The angular coordinates of the vertices in `vertex_indices`.
+        faces: np.ndarray
+            A 2D-array containing the sorted faces captured by the GPC-system in the order of their capture.
+        """
+        self.source_point = source_point
+        self.n_vertices = n_vertices
+        self.vertex_indices = vertex_indices
+        self.vertex_radial_coordinates = radial_coordinates
+        self.vertex_angular_coordinates = angular_coordinates
+        # Mirrors the indexing of the face-cache of `GPCSystem`
+        self.faces = {(-1, -1): faces}
+
+    def _to_dense(self, values, fill_value):
+        dense = np.full((self.n_vertices,), fill_value, dtype=values.dtype)
+        dense[self.vertex_indices] = values
+        return dense
+
+    @property
+    def radial_coordinates(self):
+        return self._to_dense(self.vertex_radial_coordinates, np.inf)
+
+    @property
+    def angular_coordinates(self):
+        return self._to_dense(self.vertex_angular_coordinates, -1.0)
+
+    @property
+    def x_coordinates(self):
+        xy = polar_to_cart(angles=self.vertex_angular_coordinates, scales=self.vertex_radial_coordinates)
+        return self._to_dense(xy[:, 0], np.inf)
+
+    @property
+    def y_coordinates(self):
+        xy = polar_to_cart(angles=self.vertex_angular_coordinates, scales=self.vertex_radial_coordinates)
+        return self._to_dense(xy[:, 1], np.inf)
+
+    def get_gpc_system(self):
+        """Return the GPC-system as one (dense) numpy array.
+
+        Returns
+        -------
+        np.ndarray:
+            A 2D-array containing the radial and angular coordinates for all vertices of the underlying mesh.
+        """
+        return np.stack([self.radial_coordinates, self.angular_coordinates], axis=1)
+
+    def get_gpc_triangles(self, in_cart=False):
+        """Return all triangles captured by the GPC-system.
+
+        Parameters
+        ----------
+        in_cart: bool
+            Whether to translate geodesic polar coordinates into cartesian.
+        """
+        local_faces = np.searchsorted(self.vertex_indices, self.faces[(-1, -1)])
+        gpc_system_triangles = np.stack(
+            [self.vertex_radial_coordinates[local_faces], self.vertex_angular_coordinates[local_faces]], axis=-1
+        )
+        if in_cart:
+            return gpc_systems_into_cart(gpc_system_triangles)
+        else:
+            return gpc_system_triangles
+
+
+class PackedGPCSystems:
+    def __init__(self,
+                 n_vertices,
+                 source_points,
+                 vertex_offsets,
+                 vertex_indices,
+                 radial_coordinates,
+                 angular_coordinates,
+                 face_offsets,
+                 faces):
+        """Packed, sparse representation of multiple GPC-systems on one mesh.
+
+        Only the vertices and faces which are reached by a GPC-system are stored. The coordinates of all GPC-systems
+        are stored contiguously, CSR-style offsets delimit the individual GPC-systems:
+            - The vertices of the i-th GPC-system are `vertex_indices[vertex_offsets[i]:vertex_offsets[i + 1]]` and
+              their coordinates are given by `radial_coordinates` and `angular_coordinates` at the same positions.
+            - The faces of the i-th GPC-system are `faces[face_offsets[i]:face_offsets[i + 1]]`.
+
+        Indexing returns a `PackedGPCSystem`-view onto a single GPC-system without copying its data. The arrays may be
+        memory-maps (see `load`), such that only the accessed GPC-systems are read from disk.
+
+        Parameters
+        ----------
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+        source_points: np.ndarray
+            The source point of each GPC-system.
+        vertex_offsets: np.ndarray
+            The offsets of the GPC-systems into the vertex arrays.
+        vertex_indices: np.ndarray
+            The sorted vertex indices reached by each GPC-system.
+        radial_coordinates: np.ndarray
+            The radial coordinates of the vertices in `vertex_indices`.
+        angular_coordinates: np.ndarray
+            The angular coordinates of the vertices in `vertex_indices`.
+        face_offsets: np.ndarray
+            The offsets of the GPC-systems into `faces`.
+        faces: np.ndarray
+            A 2D-array containing the sorted faces captured by each GPC-system in the order of their capture.
+        """
+        self.n_vertices = n_vertices
+        self.source_points = source_points
+        self.vertex_offsets = vertex_offsets
+        self.vertex_indices = vertex_indices
+        self.radial_coordinates = radial_coordinates
+        self.angular_coordinates = angular_coordinates
+        self.face_offsets = face_offsets
+        self.faces = faces
+
+    def __len__(self):
+        return self.source_points.shape[0]
+
+    def __getitem__(self, idx):
+        # Resolve negative indices and raise an `IndexError` for indices out of range
+        idx = range(len(self))[idx]
+        v_start, v_end = self.vertex_offsets[idx], self.vertex_offsets[idx + 1]
+        f_start, f_end = self.face_offsets[idx], self.face_offsets[idx + 1]
+        return PackedGPCSystem(
+            int(self.source_points[idx]),
+            self.n_vertices,
+            self.vertex_indices[v_start:v_end],
+            self.radial_coordinates[v_start:v_end],
+            self.angular_coordinates[v_start:v_end],
+            self.faces[f_start:f_end]
+        )
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in PACKED_ARRAYS)
+
+    @classmethod
+    def from_states(cls, states, n_vertices):
+        """Packs GPC-system states (see `GPCSystem.get_state`).
+
+        Parameters
+        ----------
+        states: list
+            The states of the GPC-systems in the order in which they shall be packed.
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+
+        Returns
+        -------
+        PackedGPCSystems:
+            The packed GPC-systems.
+        """
+        vertex_offsets = np.zeros((len(states) + 1,), dtype=np.int64)
+        np.cumsum([state["vertex_indices"].shape[0] for state in states], out=vertex_offsets[1:])
+        face_offsets = np.zeros((len(states) + 1,), dtype=np.int64)
+        np.cumsum([state["faces"].shape[0] for state in states], out=face_offsets[1:])
+        # Keep the floating point type of the states (see `cast_state`)
+        dtype = states[0]["radial_coordinates"].dtype if states else np.float64
+        return cls(
+            n_vertices,
+            np.array([state["source_point"] for state in states], dtype=np.int64),
+            vertex_offsets,
+            np.concatenate([state["vertex_indices"] for state in states] + [np.zeros((0,), dtype=np.int64)]),
+            np.concatenate([state["radial_coordinates"] for state in states] + [np.zeros((0,), dtype=dtype)]),
+            np.concatenate([state["angular_coordinates"] for state in states] + [np.zeros((0,), dtype=dtype)]),
+            face_offsets,
+            np.concatenate([state["faces"] for state in states] + [np.zeros((0, 3), dtype=np.int64)])
+        )
+
+    def replace(self, states):
+        """Returns packed GPC-systems in which some GPC-systems are replaced.
+
+        Parameters
+        ----------
+        states: list
+            The states (see `GPCSystem.get_state`) of the new GPC-systems. They replace the GPC-systems with the
+            same source points.
+
+        Returns
+        -------
+        PackedGPCSystems:
+            The updated packed GPC-systems.
+        """
+        replacements = {state["source_point"]: state for state in states}
+        all_states = []
+        for idx in range(len(self)):
+            source_point = int(self.source_points[idx])
+            if source_point in replacements:
+                all_states.append(replacements[source_point])
+            else:
+                gpc_system = self[idx]
+                all_states.append({
+                    "source_point": source_point,
+                    "vertex_indices": gpc_system.vertex_indices,
+                    "radial_coordinates": gpc_system.vertex_radial_coordinates,
+                    "angular_coordinates": gpc_system.vertex_angular_coordinates,
+                    "faces": gpc_system.faces[(-1, -1)]
+                })
+        return PackedGPCSystems.from_states(all_states, self.n_vertices)
+
+    def save(self, path):
+        """Stores the packed GPC-systems in a directory.
+
+        Each array is stored in its own '.npy'-file, such that it can be memory-mapped by `load`.
+
+        Parameters
+        ----------
+        path: str
+            The path to the directory in which the GPC-systems shall be stored.
+        """
+        if not os.path.exists(path):
+            os.makedirs(path)
+        for name in PACKED_ARRAYS:
+            np.save(f"{path}/{name}.npy", np.asarray(getattr(self, name)))
+        with open(f"{path}/properties.json", "w") as properties_file:
+            json.dump({"n_vertices": int(self.n_vertices), "n_gpc_systems": len(self)}, properties_file, indent=4)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Loads packed GPC-systems which have been stored with `save`.
+
+        Parameters
+        ----------
+        path: str
+            The path to the directory in which the GPC-systems are stored.
+        mmap_mode: str
+            The mode in which the arrays are memory-mapped (see `np.load`). If `None`, the arrays are read into memory.
+
+        Returns
+        -------
+        PackedGPCSystems:
+            The loaded GPC-systems.
+        """
+        with open(f"{path}/properties.json", "r") as properties_file:
+            properties = json.load(properties_file)
+        arrays = {name: np.load(f"{path}/{name}.npy", mmap_mode=mmap_mode) for name in PACKED_ARRAYS}
+        return cls(properties["n_vertices"], **arrays)
+
@@ -0,0 +1,218 @@
+from geoconv.preprocessing.gpc_system_utils import compute_u_ijk_and_angle_vectorized
+from geoconv.preprocessing.mesh_geometry import MeshGeometry
+from geoconv.preprocessing.mesh_topology import MeshTopology
+from geoconv.utils.misc import compute_vector_angle
+
+import numpy as np
+
+
+class VectorizedGPCSystems:
+    def __init__(self, object_mesh, topology=None, eps=0.000001, mesh_geometry=None):
+        """Propagates the GPC-systems of many source points in lockstep.
+
+        Each iteration pops the closest queued vertex `j` of every GPC-system (one frontier per source point) and
+        evaluates the Euclidean updates of all neighbors `i` of `j` over both faces of the edge `(i, j)` with one
+        vectorized call of `compute_u_ijk_and_angle_vectorized`. Thereby, the interpreter overhead is shared by all
+        GPC-systems of a batch.
+
+        In difference to `GPCSystemGroup.compute_gpc_system`, updates are not checked for edge intersections and the
+        neighbors of `j` are updated simultaneously, i.e. they do not see each other's updates of the same iteration.
+        Hence, the results can differ slightly from the ones of the sequential algorithm.
+
+        Parameters
+        ----------
+        object_mesh: trimesh.Trimesh
+            A loaded object mesh.
+        topology: MeshTopology
+            The precomputed topology of `object_mesh`. If not given, it will be computed.
+        eps: float
+            The minimal relative improvement of a radial coordinate to update a vertex.
+        mesh_geometry: MeshGeometry
+            The precomputed geometry of `object_mesh`. If not given, it will be computed.
+        """
+        if topology is None:
+            topology = MeshTopology(object_mesh.faces, object_mesh.vertices.shape[0])
+        self.topology = topology
+        if mesh_geometry is None:
+            mesh_geometry = MeshGeometry(object_mesh, topology=topology)
+        self.mesh_geometry = mesh_geometry
+        self.vertices = mesh_geometry.vertices
+        self.vertex_normals = mesh_geometry.vertex_normals
+        self.eps = eps
+        n_vertices = self.vertices.shape[0]
+
+        ####################
+        # Padded neighbors
+        ####################
+        degrees = np.diff(topology.adjacency_indptr)
+        self.max_degree = int(degrees.max())
+        # `neighbors[j, n]` is the n-th neighbor of `j` and `neighbor_slots[j, n]` its index in the CSR-adjacency
+        self.neighbors = np.full((n_vertices, self.max_degree), -1, dtype=np.int64)
+        self.neighbor_slots = np.full((n_vertices, self.max_degree), -1, dtype=np.int64)
+        rows = np.repeat(np.arange(n_vertices), degrees)
+        cols = np.arange(topology.adjacency_indices.shape[0]) - topology.adjacency_indptr[rows]
+        self.neighbors[rows, cols] = topology.adjacency_indices
+        self.neighbor_slots[rows, cols] = np.arange(topology.adjacency_indices.shape[0])
+        # `opposite_vertices[slot]` contains the third vertices of the faces of the edge at `slot`
+        self.opposite_vertices = mesh_geometry.opposite_vertices
+
+    def compute_gpc_system_states(self, source_points, u_max):
+        """Computes the GPC-systems for multiple source points and returns their states.
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The indices of the source points.
+        u_max: float
+            The maximal radius for each GPC-system.
+
+        Returns
+        -------
+        list:
+            The states of the GPC-systems (see `GPCSystem.get_state`). The faces of a GPC-system are given in the order
+            of their capture.
+        """
+        source_points = np.asarray(source_points, dtype=np.int64)
+        n_systems, n_vertices = source_points.shape[0], self.vertices.shape[0]
+        systems = np.arange(n_systems)
+        radial_coordinates = np.full((n_systems, n_vertices), np.inf)
+        angular_coordinates = np.full((n_systems, n_vertices), -1.0)
+        queued = np.zeros((n_systems, n_vertices), dtype=bool)
+        # Captured faces are logged together with their GPC-system in the order of their capture
+        face_systems, captured_faces = [], []
+        cell_sizes = np.zeros((n_systems,))
+
+        #####################################################
+        # Initialize one-hop-neighborhoods (see `GPCSystem`)
+        #####################################################
+        for system, source_point in enumerate(source_points.tolist()):
+            neighbors = np.array(self.topology.get_neighbors(source_point))
+            edges = self.vertices[neighbors] - self.vertices[source_point]
+            radial_coordinates[system, neighbors] = np.linalg.norm(edges, axis=-1)
+            angular_coordinates[system, neighbors] = compute_vector_angle(
+                np.repeat(edges[:1], neighbors.shape[0], axis=0), edges, self.vertex_normals[source_point]
+            )
+            radial_coordinates[system, source_point], angular_coordinates[system, source_point] = 0., 0.
+            queued[system, neighbors] = True
+            cell_sizes[system] = radial_coordinates[system, neighbors].mean()
+            opposite_vertices = self.opposite_vertices[self.neighbor_slots[source_point, :neighbors.shape[0]]]
+            ring_faces = np.stack([
+                np.repeat(neighbors, opposite_vertices.shape[1]),
+                opposite_vertices.reshape(-1),
+                np.full((opposite_vertices.size,), source_point)
+            ], axis=-1)
+            ring_faces = ring_faces[ring_faces[:, 1] != -1]
+            face_systems.append(np.full((ring_faces.shape[0],), system))
+            captured_faces.append(ring_faces)
+
+        ############################
+        # Propagate all GPC-systems
+        ############################
+        while True:
+            # Pop the closest queued vertex of each GPC-system
+            queued_distances = np.where(queued, radial_coordinates, np.inf)
+            vertices_j = np.argmin(queued_distances, axis=-1)
+            active = queued_distances[systems, vertices_j] < np.inf
+            if not active.any():
+                break
+            active_systems, vertices_j = systems[active], vertices_j[active]
+            queued[active_systems, vertices_j] = False
+
+            # Collect all (system, i, j) with `i` being a neighbor of `j` (except for the source point)
+            pair_systems = np.repeat(active_systems, self.max_degree)
+            pairs_j = np.repeat(vertices_j, self.max_degree)
+            pairs_i = self.neighbors[vertices_j].reshape(-1)
+            pair_slots = self.neighbor_slots[vertices_j].reshape(-1)
+            valid = (pairs_i != -1) & (pairs_i != source_points[pair_systems])
+            pair_systems, pairs_i, pairs_j, pair_slots = (
+                pair_systems[valid], pairs_i[valid], pairs_j[valid], pair_slots[valid]
+            )
+
+            # Evaluate the updates of all (system, i, j, k) with known coordinates for `k` at once
+            vertices_k = self.opposite_vertices[pair_slots]
+            padded_k = np.where(vertices_k == -1, 0, vertices_k)
+            known_k = (
+                (vertices_k != -1)
+                & (radial_coordinates[pair_systems[:, None], padded_k] < np.inf)
+                & (angular_coordinates[pair_systems[:, None], padded_k] >= 0.)
+            )
+            tuple_pairs, tuple_positions = np.nonzero(known_k)
+            if tuple_pairs.shape[0] == 0:
+                continue
+            tuple_systems, tuple_i, tuple_j = pair_systems[tuple_pairs], pairs_i[tuple_pairs], pairs_j[tuple_pairs]
+            tuple_k = vertices_k[tuple_pairs, tuple_positions]
+            # The corners of the triangles are located at `i`
+            tuple_slots = self.mesh_geometry.reverse_slots[pair_slots[tuple_pairs]]
+            mesh_geometry = self.mesh_geometry
+            u_ijk, theta_ijk = compute_u_ijk_and_angle_vectorized(
+                self.vertices[tuple_i],
+                self.vertices[tuple_j],
+                self.vertices[tuple_k],
+                radial_coordinates[tuple_systems, tuple_j],
+                radial_coordinates[tuple_systems, tuple_k],
+                angular_coordinates[tuple_systems, tuple_j],
+                angular_coordinates[tuple_systems, tuple_k],
+                edges=(
+                    mesh_geometry.half_edge_vectors[tuple_slots],
+                    mesh_geometry.half_edge_vectors[mesh_geometry.adjacent_slots[tuple_slots, tuple_positions]],
+                    mesh_geometry.half_edge_vectors[mesh_geometry.opposite_slots[tuple_slots, tuple_positions]]
+                )
+            )
+
+            # Select the smallest update of each (system, i, j)
+            new_u = np.full(known_k.shape, np.inf)
+            new_theta = np.full(known_k.shape, -1.0)
+            new_u[known_k], new_theta[known_k] = u_ijk, theta_ijk
+            best = np.argmin(new_u, axis=-1)
+            pair_range = np.arange(best.shape[0])
+            new_u, new_theta = new_u[pair_range, best], new_theta[pair_range, best]
+
+            # Accept updates that improve a vertex within the maximal radius
+            with np.errstate(divide="ignore", invalid="ignore"):
+                accept = (new_u < u_max) & (radial_coordinates[pair_systems, pairs_i] / new_u > 1 + self.eps)
+            radial_coordinates[pair_systems[accept], pairs_i[accept]] = new_u[accept]
+            angular_coordinates[pair_systems[accept], pairs_i[accept]] = new_theta[accept]
+            queued[pair_systems[accept], pairs_i[accept]] = True
+
+            # Capture the faces of the edges (i, j) of accepted updates, whose third vertices are known by now
+            captured = (
+                accept[:, None]
+                & (vertices_k != -1)
+                & (radial_coordinates[pair_systems[:, None], padded_k] < np.inf)
+            )
+            captured_pairs, captured_k = np.nonzero(captured)
+            face_systems.append(pair_systems[captured_pairs])
+            captured_faces.append(
+                np.stack([pairs_i[captured_pairs], pairs_j[captured_pairs], vertices_k[captured_pairs, captured_k]], -1)
+            )
+
+        ##################
+        # Collect states
+        ##################
+        face_systems, captured_faces = np.concatenate(face_systems), np.sort(np.concatenate(captured_faces), axis=-1)
+        order = np.argsort(face_systems, kind="stable")
+        captured_faces = np.split(captured_faces[order], np.cumsum(np.bincount(face_systems, minlength=n_systems))[:-1])
+        states = []
+        for system, source_point in enumerate(source_points.tolist()):
+            faces = captured_faces[system]
+            _, first_occurrence = np.unique(faces, axis=0, return_index=True)
+            faces = faces[np.sort(first_occurrence)]
+            face_edges = faces[:, [0, 1, 1, 2, 0, 2]].reshape((-1, 2))
+            _, first_occurrence = np.unique(face_edges, axis=0, return_index=True)
+            vertex_indices = np.nonzero(radial_coordinates[system] != np.inf)[0]
+            system_radial_coordinates = radial_coordinates[system, vertex_indices]
+            system_angular_coordinates = angular_coordinates[system, vertex_indices]
+            states.append({
+                "source_point": source_point,
+                "n_vertices": n_vertices,
+                "vertex_indices": vertex_indices,
+                "radial_coordinates": system_radial_coordinates,
+                "angular_coordinates": system_angular_coordinates,
+                "x_coordinates": system_radial_coordinates * np.cos(system_angular_coordinates),
+                "y_coordinates": system_radial_coordinates * np.sin(system_angular_coordinates),
+                "edges": face_edges[np.sort(first_occurrence)],
+                "faces": faces,
+                "cell_size": cell_sizes[system],
+                "truncation_radius": None
+            })
+        return states
@@ -14,18 +14,27 @@ def compute_vector_angle(vector_a, vector_b, rotation_axis):
     Parameters
     ----------
     vector_a: np.ndarray
-        The first vector
+        The first vector. A 2D-array of shape (n, 3) computes the angles for `n` vector pairs at once.
     vector_b: np.ndarray
-        The second vector
+        The second vector. A 2D-array of shape (n, 3) computes the angles for `n` vector pairs at once.
     rotation_axis: [np.ndarray, None]
         For angles in [0, 2*pi[ in the 3-dimensional space an "up"-direction is required. If `None` is passed an angle
         between [0, pi[ is returned.
 
     Returns
     -------
-    float:
-        The angle between `vector_a` and `vector_b`
+    [float, np.ndarray]:
+        The angle between `vector_a` and `vector_b` or an array of angles for batched inputs
     """
+    if vector_a.ndim == 2:
+        vector_a = vector_a / np.linalg.norm(vector_a, axis=-1, keepdims=True)
+        vector_b = vector_b / np.linalg.norm(vector_b, axis=-1, keepdims=True)
+        angle = np.arccos(np.clip(np.einsum("ij,ij->i", vector_a, vector_b), -1.0, 1.0))
+        if rotation_axis is None:
+            return angle
+        opposite_direction = np.cross(vector_a, vector_b) @ rotation_axis < 0.0
+        return np.where(opposite_direction, 2 * np.pi - angle, angle)
+
     vector_a = vector_a / blas.dnrm2(vector_a)
     vector_b = vector_b / blas.dnrm2(vector_b)
     angle = blas.ddot(vector_a, vector_b)
@@ -19,7 +19,7 @@ def draw_barycentric_coordinates(gpc_system, barycentric_coordinates, save_name=
 
     Parameters
     ----------
-    gpc_system: GPCSystem
+    gpc_system: [GPCSystem, PackedGPCSystem]
         The GPC-system in which the barycentric coordinates should be illustrated.
     barycentric_coordinates: np.ndarray
         The barycentric coordinates to illustrate.
@@ -317,7 +317,7 @@ def draw_gpc_triangles(gpc_system,
 
     Parameters
     ----------
-    gpc_system: GPCSystem
+    gpc_system: [GPCSystem, PackedGPCSystem]
         The GPC-system to visualize.
     template_matrix: np.ndarray
         A 3D-array that describes template vertices in cartesian coordinates. If 'None' is passed
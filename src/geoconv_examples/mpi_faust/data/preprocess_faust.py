@@ -1,7 +1,8 @@
 from geoconv.preprocessing.barycentric_coordinates import compute_barycentric_coordinates
-from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup, GPCSystemPool
 from geoconv.utils.misc import shuffle_mesh_vertices, normalize_mesh, find_largest_one_hop_dist
 
+from contextlib import nullcontext
 from pathlib import Path
 
 import pyshot
@@ -32,6 +33,49 @@ def get_file_number(file_name):
     raise RuntimeError(f"Filename '{file_name}' has no digit.")
 
 
+def load_or_compute_gpc_systems(mesh, gpc_radius, gpc_systems_path, processes=1, dtype=np.float64, pool=None):
+    """Loads the stored GPC-systems of a mesh or computes and stores them
+
+    Stored GPC-systems are only re-used if they have been computed for the same mesh with the same radius.
+
+    Parameters
+    ----------
+    mesh: trimesh.Trimesh
+        The mesh for which the GPC-systems shall be computed.
+    gpc_radius: float
+        The GPC-system radius.
+    gpc_systems_path: str
+        The path to the directory in which the GPC-systems are stored (see `GPCSystemGroup.save`).
+    processes: int
+        The amount of concurrent processes that compute GPC-systems.
+    dtype: np.dtype
+        The floating point type in which GPC-systems are stored.
+    pool: GPCSystemPool
+        The worker processes which compute the GPC-systems.
+
+    Returns
+    -------
+    GPCSystemGroup:
+        The GPC-system group of the mesh with loaded or computed GPC-systems.
+    """
+    gpc_systems = GPCSystemGroup(mesh, processes=processes, dtype=dtype, pool=pool)
+    properties_path = f"{gpc_systems_path}/gpc_system_properties.json"
+    properties = {"gpc_system_radius": gpc_radius, "mesh_fingerprint": gpc_systems.get_mesh_fingerprint()}
+    stored_properties = None
+    if Path(properties_path).is_file():
+        with open(properties_path, "r") as properties_file:
+            stored_properties = json.load(properties_file)
+    if stored_properties == properties:
+        gpc_systems.load(gpc_systems_path)
+        print(f"Loaded GPC-systems from: '{gpc_systems_path}'")
+    else:
+        gpc_systems.compute(u_max=gpc_radius, packed=True)
+        gpc_systems.save(gpc_systems_path)
+        with open(properties_path, "w") as properties_file:
+            json.dump(properties, properties_file, indent=4)
+    return gpc_systems
+
+
 def preprocess_faust(n_radial,
                      n_angular,
                      target_dir,
@@ -40,7 +84,9 @@ def preprocess_faust(n_radial,
                      geodesic_diameters_path="",
                      precomputed_gpc_radius=-1.,
                      processes=1,
-                     add_noise=False):
+                     add_noise=False,
+                     dtype=np.float64,
+                     gpc_systems_dir=""):
     """Preprocesses the FAUST-data set
 
     The FAUST-data set has to be downloaded from: https://faust-leaderboard.is.tuebingen.mpg.de/
@@ -71,6 +117,14 @@ def preprocess_faust(n_radial,
         The amount of concurrent processes that compute GPC-systems.
     add_noise: bool
         Adds Gaussian noise to the mesh data.
+    dtype: np.dtype
+        The floating point type in which GPC-systems and barycentric coordinates are stored. `np.float32` halves the
+        memory footprint and the size of the stored barycentric coordinates.
+    gpc_systems_dir: str
+        If given, the GPC-systems of each mesh are stored in this directory. Later runs re-use the stored GPC-systems
+        of a mesh if it has not changed and the GPC-system radius is the same, such that different templates can be
+        tried without re-computing the GPC-systems. The vertex shuffle of a mesh is stored alongside its GPC-systems
+        and re-used. The directory must not be located within `target_dir`, which is removed at the end.
 
     Returns
     -------
@@ -150,60 +204,71 @@ def preprocess_faust(n_radial,
     json.dump({"gpc_system_radius": gpc_radius, "kernel_radius": kernel_radius}, properties_file, indent=4)
     properties_file.close()
 
-    for file_idx in range(len(paths_reg_meshes)):
-        # Define file names
-        bc_name = f"{target_dir}/BC_{paths_reg_meshes[file_idx][:-4]}.npy"
-        gt_name = f"{target_dir}/GT_{paths_reg_meshes[file_idx][:-4]}.npy"
-        signal_name = f"{target_dir}/SIGNAL_{paths_reg_meshes[file_idx][:-4]}.npy"
-
-        # Load normalized mesh
-        vertices = np.load(f"{temp_dir}/vertices_{file_idx}.npy")
-        faces = np.load(f"{temp_dir}/faces_{file_idx}.npy")
-        reg_mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
-
-        # Check whether preprocessed files already exist
-        if not (Path(bc_name).is_file() and Path(gt_name).is_file() and Path(signal_name).is_file()):
-            #######################################################
-            # Shuffle vertices of query mesh and save ground truth
-            #######################################################
-            reg_mesh, _, ground_truth = shuffle_mesh_vertices(reg_mesh)
-            np.save(gt_name, ground_truth)
-
-            ####################
-            # Store mesh signal
-            ####################
-            if shot:
-                radius = find_largest_one_hop_dist(reg_mesh) * 2.5
-                shot_descrs = pyshot.get_descriptors(
-                    reg_mesh.vertices,
-                    reg_mesh.faces,
-                    radius=radius,
-                    local_rf_radius=radius,
-                    min_neighbors=10,
-                    n_bins=16,
-                    double_volumes_sectors=True,
-                    use_interpolation=True,
-                    use_normalization=True
+    # Worker processes are started once for all meshes, a single process computes GPC-systems in-process
+    with GPCSystemPool(processes) if processes > 1 else nullcontext() as pool:
+        for file_idx in range(len(paths_reg_meshes)):
+            # Define file names
+            bc_name = f"{target_dir}/BC_{paths_reg_meshes[file_idx][:-4]}.npy"
+            gt_name = f"{target_dir}/GT_{paths_reg_meshes[file_idx][:-4]}.npy"
+            signal_name = f"{target_dir}/SIGNAL_{paths_reg_meshes[file_idx][:-4]}.npy"
+
+            # Load normalized mesh
+            vertices = np.load(f"{temp_dir}/vertices_{file_idx}.npy")
+            faces = np.load(f"{temp_dir}/faces_{file_idx}.npy")
+            reg_mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+
+            # Check whether preprocessed files already exist
+            if not (Path(bc_name).is_file() and Path(gt_name).is_file() and Path(signal_name).is_file()):
+                #######################################################
+                # Shuffle vertices of query mesh and save ground truth
+                #######################################################
+                gpc_systems_path = f"{gpc_systems_dir}/{paths_reg_meshes[file_idx][:-4]}"
+                shuffle_name = f"{gpc_systems_path}/GT.npy"
+                given_shuffle = np.load(shuffle_name) if gpc_systems_dir and Path(shuffle_name).is_file() else None
+                reg_mesh, _, ground_truth = shuffle_mesh_vertices(reg_mesh, given_shuffle=given_shuffle)
+                np.save(gt_name, ground_truth)
+
+                ####################
+                # Store mesh signal
+                ####################
+                if shot:
+                    radius = find_largest_one_hop_dist(reg_mesh) * 2.5
+                    shot_descrs = pyshot.get_descriptors(
+                        reg_mesh.vertices,
+                        reg_mesh.faces,
+                        radius=radius,
+                        local_rf_radius=radius,
+                        min_neighbors=10,
+                        n_bins=16,
+                        double_volumes_sectors=True,
+                        use_interpolation=True,
+                        use_normalization=True
+                    )
+                    np.save(signal_name, shot_descrs)
+                else:
+                    np.save(signal_name, np.asarray(reg_mesh.vertices))
+
+                ############################
+                # Compute local GPC-systems
+                ############################
+                if gpc_systems_dir:
+                    gpc_systems = load_or_compute_gpc_systems(
+                        reg_mesh, gpc_radius, gpc_systems_path, processes=processes, dtype=dtype, pool=pool
+                    )
+                    np.save(shuffle_name, ground_truth)
+                else:
+                    gpc_systems = GPCSystemGroup(reg_mesh, processes=processes, dtype=dtype, pool=pool)
+                    gpc_systems.compute(u_max=gpc_radius)
+
+                ##################################
+                # Compute Barycentric coordinates
+                ##################################
+                bary_coords = compute_barycentric_coordinates(
+                    gpc_systems, n_radial=n_radial, n_angular=n_angular, radius=kernel_radius, dtype=dtype
                 )
-                np.save(signal_name, shot_descrs)
+                np.save(bc_name, bary_coords)
             else:
-                np.save(signal_name, np.asarray(reg_mesh.vertices))
-
-            ############################
-            # Compute local GPC-systems
-            ############################
-            gpc_systems = GPCSystemGroup(reg_mesh, processes=processes)
-            gpc_systems.compute(u_max=gpc_radius)
-
-            ##################################
-            # Compute Barycentric coordinates
-            ##################################
-            bary_coords = compute_barycentric_coordinates(
-                gpc_systems, n_radial=n_radial, n_angular=n_angular, radius=kernel_radius
-            )
-            np.save(bc_name, bary_coords)
-        else:
-            print(f"Found temp-files:\n{bc_name}\n{gt_name}\n{signal_name}\nSkipping to next temp.-mesh..")
+                print(f"Found temp-files:\n{bc_name}\n{gt_name}\n{signal_name}\nSkipping to next temp.-mesh..")
 
     shutil.rmtree(temp_dir)
     shutil.make_archive(target_dir, "zip", target_dir)
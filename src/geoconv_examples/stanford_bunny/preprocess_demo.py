@@ -5,6 +5,7 @@ from geoconv.preprocessing.barycentric_coordinates import compute_barycentric_co
 
 import open3d as o3d
 import trimesh
+import json
 import os
 import numpy as np
 
@@ -82,15 +83,31 @@ def preprocess_demo(path_to_stanford_bunny="bun_zipper.ply",
     template_radius = u_max * 0.75
     print(f"GPC-system max.-radius: {u_max} | Template max.-radius: {template_radius}")
 
-    # Compute and store the GPC-systems for the bunny mesh.
+    # Compute and store the GPC-systems for the bunny mesh. Stored GPC-systems are re-used if they have been computed
+    # for the same mesh with the same radius, such that different templates can be tried without re-computing the
+    # GPC-systems.
+    data_dir = os.path.dirname(path_to_stanford_bunny) or "."
     gpc_systems = GPCSystemGroup(bunny, processes=processes)
-    gpc_systems.compute(u_max=u_max)
+    gpc_systems_path = os.path.join(data_dir, "bunny_gpc_systems")
+    properties_path = os.path.join(gpc_systems_path, "gpc_system_properties.json")
+    properties = {"gpc_system_radius": u_max, "mesh_fingerprint": gpc_systems.get_mesh_fingerprint()}
+    stored_properties = None
+    if os.path.exists(properties_path):
+        with open(properties_path, "r") as properties_file:
+            stored_properties = json.load(properties_file)
+    if stored_properties == properties:
+        gpc_systems.load(gpc_systems_path)
+    else:
+        gpc_systems.compute(u_max=u_max, packed=True)
+        gpc_systems.save(gpc_systems_path)
+        with open(properties_path, "w") as properties_file:
+            json.dump(properties, properties_file, indent=4)
 
     # Compute the barycentric coordinates for the template in the computed GPC-systems.
     bc = compute_barycentric_coordinates(
         gpc_systems, n_radial=n_radial, n_angular=n_angular, radius=template_radius
     )
-    np.save(f"{os.path.dirname(path_to_stanford_bunny)}/bunny_barycentric_coordinates.npy", bc)
+    np.save(os.path.join(data_dir, "bunny_barycentric_coordinates.npy"), bc)
 
     ####################################################################
     # Visualization of the GPC-systems and the barycentric coordinates
@@ -0,0 +1,43 @@
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+
+import numpy as np
+import pytest
+import trimesh
+
+
+STATE_ARRAYS = [
+    "vertex_indices", "radial_coordinates", "angular_coordinates", "x_coordinates", "y_coordinates", "edges", "faces"
+]
+
+
+def assert_states_equal(states, expected_states):
+    """Asserts that GPC-system states (see `GPCSystem.get_state`) are identical"""
+    assert len(states) == len(expected_states)
+    for state, expected in zip(states, expected_states):
+        assert state["source_point"] == expected["source_point"]
+        assert state["cell_size"] == expected["cell_size"]
+        for key in STATE_ARRAYS:
+            np.testing.assert_array_equal(state[key], expected[key], err_msg=f"{key} of {state['source_point']}")
+
+
+@pytest.fixture(scope="session")
+def icosphere():
+    """A unit icosphere with slightly perturbed vertices (162 vertices, 320 faces)"""
+    sphere = trimesh.creation.icosphere(subdivisions=2)
+    rng = np.random.default_rng(0)
+    return trimesh.Trimesh(
+        vertices=sphere.vertices + rng.normal(scale=0.01, size=sphere.vertices.shape), faces=sphere.faces
+    )
+
+
+@pytest.fixture(scope="session")
+def u_max():
+    """A radius which covers a few rings of neighbors on `icosphere`"""
+    return 0.5
+
+
+@pytest.fixture(scope="session")
+def reference_states(icosphere, u_max):
+    """The states of the Python reference implementation for all vertices of `icosphere`"""
+    group = GPCSystemGroup(icosphere)
+    return group.compute_gpc_system_states(np.arange(icosphere.vertices.shape[0]), u_max)
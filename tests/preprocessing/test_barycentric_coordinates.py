@@ -0,0 +1,119 @@
+from geoconv.preprocessing.barycentric_coordinates import (
+    compute_barycentric, compute_barycentric_batch, interpolation, interpolation_batch, create_template_matrix,
+    compute_barycentric_coordinates, TriangleGrid, GRID_MIN_PAIRS
+)
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+
+from scipy.spatial import Delaunay
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def gpc_systems(icosphere, u_max):
+    """Packed GPC-systems of `icosphere`"""
+    group = GPCSystemGroup(icosphere)
+    group.compute(u_max=u_max, packed=True)
+    return group
+
+
+def interpolate_template(gpc_system, template_matrix):
+    """Interpolates each template vertex on its own"""
+    gpc_triangles = gpc_system.get_gpc_triangles(in_cart=True).astype(np.float64)
+    node_indices = np.asarray(gpc_system.faces[(-1, -1)])
+    results = [
+        interpolation(query_point, gpc_triangles, node_indices) for query_point in template_matrix.reshape(-1, 2)
+    ]
+    return np.array([bc for bc, _ in results]), np.array([indices for _, indices in results])
+
+
+def test_batch_equals_single_barycentric_coordinates():
+    rng = np.random.default_rng(0)
+    query_points, triangles = rng.normal(size=(50, 2)), rng.normal(size=(40, 3, 2))
+    # A degenerate triangle
+    triangles[0, 2] = triangles[0, 1]
+    b_coordinates, lies_within = compute_barycentric_batch(query_points[:, None], triangles[None])
+    assert lies_within.any() and not lies_within.all()
+    for q, query_point in enumerate(query_points):
+        for t, triangle in enumerate(triangles):
+            expected_coordinates, expected_within = compute_barycentric(query_point, triangle)
+            np.testing.assert_array_equal(b_coordinates[q, t], expected_coordinates)
+            assert lies_within[q, t] == expected_within
+
+
+@pytest.mark.parametrize("template_radius", [0.1, 0.3, 0.6])
+def test_batch_equals_single_interpolation(gpc_systems, template_radius):
+    # The largest template exceeds the GPC-systems, such that some template vertices fall into no triangle
+    template_matrix = create_template_matrix(n_radial=3, n_angular=8, radius=template_radius, in_cart=True)
+    for idx in range(0, len(gpc_systems.object_mesh_gpc_systems), 10):
+        gpc_system = gpc_systems.object_mesh_gpc_systems[idx]
+        expected_coordinates, expected_indices = interpolate_template(gpc_system, template_matrix)
+        b_coordinates, node_indices = interpolation_batch(
+            template_matrix.reshape(-1, 2),
+            gpc_system.get_gpc_triangles(in_cart=True).astype(np.float64),
+            np.asarray(gpc_system.faces[(-1, -1)])
+        )
+        np.testing.assert_array_equal(b_coordinates, expected_coordinates)
+        np.testing.assert_array_equal(node_indices, expected_indices)
+
+
+def test_barycentric_coordinates_equal_single_interpolation(gpc_systems):
+    barycentric_coordinates = compute_barycentric_coordinates(gpc_systems, n_radial=3, n_angular=8, radius=0.3)
+    template_matrix = create_template_matrix(n_radial=3, n_angular=8, radius=0.3, in_cart=True)
+    for idx in [0, 17, 161]:
+        expected_coordinates, expected_indices = interpolate_template(
+            gpc_systems.object_mesh_gpc_systems[idx], template_matrix
+        )
+        np.testing.assert_array_equal(barycentric_coordinates[idx, ..., 0].reshape(-1, 3), expected_indices)
+        np.testing.assert_array_equal(barycentric_coordinates[idx, ..., 1].reshape(-1, 3), expected_coordinates)
+
+
+def locate_brute_force(query_points, triangles):
+    """Tests every query point against all triangles"""
+    b_coordinates, lies_within = compute_barycentric_batch(query_points[:, None], triangles[None])
+    found = lies_within.any(axis=-1)
+    first_triangles = np.argmax(lies_within, axis=-1)
+    b_coordinates = b_coordinates[np.arange(query_points.shape[0]), first_triangles]
+    return np.where(found, first_triangles, -1), np.where(found[:, None], b_coordinates, 0.)
+
+
+@pytest.mark.parametrize("cell_size", [None, 0.01, 10.])
+def test_triangle_grid_equals_brute_force(cell_size):
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-1., 1., size=(300, 2))
+    triangles = points[rng.permutation(Delaunay(points).simplices)]
+    # Overlapping, degenerate and far-off triangles
+    triangles = np.concatenate([
+        triangles,
+        triangles[:20] * 1.5,
+        np.array([[[0., 0.], [1., 1.], [2., 2.]], [[.5, .5], [.5, .5], [.5, .5]], [[5., 5.], [6., 5.], [5., 6.]]])
+    ])
+    query_points = np.concatenate([rng.uniform(-1.5, 1.5, size=(500, 2)), points[:20], [[5.2, 5.2], [-10., 3.]]])
+
+    grid = TriangleGrid(triangles, cell_size=cell_size)
+    assert grid.degenerate_triangles.shape[0] >= 2
+    triangle_ids, b_coordinates = grid.locate(query_points)
+    expected_ids, expected_coordinates = locate_brute_force(query_points, triangles)
+    np.testing.assert_array_equal(triangle_ids, expected_ids)
+    np.testing.assert_array_equal(b_coordinates, expected_coordinates)
+
+    # Candidates contain every pair of a query point and a triangle which contains it
+    point_ids, candidate_ids = grid.get_candidates(query_points)
+    _, lies_within = compute_barycentric_batch(query_points[:, None], triangles[None])
+    assert set(zip(*np.nonzero(lies_within))) <= set(zip(point_ids.tolist(), candidate_ids.tolist()))
+
+
+def test_grid_interpolation_equals_single_interpolation(gpc_systems):
+    # Large templates are located with a `TriangleGrid`
+    template_matrix = create_template_matrix(n_radial=60, n_angular=64, radius=0.5, in_cart=True)
+    for idx in [0, 17, 161]:
+        gpc_system = gpc_systems.object_mesh_gpc_systems[idx]
+        gpc_triangles = gpc_system.get_gpc_triangles(in_cart=True).astype(np.float64)
+        assert template_matrix.shape[0] * template_matrix.shape[1] * gpc_triangles.shape[0] >= GRID_MIN_PAIRS
+        expected_coordinates, expected_indices = interpolate_template(gpc_system, template_matrix)
+        b_coordinates, node_indices = interpolation_batch(
+            template_matrix.reshape(-1, 2), gpc_triangles, np.asarray(gpc_system.faces[(-1, -1)])
+        )
+        np.testing.assert_array_equal(b_coordinates, expected_coordinates)
+        np.testing.assert_array_equal(node_indices, expected_indices)
@@ -0,0 +1,86 @@
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+
+import numpy as np
+import os
+import pytest
+import trimesh
+
+
+@pytest.fixture(scope="module")
+def reference_gpc_systems(icosphere, u_max):
+    group = GPCSystemGroup(icosphere)
+    group.compute(u_max=u_max, packed=True)
+    return group.object_mesh_gpc_systems
+
+
+def interrupt_after(group, n_chunks):
+    """Lets `compute` of a group raise a `KeyboardInterrupt` after the given amount of chunks"""
+    compute_gpc_system_chunks = group.compute_gpc_system_chunks
+
+    def interrupted_chunks(*args, **kwargs):
+        chunks = compute_gpc_system_chunks(*args, **kwargs)
+        try:
+            for _ in range(n_chunks):
+                yield next(chunks)
+            raise KeyboardInterrupt
+        finally:
+            chunks.close()
+
+    group.compute_gpc_system_chunks = interrupted_chunks
+
+
+def test_resume_from_checkpoints(icosphere, u_max, reference_gpc_systems, tmp_path):
+    checkpoint_dir = str(tmp_path)
+    group = GPCSystemGroup(icosphere, chunk_size=20)
+    interrupt_after(group, 3)
+    with pytest.raises(KeyboardInterrupt):
+        group.compute(u_max=u_max, checkpoint_dir=checkpoint_dir, checkpoint_interval=np.inf)
+    # Completed GPC-systems are written once the computation has been interrupted
+    assert [f for f in os.listdir(checkpoint_dir) if f.startswith("states_")] == ["states_0.pkl"]
+    # Incomplete checkpoints are ignored
+    with open(f"{checkpoint_dir}/states_1.pkl.tmp", "wb") as f:
+        f.write(b"incomplete")
+
+    resumed = GPCSystemGroup(icosphere, chunk_size=20)
+    computed_source_points = []
+    compute_gpc_system_chunks = resumed.compute_gpc_system_chunks
+
+    def recorded_chunks(source_points, *args, **kwargs):
+        computed_source_points.extend(source_points.tolist())
+        yield from compute_gpc_system_chunks(source_points, *args, **kwargs)
+
+    resumed.compute_gpc_system_chunks = recorded_chunks
+    resumed.compute(u_max=u_max, packed=True, checkpoint_dir=checkpoint_dir, checkpoint_interval=0.)
+    assert computed_source_points == list(range(60, icosphere.vertices.shape[0]))
+    for idx in range(icosphere.vertices.shape[0]):
+        np.testing.assert_array_equal(
+            resumed.object_mesh_gpc_systems[idx].radial_coordinates, reference_gpc_systems[idx].radial_coordinates
+        )
+        np.testing.assert_array_equal(
+            resumed.object_mesh_gpc_systems[idx].faces[(-1, -1)], reference_gpc_systems[idx].faces[(-1, -1)]
+        )
+
+
+def test_checkpoints_of_other_configurations_are_rejected(icosphere, u_max, tmp_path):
+    checkpoint_dir = str(tmp_path)
+    group = GPCSystemGroup(icosphere, chunk_size=20)
+    interrupt_after(group, 1)
+    with pytest.raises(KeyboardInterrupt):
+        group.compute(u_max=u_max, checkpoint_dir=checkpoint_dir)
+    with pytest.raises(RuntimeError):
+        GPCSystemGroup(icosphere).compute(u_max=u_max / 2, checkpoint_dir=checkpoint_dir)
+    with pytest.raises(RuntimeError):
+        GPCSystemGroup(icosphere, dtype=np.float32).compute(u_max=u_max, checkpoint_dir=checkpoint_dir)
+
+
+def test_checkpoints_of_other_meshes_are_rejected(icosphere, u_max, tmp_path):
+    checkpoint_dir = str(tmp_path)
+    group = GPCSystemGroup(icosphere, chunk_size=20)
+    interrupt_after(group, 1)
+    with pytest.raises(KeyboardInterrupt):
+        group.compute(u_max=u_max, checkpoint_dir=checkpoint_dir)
+    # Same amount of vertices and faces, but different vertex positions
+    moved_mesh = trimesh.Trimesh(vertices=icosphere.vertices * 1.01, faces=icosphere.faces, process=False)
+    assert GPCSystemGroup(moved_mesh).get_mesh_fingerprint() != group.get_mesh_fingerprint()
+    with pytest.raises(RuntimeError):
+        GPCSystemGroup(moved_mesh).compute(u_max=u_max, checkpoint_dir=checkpoint_dir)
@@ -0,0 +1,70 @@
+from geoconv.preprocessing.gpc_statistics import STATISTICS, GPCStatistics
+from geoconv.preprocessing.gpc_system import GPC_SYSTEM_COUNTERS
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+
+import numpy as np
+
+
+def assert_system_sizes(statistics, reference_states):
+    np.testing.assert_array_equal(statistics.source_points, [state["source_point"] for state in reference_states])
+    np.testing.assert_array_equal(
+        statistics["system_vertices"], [state["vertex_indices"].shape[0] for state in reference_states]
+    )
+    np.testing.assert_array_equal(statistics["system_faces"], [state["faces"].shape[0] for state in reference_states])
+    assert (statistics["wall_time"] >= 0).all()
+
+
+def test_statistics_of_python_propagation(icosphere, u_max, reference_states):
+    group = GPCSystemGroup(icosphere, collect_statistics=True)
+    group.compute(u_max=u_max)
+    statistics = group.statistics
+    assert len(statistics) == icosphere.vertices.shape[0]
+    assert_system_sizes(statistics, reference_states)
+
+    # Every reached vertex except for the source point has been pushed onto and popped from the heap
+    assert (statistics["heap_pushes"] >= statistics["system_vertices"] - 1).all()
+    assert (statistics["heap_pops"] <= statistics["heap_pushes"]).all()
+    assert (statistics["heap_pops"] > 0).all()
+    assert (statistics["update_calls"] >= statistics["updates_attempted"]).all()
+    assert (statistics["intersection_rejections"] <= statistics["intersection_tests"]).all()
+
+    # Collecting statistics does not change the GPC-systems
+    for gpc_system, expected in zip(group.object_mesh_gpc_systems, reference_states):
+        state = gpc_system.get_state()
+        np.testing.assert_array_equal(state["radial_coordinates"], expected["radial_coordinates"])
+        np.testing.assert_array_equal(state["faces"], expected["faces"])
+
+    source_points, values = statistics.outliers("system_vertices", n=3)
+    assert source_points.shape == (3,)
+    assert values[0] == statistics["system_vertices"].max()
+    summary = statistics.summary()
+    assert all(name in summary for name in STATISTICS)
+
+
+def test_statistics_of_c_engine(icosphere, u_max, reference_states):
+    group = GPCSystemGroup(icosphere, use_c_engine=True, collect_statistics=True)
+    group.compute(u_max=u_max)
+    # The engine only records system sizes and wall times
+    assert_system_sizes(group.statistics, reference_states)
+    for name in GPC_SYSTEM_COUNTERS:
+        assert np.isnan(group.statistics[name]).all()
+        assert f"{name}: not measured" in group.statistics.summary()
+
+
+
+def test_unmeasured_statistics_are_ignored():
+    values = {name: np.array([np.nan, 3., np.nan, 1.]) for name in STATISTICS}
+    statistics = GPCStatistics(np.array([10, 11, 12, 13]), values)
+    counts, _ = statistics.histogram("heap_pushes", bins=2)
+    assert counts.sum() == 2
+    source_points, outlier_values = statistics.outliers("heap_pushes", n=3)
+    np.testing.assert_array_equal(source_points, [11, 13])
+    np.testing.assert_array_equal(outlier_values, [3., 1.])
+    assert "heap_pushes: total=4 | mean=2" in statistics.summary()
+
+
+def test_statistics_are_opt_in(icosphere, u_max):
+    group = GPCSystemGroup(icosphere)
+    group.compute(u_max=u_max)
+    assert group.statistics is None
+    assert all("statistics" not in state for state in group.compute_gpc_system_states(np.arange(3), u_max))
@@ -0,0 +1,112 @@
+from geoconv.preprocessing.gpc_system_cache import EdgeCache, FaceCache, EdgeGrid
+
+import numpy as np
+import pytest
+
+
+def random_faces(n_vertices, n_faces, seed=0):
+    rng = np.random.default_rng(seed)
+    faces = np.sort(np.stack([rng.choice(n_vertices, size=3, replace=False) for _ in range(n_faces)]), axis=-1)
+    # Duplicates are added once
+    return np.concatenate([faces, faces[:10]])
+
+
+def test_edge_cache_equals_dictionary():
+    n_vertices = 30
+    edges = random_faces(n_vertices, 80)[:, [0, 1]]
+    edge_cache = EdgeCache(n_vertices, capacity=2)
+    expected_edges, expected_vertex_edges = [], {}
+    for edge in edges.tolist():
+        is_new = edge not in expected_edges
+        assert edge_cache.contains(edge) != is_new
+        assert edge_cache.add(edge) == is_new
+        if is_new:
+            expected_edges.append(edge)
+        for vertex in edge:
+            vertex_edges = expected_vertex_edges.setdefault(vertex, [])
+            if edge not in vertex_edges:
+                vertex_edges.append(edge)
+
+    assert len(edge_cache) == len(expected_edges)
+    np.testing.assert_array_equal(edge_cache[-1], expected_edges)
+    for vertex, vertex_edges in expected_vertex_edges.items():
+        assert vertex in edge_cache
+        assert edge_cache[vertex] == vertex_edges
+
+    # Resetting a vertex keeps its edges captured
+    vertex = edges[0, 0]
+    edge_cache.reset_vertex(vertex)
+    assert edge_cache[vertex] == [] and edge_cache.contains(edges[0].tolist())
+
+    edge_cache.clear()
+    assert len(edge_cache) == 0 and not edge_cache.contains(edges[0].tolist()) and vertex not in edge_cache
+
+
+def test_face_cache_equals_dictionary():
+    n_vertices = 30
+    faces = random_faces(n_vertices, 80)
+    face_cache = FaceCache(n_vertices, capacity=2)
+    expected_faces, expected_edge_faces = [], {}
+    for face in faces.tolist():
+        is_new = face not in expected_faces
+        assert face_cache.contains(face) != is_new
+        assert face_cache.add(face) == is_new
+        if is_new:
+            expected_faces.append(face)
+        for edge in [(face[0], face[1]), (face[1], face[2]), (face[0], face[2])]:
+            edge_faces = expected_edge_faces.setdefault(edge, [])
+            if face not in edge_faces:
+                edge_faces.append(face)
+
+    assert len(face_cache) == len(expected_faces)
+    np.testing.assert_array_equal(face_cache[(-1, -1)], expected_faces)
+    for edge, edge_faces in expected_edge_faces.items():
+        assert edge in face_cache
+        assert face_cache[edge] == edge_faces
+
+    face_cache.clear()
+    assert len(face_cache) == 0 and not face_cache.contains(faces[0].tolist()) and tuple(faces[0, :2]) not in face_cache
+
+
+def overlapping_segments(segments, x1, y1, x2, y2):
+    """Brute-force search of the segments whose bounding boxes overlap the one of the given line segment"""
+    overlap = (
+        (np.minimum(segments[:, 0], segments[:, 2]) <= max(x1, x2))
+        & (np.maximum(segments[:, 0], segments[:, 2]) >= min(x1, x2))
+        & (np.minimum(segments[:, 1], segments[:, 3]) <= max(y1, y2))
+        & (np.maximum(segments[:, 1], segments[:, 3]) >= min(y1, y2))
+    )
+    return set(map(tuple, segments[overlap].tolist()))
+
+
+def assert_grid_finds_overlapping_edges(edge_grid, edges, x_coordinates, y_coordinates, rng):
+    segments = np.stack([
+        x_coordinates[edges[:, 0]], y_coordinates[edges[:, 0]], x_coordinates[edges[:, 1]], y_coordinates[edges[:, 1]]
+    ], axis=-1)
+    # Edges with unknown coordinates are never found
+    segments = segments[np.isfinite(segments).all(axis=-1)]
+    for _ in range(200):
+        x1, y1 = rng.uniform(-1., 1., size=2)
+        x2, y2 = np.array([x1, y1]) + rng.normal(scale=.2, size=2)
+        expected = overlapping_segments(segments, x1, y1, x2, y2)
+        assert expected <= set(map(tuple, edge_grid.query(np.array([x1, y1]), np.array([x2, y2])).tolist()))
+
+
+@pytest.mark.parametrize("cell_size", [0.05, 0.3, 0., np.nan])
+def test_edge_grid_finds_overlapping_edges(cell_size):
+    rng = np.random.default_rng(0)
+    n_vertices = 60
+    x_coordinates, y_coordinates = rng.uniform(-1., 1., size=n_vertices), rng.uniform(-1., 1., size=n_vertices)
+    x_coordinates[:5], y_coordinates[:5] = np.inf, np.inf
+    edges = np.sort(np.stack([rng.choice(n_vertices, size=2, replace=False) for _ in range(150)]), axis=-1)
+    edge_grid = EdgeGrid(x_coordinates, y_coordinates, cell_size=cell_size, capacity=4)
+    for edge in edges.tolist():
+        edge_grid.add(edge)
+    assert len(edge_grid) == edges.shape[0]
+    assert_grid_finds_overlapping_edges(edge_grid, edges, x_coordinates, y_coordinates, rng)
+
+    # Moved vertices, including previously unknown ones, are re-registered
+    for vertex in rng.choice(n_vertices, size=20, replace=False).tolist() + [0, 1]:
+        x_coordinates[vertex], y_coordinates[vertex] = rng.uniform(-1., 1., size=2)
+        edge_grid.move_vertex(vertex)
+    assert_grid_finds_overlapping_edges(edge_grid, edges, x_coordinates, y_coordinates, rng)
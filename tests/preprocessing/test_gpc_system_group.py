@@ -0,0 +1,198 @@
+from geoconv.preprocessing.gpc_system import GPCSystem
+from geoconv.preprocessing import gpc_system_group
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup, GPCSystemPool
+from conftest import assert_states_equal
+
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+import pytest
+import trimesh
+
+
+def test_engine_equals_python_reference(icosphere, u_max, reference_states):
+    group = GPCSystemGroup(icosphere, use_c_engine=True)
+    source_points = np.arange(icosphere.vertices.shape[0])
+    assert_states_equal(group.compute_gpc_system_states(source_points, u_max), reference_states)
+
+    # GPC-system objects only receive the output of the engine
+    gpc_system = None
+    for source_point in source_points[::20]:
+        gpc_system = group.compute_gpc_system(int(source_point), u_max, gpc_system=gpc_system)
+        expected = GPCSystem.from_state(reference_states[source_point], icosphere)
+        np.testing.assert_array_equal(gpc_system.radial_coordinates, expected.radial_coordinates)
+        np.testing.assert_array_equal(gpc_system.x_coordinates, expected.x_coordinates)
+        np.testing.assert_array_equal(gpc_system.faces[(-1, -1)], expected.faces[(-1, -1)])
+
+
+def test_compute_uses_engine(icosphere, u_max, reference_states, monkeypatch):
+    group = GPCSystemGroup(icosphere, use_c_engine=True)
+    engine_source_points = []
+    compute_engine_state = group.compute_engine_state
+
+    def recorded_engine_state(source_point, *args):
+        engine_source_points.append(source_point)
+        return compute_engine_state(source_point, *args)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The engine does not require a GPC-system object.")
+
+    monkeypatch.setattr(group, "compute_engine_state", recorded_engine_state)
+    monkeypatch.setattr(group, "compute_gpc_system", fail)
+    monkeypatch.setattr(GPCSystem, "from_state", fail)
+    group.compute(u_max=u_max, packed=True)
+    assert engine_source_points == list(range(icosphere.vertices.shape[0]))
+    for idx, expected in enumerate(reference_states):
+        np.testing.assert_array_equal(group.object_mesh_gpc_systems[idx].vertex_indices, expected["vertex_indices"])
+        np.testing.assert_array_equal(group.object_mesh_gpc_systems[idx].faces[(-1, -1)], expected["faces"])
+
+
+def test_compute_limits_engine_states(icosphere, u_max, monkeypatch):
+    expected_group = GPCSystemGroup(icosphere, use_c_engine=True)
+    group = GPCSystemGroup(icosphere, use_c_engine=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The engine does not require a GPC-system object.")
+
+    monkeypatch.setattr(group, "compute_gpc_system", fail)
+    with pytest.warns(RuntimeWarning, match="truncated"):
+        group.compute(u_max=u_max, packed=True, max_vertices=8, max_faces=6)
+    assert group.truncation_radii
+    for idx in range(0, icosphere.vertices.shape[0], 10):
+        expected = expected_group.compute_gpc_system(idx, u_max, max_vertices=8, max_faces=6)
+        gpc_system = group.object_mesh_gpc_systems[idx]
+        assert gpc_system.vertex_indices.shape[0] <= 8 and len(gpc_system.faces[(-1, -1)]) <= 6
+        np.testing.assert_array_equal(gpc_system.vertex_indices, np.nonzero(expected.radial_coordinates != np.inf)[0])
+        np.testing.assert_array_equal(gpc_system.faces[(-1, -1)], expected.faces[(-1, -1)])
+        assert group.truncation_radii.get(idx) == expected.truncation_radius
+
+
+def test_engine_warns_about_small_u_max(icosphere):
+    group = GPCSystemGroup(icosphere, use_c_engine=True)
+    with pytest.warns(RuntimeWarning, match="initialization"):
+        group.compute_engine_state(0, 0.01)
+
+
+def test_engine_workspace_is_reset_between_gpc_systems(icosphere, u_max):
+    group = GPCSystemGroup(icosphere, use_c_engine=True)
+    workspace = group.get_engine_workspace()
+    assert group.get_engine_workspace() is workspace
+
+    # Alternate radii, such that stale entries of a larger GPC-system would leak into smaller ones
+    fresh_states = [group.compute_engine_state(source_point, radius) for source_point, radius in [(0, u_max), (5, .35)]]
+    group._engine_workspaces.workspace = None
+    for radius in [u_max, .35, u_max]:
+        group.compute_engine_state(0, radius)
+    assert_states_equal([group.compute_engine_state(0, u_max), group.compute_engine_state(5, .35)], fresh_states)
+
+
+def test_reused_gpc_systems_equal_fresh_ones(icosphere, u_max):
+    group = GPCSystemGroup(icosphere)
+    # Alternate radii, such that edges and faces of a larger GPC-system would leak into smaller ones
+    requests = [(0, u_max), (5, .35), (0, .35), (99, u_max)]
+    fresh_states = [group.compute_gpc_system(source_point, radius).get_state() for source_point, radius in requests]
+    gpc_system = None
+    for (source_point, radius), expected in zip(requests, fresh_states):
+        gpc_system = group.compute_gpc_system(source_point, radius, gpc_system=gpc_system)
+        assert_states_equal([gpc_system.get_state()], [expected])
+
+
+def test_pool_equals_python_reference(icosphere, u_max, reference_states):
+    with GPCSystemPool(2) as pool:
+        group = GPCSystemGroup(icosphere, pool=pool, chunk_size=32)
+        group.compute(u_max=u_max)
+    assert_states_equal([gpc_system.get_state() for gpc_system in group.object_mesh_gpc_systems], reference_states)
+
+
+def test_interrupted_pool_is_terminated(icosphere, u_max):
+    with GPCSystemPool(2) as pool:
+        group = GPCSystemGroup(icosphere, pool=pool, chunk_size=8)
+        chunks = group.compute_gpc_system_chunks(np.arange(icosphere.vertices.shape[0]), u_max)
+        next(chunks)
+        chunks.close()
+        assert pool.terminated
+        with pytest.raises(RuntimeError):
+            group.compute(u_max=u_max)
+
+
+@pytest.mark.parametrize("use_c_engine", [True, False])
+def test_threads_equal_python_reference(icosphere, u_max, reference_states, use_c_engine):
+    group = GPCSystemGroup(icosphere, use_c_engine=use_c_engine, backend="threads", processes=3, chunk_size=16)
+    group.compute(u_max=u_max)
+    assert_states_equal([gpc_system.get_state() for gpc_system in group.object_mesh_gpc_systems], reference_states)
+
+
+def test_threads_use_separate_engine_workspaces(icosphere):
+    group = GPCSystemGroup(icosphere, use_c_engine=True)
+    with ThreadPool(2) as threads:
+        workspaces = threads.map(lambda _: group.get_engine_workspace(), range(2), chunksize=1)
+    assert group.get_engine_workspace() not in workspaces
+
+
+def test_single_process_computes_in_process(icosphere, u_max, reference_states, monkeypatch):
+    # Starting worker processes would fail
+    monkeypatch.setattr(gpc_system_group, "GPCSystemPool", None)
+    group = GPCSystemGroup(icosphere)
+    group.compute(u_max=u_max)
+    assert_states_equal([gpc_system.get_state() for gpc_system in group.object_mesh_gpc_systems], reference_states)
+
+
+@pytest.mark.parametrize("packed", [True, False])
+def test_update_equals_full_recompute(icosphere, u_max, packed):
+    mesh = icosphere.copy()
+    group = GPCSystemGroup(mesh)
+    group.compute(u_max=u_max, packed=packed)
+    source_points = np.arange(mesh.vertices.shape[0])
+    # The second update uses the reverse index which has been updated by the first one
+    for vertex in [3, 70]:
+        candidates = np.append(group.topology.get_neighbors(vertex), vertex)
+        expected_affected = [
+            idx for idx in source_points
+            if (group.object_mesh_gpc_systems[idx].radial_coordinates[candidates] != np.inf).any()
+        ]
+        mesh.vertices[vertex] += mesh.vertex_normals[vertex] * 0.05
+        np.testing.assert_array_equal(group.update(np.array([vertex]), u_max=u_max), expected_affected)
+
+        expected = GPCSystemGroup(mesh.copy()).compute_gpc_system_states(source_points, u_max)
+        for idx in source_points:
+            gpc_system = group.object_mesh_gpc_systems[idx]
+            expected_system = GPCSystem.from_state(expected[idx], mesh)
+            np.testing.assert_array_equal(gpc_system.radial_coordinates, expected_system.radial_coordinates)
+            np.testing.assert_array_equal(gpc_system.angular_coordinates, expected_system.angular_coordinates)
+            np.testing.assert_array_equal(gpc_system.faces[(-1, -1)], expected_system.faces[(-1, -1)])
+
+
+def test_multiple_radii_deviate_at_the_border():
+    sphere = trimesh.creation.icosphere(subdivisions=3)
+    rng = np.random.default_rng(0)
+    mesh = trimesh.Trimesh(
+        vertices=sphere.vertices + rng.normal(scale=0.01, size=sphere.vertices.shape), faces=sphere.faces
+    )
+    radii = [0.3, 0.5]
+    # The engine equals the Python reference (see `test_engine_equals_python_reference`)
+    for radius, gpc_systems in zip(radii, GPCSystemGroup(mesh, use_c_engine=True).compute(u_max=radii, packed=True)):
+        direct = GPCSystemGroup(mesh, use_c_engine=True)
+        direct.compute(u_max=radius, packed=True)
+        for idx in range(mesh.vertices.shape[0]):
+            gpc_system, expected = gpc_systems[idx], direct.object_mesh_gpc_systems[idx]
+            if radius == max(radii):
+                np.testing.assert_array_equal(gpc_system.radial_coordinates, expected.radial_coordinates)
+                np.testing.assert_array_equal(gpc_system.faces[(-1, -1)], expected.faces[(-1, -1)])
+                continue
+            # At most one vertex close to the border is missing or added
+            deviating = np.setxor1d(gpc_system.vertex_indices, expected.vertex_indices)
+            assert deviating.shape[0] <= 1
+            radial_coordinates = np.minimum(gpc_system.radial_coordinates, expected.radial_coordinates)
+            assert (radial_coordinates[deviating] > 0.85 * radius).all()
+            # The coordinates of the other vertices only deviate close to the border
+            shared = np.intersect1d(gpc_system.vertex_indices, expected.vertex_indices)
+            inner = shared[radial_coordinates[shared] <= 0.85 * radius]
+            for coordinates in ["radial_coordinates", "angular_coordinates"]:
+                np.testing.assert_array_equal(
+                    getattr(gpc_system, coordinates)[inner], getattr(expected, coordinates)[inner]
+                )
+            np.testing.assert_allclose(
+                gpc_system.radial_coordinates[shared], expected.radial_coordinates[shared], atol=0.01 * radius
+            )
+            angle_differences = gpc_system.angular_coordinates[shared] - expected.angular_coordinates[shared]
+            assert (np.abs(np.angle(np.exp(1j * angle_differences))) <= 0.1).all()
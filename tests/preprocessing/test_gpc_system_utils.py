@@ -0,0 +1,88 @@
+from geoconv.preprocessing.gpc_system_utils import compute_u_ijk_and_angle, compute_u_ijk_and_angle_vectorized
+from geoconv.preprocessing.mesh_geometry import MeshGeometry
+from geoconv.utils.misc import compute_vector_angle
+
+import c_extension
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def triangles(icosphere):
+    """All corners (i, j, k) of the faces with radial and angular coordinates of a GPC-system around vertex 0"""
+    faces = icosphere.faces
+    corners = np.concatenate([faces, np.roll(faces, 1, axis=-1), np.roll(faces, 2, axis=-1)])
+    u = np.linalg.norm(icosphere.vertices - icosphere.vertices[0], axis=-1)
+    theta = np.random.default_rng(1).uniform(0., 2 * np.pi, size=u.shape[0])
+    return corners[:, 0], corners[:, 1], corners[:, 2], u, theta
+
+
+@pytest.mark.parametrize("use_c", [True, False])
+def test_cached_updates_equal_updates_from_vertices(icosphere, triangles, use_c):
+    vertices_i, vertices_j, vertices_k, u, theta = triangles
+    mesh_geometry = MeshGeometry(icosphere)
+    rotation_axis = icosphere.vertex_normals[0]
+
+    # BLAS-kernels may round differently depending on the memory alignment of the cached and the computed edges
+    expected = compute_u_ijk_and_angle(vertices_i, vertices_j, vertices_k, u, theta, icosphere, use_c, rotation_axis)
+    batched = compute_u_ijk_and_angle(vertices_i, vertices_j, vertices_k, u, theta, mesh_geometry, use_c, rotation_axis)
+    np.testing.assert_allclose(batched[0], expected[0], rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(batched[1], expected[1], rtol=1e-9, atol=1e-12)
+
+    for row in range(0, vertices_i.shape[0], 17):
+        triangle = int(vertices_i[row]), int(vertices_j[row]), int(vertices_k[row])
+        np.testing.assert_allclose(
+            compute_u_ijk_and_angle(*triangle, u, theta, mesh_geometry, use_c, rotation_axis),
+            compute_u_ijk_and_angle(*triangle, u, theta, icosphere, use_c, rotation_axis),
+            rtol=1e-9,
+            atol=1e-12
+        )
+
+
+def test_vectorized_updates_equal_scalar_updates(icosphere, triangles):
+    vertices_i, vertices_j, vertices_k, u, theta = triangles
+    vectors = icosphere.vertices
+    u_ijk, theta_i = compute_u_ijk_and_angle_vectorized(
+        vectors[vertices_i],
+        vectors[vertices_j],
+        vectors[vertices_k],
+        u[vertices_j],
+        u[vertices_k],
+        theta[vertices_j],
+        theta[vertices_k],
+        edges=MeshGeometry(icosphere).get_edge_vectors(vertices_i, vertices_j, vertices_k)
+    )
+    for row in range(0, vertices_i.shape[0], 17):
+        expected = compute_u_ijk_and_angle(
+            vertices_i[row], vertices_j[row], vertices_k[row], u, theta, icosphere, False, None
+        )
+        np.testing.assert_allclose([u_ijk[row], theta_i[row]], expected, rtol=1e-9, atol=1e-12)
+
+
+def test_batched_c_updates_equal_scalar_c_updates(icosphere, triangles):
+    vertices_i, vertices_j, vertices_k, u, theta = triangles
+    rotation_axis = icosphere.vertex_normals[0]
+    u_ijk, theta_i = compute_u_ijk_and_angle(
+        vertices_i, vertices_j, vertices_k, u, theta, icosphere, True, rotation_axis
+    )
+    numpy_u_ijk, numpy_theta_i = compute_u_ijk_and_angle(
+        vertices_i, vertices_j, vertices_k, u, theta, icosphere, False, rotation_axis
+    )
+    np.testing.assert_allclose(numpy_u_ijk, u_ijk, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(numpy_theta_i, theta_i, rtol=1e-9, atol=1e-12)
+    for row in range(0, vertices_i.shape[0], 17):
+        triangle = int(vertices_i[row]), int(vertices_j[row]), int(vertices_k[row])
+        expected = (u_ijk[row], theta_i[row])
+        assert compute_u_ijk_and_angle(*triangle, u, theta, icosphere, True, rotation_axis) == expected
+
+
+def test_batched_angles_equal_scalar_angles(icosphere):
+    vectors_a = icosphere.vertices[icosphere.faces[:, 1]] - icosphere.vertices[icosphere.faces[:, 0]]
+    vectors_b = icosphere.vertices[icosphere.faces[:, 2]] - icosphere.vertices[icosphere.faces[:, 0]]
+    rotation_axis = icosphere.vertex_normals[0]
+    angles = np.empty(vectors_a.shape[0])
+    c_extension.compute_angle_360_batch(angles, vectors_a, vectors_b, rotation_axis)
+    np.testing.assert_allclose(compute_vector_angle(vectors_a, vectors_b, rotation_axis), angles, rtol=1e-9)
+    for row in range(0, vectors_a.shape[0], 17):
+        assert c_extension.compute_angle_360(vectors_a[row], vectors_b[row], rotation_axis) == angles[row]
+        np.testing.assert_allclose(compute_vector_angle(vectors_a[row], vectors_b[row], rotation_axis), angles[row])
@@ -0,0 +1,46 @@
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+from geoconv.preprocessing.heat_method import HeatMethod
+
+import numpy as np
+
+
+def test_heat_method_approximates_python_reference(icosphere, u_max, reference_states):
+    group = GPCSystemGroup(icosphere, backend="heat", chunk_size=64)
+    group.compute(u_max=u_max)
+    radial_errors, angular_errors = [], []
+    for gpc_system, expected in zip(group.object_mesh_gpc_systems, reference_states):
+        state = gpc_system.get_state()
+        assert state["source_point"] == expected["source_point"]
+        # Approximated radial coordinates may move vertices close to `u_max` in or out of the GPC-system
+        common, positions, expected_positions = np.intersect1d(
+            state["vertex_indices"], expected["vertex_indices"], return_indices=True
+        )
+        assert common.shape[0] >= 0.9 * expected["vertex_indices"].shape[0]
+        radial_errors.append(
+            state["radial_coordinates"][positions] - expected["radial_coordinates"][expected_positions]
+        )
+        # Angles of the source point are meaningless
+        within = expected["radial_coordinates"][expected_positions] > 0
+        angular_errors.append(np.angle(np.exp(1j * (
+            state["angular_coordinates"][positions][within]
+            - expected["angular_coordinates"][expected_positions][within]
+        ))))
+
+    radial_errors, angular_errors = np.abs(np.concatenate(radial_errors)), np.abs(np.concatenate(angular_errors))
+    assert radial_errors.max() < 0.1 * u_max
+    assert angular_errors.mean() < 0.1
+    assert angular_errors.max() < 0.3
+
+
+def test_heat_method_states_are_consistent(icosphere, u_max):
+    source_points = np.array([0, 17, 161])
+    states = HeatMethod(icosphere).compute_gpc_system_states(source_points, u_max)
+    for source_point, state in zip(source_points, states):
+        assert state["source_point"] == source_point
+        # All faces are within `u_max` and their vertices are exactly the captured vertices
+        np.testing.assert_array_equal(state["vertex_indices"], np.unique(state["faces"]))
+        assert state["radial_coordinates"].max() < u_max
+        np.testing.assert_allclose(
+            state["x_coordinates"], state["radial_coordinates"] * np.cos(state["angular_coordinates"])
+        )
+        assert state["radial_coordinates"][state["vertex_indices"] == source_point] == 0.
@@ -0,0 +1,65 @@
+from geoconv.preprocessing.indexed_heap import IndexedMinHeap
+
+import heapq
+import numpy as np
+
+
+def pop_all(heap):
+    entries = []
+    while heap:
+        entries.append(heap.pop())
+    return entries
+
+
+def test_pop_order_equals_heapq():
+    rng = np.random.default_rng(0)
+    # Rounded keys cause ties, which are broken by the items
+    entries = [(float(key), item) for item, key in enumerate(np.round(rng.uniform(size=200), 1))]
+    heap = IndexedMinHeap(entries[:100])
+    for key, item in entries[100:]:
+        assert not heap.push(key, item)
+    assert len(heap) == len(entries)
+
+    expected = list(entries)
+    heapq.heapify(expected)
+    assert pop_all(heap) == [heapq.heappop(expected) for _ in range(len(entries))]
+    assert len(heap) == 0 and not heap
+
+
+def test_decrease_key_equals_heapq_with_outdated_entries():
+    rng = np.random.default_rng(1)
+    heap, expected, keys = IndexedMinHeap(), [], {}
+    for item in rng.integers(0, 50, size=500).tolist():
+        key = float(rng.uniform())
+        # Each item is stored once, keys are only decreased
+        assert heap.push(key, item) == (item in keys)
+        keys[item] = min(key, keys.get(item, np.inf))
+        heapq.heappush(expected, (key, item))
+    assert len(heap) == len(keys)
+
+    # The reference skips outdated entries, the indexed heap never stores them
+    expected_entries = []
+    while expected:
+        key, item = heapq.heappop(expected)
+        if keys.pop(item, None) == key:
+            expected_entries.append((key, item))
+    assert pop_all(heap) == expected_entries
+
+
+def test_larger_keys_are_ignored():
+    heap = IndexedMinHeap([(1., 0), (2., 1)])
+    assert heap.push(3., 0)
+    assert heap.push(.5, 1)
+    assert pop_all(heap) == [(.5, 1), (1., 0)]
+
+
+def test_membership_after_pop():
+    heap = IndexedMinHeap([(2., 7), (1., 3), (3., 5)])
+    assert all(item in heap for item in [3, 5, 7])
+    assert heap.pop() == (1., 3)
+    assert 3 not in heap and 7 in heap and 5 in heap
+    # Popped items can be queued again
+    assert not heap.push(4., 3)
+    assert 3 in heap
+    assert pop_all(heap) == [(2., 7), (3., 5), (4., 3)]
+    assert 7 not in heap
@@ -0,0 +1,121 @@
+from geoconv.preprocessing.barycentric_coordinates import compute_barycentric_coordinates
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+
+import numpy as np
+import pytest
+import trimesh
+
+
+TEMPLATE = {"n_radial": 2, "n_angular": 4, "template_radius": 0.3}
+
+
+@pytest.fixture(scope="module")
+def eager_group(icosphere, u_max):
+    """Eagerly computed, packed GPC-systems"""
+    group = GPCSystemGroup(icosphere)
+    group.compute(u_max=u_max, packed=True)
+    return group
+
+
+def assert_gpc_systems_equal(gpc_system, expected):
+    np.testing.assert_array_equal(gpc_system.vertex_indices, expected.vertex_indices)
+    np.testing.assert_array_equal(gpc_system.radial_coordinates, expected.radial_coordinates)
+    np.testing.assert_array_equal(gpc_system.angular_coordinates, expected.angular_coordinates)
+    np.testing.assert_array_equal(gpc_system.faces[(-1, -1)], expected.faces[(-1, -1)])
+
+
+def test_lazy_equals_eager(icosphere, u_max, eager_group):
+    lazy_gpc_systems = GPCSystemGroup(icosphere).compute_lazy(u_max=u_max)
+    for idx in [0, 17, 161, -1, -162]:
+        assert_gpc_systems_equal(lazy_gpc_systems[idx], eager_group.object_mesh_gpc_systems[idx])
+    with pytest.raises(IndexError):
+        lazy_gpc_systems[icosphere.vertices.shape[0]]
+    with pytest.raises(IndexError):
+        lazy_gpc_systems[-icosphere.vertices.shape[0] - 1]
+
+
+def test_spilled_entries_are_not_recomputed(icosphere, u_max, eager_group, tmp_path):
+    group = GPCSystemGroup(icosphere)
+    lazy_gpc_systems = group.compute_lazy(u_max=u_max, max_bytes=1, spill_dir=str(tmp_path))
+    indices = [3, 40, 99]
+    for idx in indices:
+        lazy_gpc_systems[idx]
+    # Only the most recently used entry is kept in memory
+    assert list(lazy_gpc_systems.cache) == [99]
+    assert sorted(path.name for path in tmp_path.glob("*.npz")) == [f"gpc_system_{idx}.npz" for idx in [3, 40]]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Spilled GPC-systems must not be computed again.")
+
+    group.compute_gpc_system = fail
+    for idx in indices:
+        assert_gpc_systems_equal(lazy_gpc_systems[idx], eager_group.object_mesh_gpc_systems[idx])
+
+
+def test_lazy_barycentric_coordinates_equal_eager(icosphere, u_max, eager_group):
+    lazy_gpc_systems = GPCSystemGroup(icosphere).compute_lazy(u_max=u_max, **TEMPLATE)
+    indices = np.array([0, 17, 161])
+    expected = compute_barycentric_coordinates(
+        eager_group,
+        n_radial=TEMPLATE["n_radial"],
+        n_angular=TEMPLATE["n_angular"],
+        radius=TEMPLATE["template_radius"],
+        gpc_system_indices=indices
+    )
+    for idx, expected_coordinates in zip(indices, expected):
+        np.testing.assert_array_equal(lazy_gpc_systems.get_barycentric_coordinates(idx), expected_coordinates)
+    # Barycentric coordinates which have been computed once stay cached
+    assert lazy_gpc_systems.get_barycentric_coordinates(0) is lazy_gpc_systems.get_barycentric_coordinates(0)
+
+
+def test_lazy_barycentric_coordinates_require_template(icosphere, u_max):
+    with pytest.raises(RuntimeError):
+        GPCSystemGroup(icosphere).compute_lazy(u_max=u_max).get_barycentric_coordinates(0)
+
+
+def test_spill_dir_of_other_configurations_is_rejected(icosphere, u_max, tmp_path):
+    spill_dir = str(tmp_path)
+    lazy_gpc_systems = GPCSystemGroup(icosphere).compute_lazy(u_max=u_max, max_bytes=1, spill_dir=spill_dir)
+    for idx in [3, 40]:
+        lazy_gpc_systems[idx]
+
+    # The same mesh and configuration re-use the spilled GPC-systems
+    group = GPCSystemGroup(icosphere)
+    assert group.compute_lazy(u_max=u_max, max_bytes=1, spill_dir=spill_dir).spilled == {3}
+    with pytest.raises(RuntimeError):
+        group.compute_lazy(u_max=u_max / 2, spill_dir=spill_dir)
+    with pytest.raises(RuntimeError):
+        group.compute_lazy(u_max=u_max, spill_dir=spill_dir, **TEMPLATE)
+    moved_mesh = trimesh.Trimesh(vertices=icosphere.vertices * 1.01, faces=icosphere.faces, process=False)
+    with pytest.raises(RuntimeError):
+        GPCSystemGroup(moved_mesh).compute_lazy(u_max=u_max, spill_dir=spill_dir)
+
+
+def test_update_discards_affected_lazy_gpc_systems(icosphere, u_max, tmp_path):
+    mesh = icosphere.copy()
+    group = GPCSystemGroup(mesh)
+    lazy_gpc_systems = group.compute_lazy(u_max=u_max, max_bytes=5_000, spill_dir=str(tmp_path))
+    computed = np.arange(0, mesh.vertices.shape[0], 4)
+    for idx in computed:
+        lazy_gpc_systems[idx]
+    assert lazy_gpc_systems.spilled and len(lazy_gpc_systems.cache) > 1
+
+    vertex = 3
+    candidates = np.append(group.topology.get_neighbors(vertex), vertex)
+    expected_affected = [
+        idx for idx in computed if (lazy_gpc_systems[idx].radial_coordinates[candidates] != np.inf).any()
+    ]
+    mesh.vertices[vertex] += mesh.vertex_normals[vertex] * 0.05
+    affected = group.update(np.array([vertex]), u_max=u_max)
+    assert expected_affected
+    np.testing.assert_array_equal(affected, expected_affected)
+    for idx in affected:
+        assert idx not in lazy_gpc_systems.cache and idx not in lazy_gpc_systems.spilled
+        assert not (tmp_path / f"gpc_system_{idx}.npz").exists()
+
+    expected = GPCSystemGroup(mesh.copy())
+    expected.compute(u_max=u_max, packed=True)
+    for idx in range(mesh.vertices.shape[0]):
+        assert_gpc_systems_equal(lazy_gpc_systems[idx], expected.object_mesh_gpc_systems[idx])
+    # The spill directory belongs to the moved mesh
+    GPCSystemGroup(mesh.copy()).compute_lazy(u_max=u_max, spill_dir=str(tmp_path))
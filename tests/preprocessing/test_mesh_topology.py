@@ -0,0 +1,38 @@
+from geoconv.preprocessing.mesh_topology import MeshTopology
+from geoconv.utils.misc import get_faces_of_edge, get_neighbors
+
+import numpy as np
+
+
+def test_topology_equals_trimesh_lookups(icosphere):
+    topology = MeshTopology(icosphere.faces, icosphere.vertices.shape[0])
+    for vertex in range(icosphere.vertices.shape[0]):
+        # The neighbor order determines the order of updates and thereby the GPC-systems
+        assert topology.get_neighbors(vertex) == get_neighbors(vertex, icosphere)
+        for neighbor in topology.get_neighbors(vertex):
+            assert topology.adjacency_indices[topology.get_slot(vertex, neighbor)] == neighbor
+            edge, faces = topology.get_faces_of_edge(np.array([neighbor, vertex]))
+            expected_edge, expected_faces = get_faces_of_edge(np.array([neighbor, vertex]), icosphere)
+            np.testing.assert_array_equal(edge, expected_edge)
+            np.testing.assert_array_equal(faces, expected_faces)
+
+    vertices_a = np.repeat(np.arange(icosphere.vertices.shape[0]), np.diff(topology.adjacency_indptr))
+    np.testing.assert_array_equal(
+        topology.find_slots(vertices_a, topology.adjacency_indices), np.arange(topology.adjacency_indices.shape[0])
+    )
+
+
+def test_unconnected_vertices(icosphere):
+    topology = MeshTopology(icosphere.faces, icosphere.vertices.shape[0])
+    vertex = 0
+    unconnected = next(v for v in range(1, icosphere.vertices.shape[0]) if v not in topology.get_neighbors(vertex))
+    assert topology.get_edge_index(vertex, unconnected) == -1
+    assert topology.get_faces_of_edge(np.array([vertex, unconnected]))[1].shape == (0, 3)
+    assert topology.find_slots(np.array([vertex]), np.array([unconnected]))[0] == -1
+
+
+def test_topology_matches_faces(icosphere):
+    topology = MeshTopology(icosphere.faces, icosphere.vertices.shape[0])
+    assert topology.matches(icosphere.faces, icosphere.vertices.shape[0])
+    assert not topology.matches(icosphere.faces, icosphere.vertices.shape[0] + 1)
+    assert not topology.matches(icosphere.faces[::-1])
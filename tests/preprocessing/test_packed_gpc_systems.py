@@ -0,0 +1,55 @@
+from geoconv.preprocessing.gpc_system import GPCSystem
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+from geoconv.preprocessing.packed_gpc_systems import PackedGPCSystems
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def states(icosphere, u_max):
+    return GPCSystemGroup(icosphere).compute_gpc_system_states(np.arange(icosphere.vertices.shape[0]), u_max)
+
+
+def assert_gpc_systems_equal(packed_gpc_system, gpc_system):
+    assert packed_gpc_system.source_point == gpc_system.source_point
+    for key in ["radial_coordinates", "angular_coordinates", "x_coordinates", "y_coordinates"]:
+        np.testing.assert_array_equal(getattr(packed_gpc_system, key), getattr(gpc_system, key))
+    np.testing.assert_array_equal(packed_gpc_system.faces[(-1, -1)], gpc_system.faces[(-1, -1)])
+    np.testing.assert_array_equal(
+        packed_gpc_system.get_gpc_triangles(in_cart=True), gpc_system.get_gpc_triangles(in_cart=True)
+    )
+
+
+def test_packed_gpc_systems_equal_gpc_systems(icosphere, states):
+    packed = PackedGPCSystems.from_states(states, icosphere.vertices.shape[0])
+    assert len(packed) == len(states)
+    for packed_gpc_system, state in zip(packed, states):
+        assert_gpc_systems_equal(packed_gpc_system, GPCSystem.from_state(state, icosphere))
+
+
+def test_negative_indices(icosphere, states):
+    packed = PackedGPCSystems.from_states(states, icosphere.vertices.shape[0])
+    assert packed[-1].source_point == states[-1]["source_point"]
+    np.testing.assert_array_equal(packed[-2].vertex_indices, states[-2]["vertex_indices"])
+    for idx in [len(states), -len(states) - 1]:
+        with pytest.raises(IndexError):
+            packed[idx]
+
+
+@pytest.mark.parametrize("mmap_mode", ["r", None])
+def test_saved_gpc_systems_equal_gpc_systems(icosphere, states, tmp_path, mmap_mode):
+    PackedGPCSystems.from_states(states, icosphere.vertices.shape[0]).save(str(tmp_path))
+    loaded = PackedGPCSystems.load(str(tmp_path), mmap_mode=mmap_mode)
+    assert isinstance(loaded.radial_coordinates, np.memmap) == (mmap_mode is not None)
+    for packed_gpc_system, state in zip(loaded, states):
+        assert_gpc_systems_equal(packed_gpc_system, GPCSystem.from_state(state, icosphere))
+
+
+def test_replace(icosphere, states, u_max):
+    packed = PackedGPCSystems.from_states(states, icosphere.vertices.shape[0])
+    smaller_states = GPCSystemGroup(icosphere).compute_gpc_system_states(np.array([3, 40]), u_max * .8)
+    replaced = packed.replace(smaller_states)
+    for idx, state in enumerate(states):
+        expected = {3: smaller_states[0], 40: smaller_states[1]}.get(idx, state)
+        assert_gpc_systems_equal(replaced[idx], GPCSystem.from_state(expected, icosphere))
@@ -0,0 +1,35 @@
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+from geoconv.preprocessing.vectorized_gpc_systems import VectorizedGPCSystems
+
+import numpy as np
+import warnings
+
+
+def face_set(faces):
+    return set(map(tuple, np.sort(faces, axis=-1).tolist()))
+
+
+def test_vectorized_equals_python_reference(icosphere, u_max, reference_states):
+    group = GPCSystemGroup(icosphere, backend="vectorized", chunk_size=64)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        group.compute(u_max=u_max)
+    for gpc_system, expected in zip(group.object_mesh_gpc_systems, reference_states):
+        state = gpc_system.get_state()
+        assert state["source_point"] == expected["source_point"]
+        np.testing.assert_array_equal(state["vertex_indices"], expected["vertex_indices"])
+        # Updates are evaluated in a different order, which only changes rounding errors
+        np.testing.assert_allclose(state["radial_coordinates"], expected["radial_coordinates"], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(state["angular_coordinates"], expected["angular_coordinates"], rtol=0, atol=1e-6)
+        # Faces are captured in a different order
+        assert face_set(state["faces"]) == face_set(expected["faces"])
+        assert state["cell_size"] == expected["cell_size"]
+
+
+def test_vectorized_is_independent_of_batch(icosphere, u_max):
+    engine = VectorizedGPCSystems(icosphere)
+    batch_states = engine.compute_gpc_system_states(np.array([161, 0, 17]), u_max)
+    for state in batch_states:
+        single_state, = engine.compute_gpc_system_states(np.array([state["source_point"]]), u_max)
+        for key in ["vertex_indices", "radial_coordinates", "angular_coordinates", "faces"]:
+            np.testing.assert_array_equal(state[key], single_state[key])
@@ -0,0 +1,64 @@
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup, get_warm_start_faces
+
+import numpy as np
+import pytest
+import trimesh
+
+
+@pytest.fixture(scope="module")
+def previous_frame(icosphere, u_max):
+    group = GPCSystemGroup(icosphere)
+    group.compute(u_max=u_max)
+    return group.object_mesh_gpc_systems
+
+
+def next_frame(icosphere, scale):
+    rng = np.random.default_rng(1)
+    vertices = icosphere.vertices * scale + rng.normal(scale=0.002, size=icosphere.vertices.shape)
+    return trimesh.Trimesh(vertices=vertices, faces=icosphere.faces, process=False)
+
+
+def test_warm_start_approximates_cold_start(icosphere, u_max, previous_frame):
+    mesh = next_frame(icosphere, 1.)
+    cold, warm = GPCSystemGroup(mesh), GPCSystemGroup(mesh)
+    cold.compute(u_max=u_max, packed=True)
+    # Only GPC-systems whose faces cannot be replayed are propagated
+    propagated_source_points = []
+    compute_gpc_system = warm.compute_gpc_system
+
+    def recorded_gpc_system(source_point, *args, **kwargs):
+        propagated_source_points.append(source_point)
+        return compute_gpc_system(source_point, *args, **kwargs)
+
+    warm.compute_gpc_system = recorded_gpc_system
+    warm.compute(u_max=u_max, packed=True, warm_start=previous_frame)
+
+    n_replayed = 0
+    for source_point in range(mesh.vertices.shape[0]):
+        cold_system = cold.object_mesh_gpc_systems[source_point]
+        warm_system = warm.object_mesh_gpc_systems[source_point]
+        warm_start_faces = get_warm_start_faces(previous_frame[source_point])
+        replayed = warm.replay_faces(source_point, *warm_start_faces, u_max) is not None
+        assert replayed != (source_point in propagated_source_points)
+        n_replayed += replayed
+        reached = np.intersect1d(cold_system.vertex_indices, warm_system.vertex_indices)
+        assert reached.shape[0] >= cold_system.vertex_indices.shape[0] - 1
+        # Warm-started GPC-systems are approximations (see `GPCSystemGroup.replay_faces`)
+        np.testing.assert_allclose(
+            warm_system.radial_coordinates[reached], cold_system.radial_coordinates[reached], atol=0.05 * u_max
+        )
+    assert n_replayed > mesh.vertices.shape[0] // 2
+
+
+def test_grown_gpc_systems_are_computed_from_scratch(icosphere, u_max, previous_frame):
+    # Shrinking the mesh moves further vertices within 'u_max'
+    mesh = next_frame(icosphere, .8)
+    cold, warm = GPCSystemGroup(mesh), GPCSystemGroup(mesh)
+    cold.compute(u_max=u_max, packed=True)
+    warm.compute(u_max=u_max, packed=True, warm_start=previous_frame)
+    for source_point in range(mesh.vertices.shape[0]):
+        assert warm.replay_faces(source_point, *get_warm_start_faces(previous_frame[source_point]), u_max) is None
+        np.testing.assert_array_equal(
+            warm.object_mesh_gpc_systems[source_point].radial_coordinates,
+            cold.object_mesh_gpc_systems[source_point].radial_coordinates
+        )